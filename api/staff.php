@@ -38,6 +38,9 @@ if ($method === 'GET') {
 if ($method === 'POST') {
   require_auth_if_set();
   $input = json_decode(file_get_contents('php://input'), true) ?: ['staff'=>[]];
+  // "mirror" (default) replaces the whole table; "upsert" only touches the posted records
+  // (and deletes the ids in "delete"), which lets staff_sync.py push changed records in batches.
+  $mode = ($input['mode'] ?? 'mirror') === 'upsert' ? 'upsert' : 'mirror';
   $ids = [];
 
   $pdo->beginTransaction();
@@ -66,7 +69,14 @@ if ($method === 'POST') {
       ]);
     }
 
-    if (!empty($ids)) {
+    if ($mode === 'upsert') {
+      // Records not in this batch are left untouched, except the ids listed in "delete".
+      $deleted = array_values(array_filter((array)($input['delete'] ?? []), 'is_string'));
+      if (!empty($deleted)) {
+        $in = implode(',', array_fill(0, count($deleted), '?'));
+        $pdo->prepare("DELETE FROM staff WHERE id IN ($in)")->execute($deleted);
+      }
+    } elseif (!empty($ids)) {
       $in = implode(',', array_fill(0, count($ids), '?'));
       $pdo->prepare("DELETE FROM staff WHERE id NOT IN ($in)")->execute($ids);
     } else {
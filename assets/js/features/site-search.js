@@ -139,12 +139,14 @@
     const title = norm(item.title);
     const desc = norm(item.description);
     const url = norm(item.url);
+    const keywords = norm(item.keywords);
 
     let s = 0;
     for (const t of terms) {
       if (title.includes(t)) s += 6;
       if (url.includes(t)) s += 3;
       if (desc.includes(t)) s += 2;
+      if (keywords.includes(t)) s += 1;
       // starts-with bonus
       if (title.startsWith(t)) s += 2;
     }
@@ -0,0 +1,164 @@
+/**
+ * People First Urgent Care - Staff Feed Loader
+ * Lazy-loads the remaining staff cards from the chunked JSON feed
+ * written by staff_page_manager.py --generate --lazy.
+ * Version: 1.0.0
+ */
+
+(function() {
+    'use strict';
+
+    const PLACEHOLDER_IMAGE = 'assets/images/healthcare-team-professional.jpg';
+    // Same as CARD_BIO_LIMIT in staff_manager/config.py; full bios are on the member pages.
+    const CARD_BIO_LIMIT = 160;
+
+    document.addEventListener('DOMContentLoaded', function() {
+        const grids = document.querySelectorAll('[data-staff-feed]');
+        if (!grids.length) {
+            return;
+        }
+        const manifestUrl = grids[0].getAttribute('data-feed-manifest');
+        fetch(manifestUrl)
+            .then(response => response.json())
+            .then(manifest => {
+                const baseUrl = manifestUrl.slice(0, manifestUrl.lastIndexOf('/') + 1);
+                grids.forEach(grid => initFeedGrid(grid, manifest, baseUrl));
+            })
+            .catch(error => console.warn('Staff feed unavailable:', error));
+    });
+
+    /**
+     * Append one chunk per intersection of the sentinel placed after the grid.
+     * The first chunk is already rendered statically.
+     */
+    function initFeedGrid(grid, manifest, baseUrl) {
+        const category = grid.getAttribute('data-staff-feed');
+        const feed = manifest.categories[category];
+        if (!feed || feed.chunks.length < 2) {
+            return;
+        }
+        const pending = feed.chunks.slice(1);
+        const sentinel = document.createElement('div');
+        sentinel.className = 'staff-feed-sentinel';
+        sentinel.setAttribute('aria-hidden', 'true');
+        grid.after(sentinel);
+
+        let loading = false;
+        function loadNext() {
+            if (loading || !pending.length) {
+                return;
+            }
+            loading = true;
+            fetch(baseUrl + pending.shift())
+                .then(response => response.json())
+                .then(members => {
+                    grid.insertAdjacentHTML('beforeend', members.map(renderCard).join(''));
+                    loading = false;
+                    if (!pending.length) {
+                        observer.disconnect();
+                        sentinel.remove();
+                    }
+                })
+                .catch(error => {
+                    loading = false;
+                    console.warn('Could not load staff chunk:', error);
+                });
+        }
+
+        const observer = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                loadNext();
+            }
+        }, { rootMargin: '600px 0px' });
+        observer.observe(sentinel);
+    }
+
+    function escapeHtml(value) {
+        return String(value == null ? '' : value)
+            .replace(/&/g, '&amp;')
+            .replace(/</g, '&lt;')
+            .replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;')
+            .replace(/'/g, '&#39;');
+    }
+
+    /**
+     * Mirrors staff_manager.utils.shorten: cut at a word boundary and add an ellipsis.
+     */
+    function shorten(text, limit) {
+        text = String(text).split(/\s+/).filter(Boolean).join(' ');
+        if (text.length <= limit) {
+            return text;
+        }
+        const cut = text.slice(0, limit);
+        const space = cut.lastIndexOf(' ');
+        return (space >= 0 ? cut.slice(0, space) : cut).replace(/[,.;:]+$/, '') + '\u2026';
+    }
+
+    /**
+     * Mirrors HTMLRenderer._render_staff_card so lazy cards match the static ones.
+     */
+    function renderCard(member) {
+        const name = escapeHtml(member.name);
+        const contact = [];
+        if (member.linkedin) {
+            contact.push(`<a href="${escapeHtml(member.linkedin)}" class="social-link hover-scale" aria-label="LinkedIn profile for ${name}"><i class="fa-brands fa-linkedin-in"></i></a>`);
+        }
+        if (member.email) {
+            contact.push(`<a href="mailto:${escapeHtml(member.email)}" class="social-link hover-scale" aria-label="Email ${name}"><i class="fa-solid fa-envelope"></i></a>`);
+        }
+        if (member.phone) {
+            const tel = String(member.phone).replace(/[^\d+]/g, '');
+            contact.push(`<a href="tel:${tel}" class="social-link hover-scale" aria-label="Call ${name}"><i class="fa-solid fa-phone"></i></a>`);
+        }
+        const contactHtml = contact.length
+            ? `<div class="staff-social" role="group" aria-label="Contact links">${contact.join('')}</div>`
+            : '';
+
+        const credentials = (member.credentials || [])
+            .map(cred => `<span class="credential"><i class="fa-solid fa-certificate"></i> ${escapeHtml(cred)}</span>`)
+            .join('');
+        const specialties = (member.specialties || [])
+            .map(spec => `<span class="specialty-tag">${escapeHtml(spec)}</span>`)
+            .join('');
+        const tags = (member.tags || [])
+            .map(tag => `<span class="staff-tag">${escapeHtml(tag)}</span>`)
+            .join('');
+        let bio = (member.description || '').trim();
+        if (bio.length > CARD_BIO_LIMIT) {
+            bio = shorten(bio, CARD_BIO_LIMIT);
+        }
+
+        const info = [];
+        if (member.experience_years !== null && member.experience_years !== undefined) {
+            info.push(`<span class="experience-badge">${escapeHtml(member.experience_years)}+ years experience</span>`);
+        }
+        if (member.education) {
+            info.push(`<p class="staff-education"><i class="fa-solid fa-graduation-cap"></i> ${escapeHtml(member.education)}</p>`);
+        }
+        if (member.locations && member.locations.length) {
+            info.push(`<p class="staff-locations"><i class="fa-solid fa-location-dot"></i> ${escapeHtml(member.locations.join(', '))}</p>`);
+        }
+        if (member.languages && member.languages.length) {
+            info.push(`<p class="staff-languages"><i class="fa-solid fa-language"></i> ${escapeHtml(member.languages.join(', '))}</p>`);
+        }
+
+        return `<article class="staff-card hover-lift shadow-soft" role="listitem" data-staff-id="${escapeHtml(member.id)}">
+    <div class="staff-image image-zoom-container">
+        <img src="${escapeHtml(member.image || PLACEHOLDER_IMAGE)}" alt="Portrait of ${name}" loading="lazy" class="image-zoom">
+        ${contactHtml}
+    </div>
+    <div class="staff-info">
+        ${member.featured ? '<span class="staff-specialty-badge">Featured Provider</span>' : ''}
+        <h3 class="staff-name">${name}</h3>
+        <p class="staff-title"><i class="fa-solid fa-user-md"></i> ${escapeHtml(member.title)}</p>
+        ${credentials ? `<div class="staff-credentials">${credentials}</div>` : ''}
+        ${info.join('')}
+        ${bio ? `<p class="staff-bio">${escapeHtml(bio)}</p>` : ''}
+        ${specialties ? `<div class="staff-specialties" aria-label="Specialties">${specialties}</div>` : ''}
+        ${tags ? `<div class="staff-tags" aria-label="Highlights">${tags}</div>` : ''}
+        <a href="our-staff/${encodeURIComponent(member.id)}.html" class="staff-profile-link" aria-label="Full profile for ${name}">View full profile</a>
+    </div>
+</article>`;
+    }
+})();
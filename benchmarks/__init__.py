@@ -0,0 +1,7 @@
+"""
+Benchmarks for staff_page_manager.py and the scripts/ batch transforms.
+
+Run from the project root with:
+    python3 -m benchmarks.run
+    python3 -m benchmarks.run --sizes 100 10000 --compare bench_results/baseline.json
+"""
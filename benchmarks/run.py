@@ -0,0 +1,262 @@
+"""
+Time the staff directory, rendering, page-writing and scripts/ transform hot paths.
+
+Each case runs against a synthetic directory in a scratch copy of the site so
+nothing under the project root is touched. Timings are taken without
+tracemalloc; one extra run per case records peak traced memory. Results are
+written as JSON and can be compared against an earlier run:
+
+    python3 -m benchmarks.run --sizes 100 10000 --output bench_results/baseline.json
+    python3 -m benchmarks.run --sizes 100 10000 --compare bench_results/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import datetime as _dt
+import importlib.util
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.synthetic import legacy_page, make_member, write_directory
+from staff_manager import HTMLRenderer, Site, load, serialization
+from staff_manager.build import write_staff_page
+from staff_manager.fileio import atomic_open
+from staff_manager.minify import minify_html
+from staff_manager.utils import iso_now
+
+SOURCE_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = (100, 10_000, 100_000)
+DEFAULT_THRESHOLD = 0.15
+RESULTS_DIR = SOURCE_ROOT / "bench_results"
+RESULTS_VERSION = 1
+
+TRANSFORM_SCRIPTS = {
+    "modern_navigation": "scripts/apply-modern-navigation.py",
+    "header_fix": "scripts/implementation/batch-header-fix.py",
+    "css_duplications": "scripts/implementation/fix-css-duplications.py",
+    "single_pass": "scripts/transform-pages.py",
+}
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[], object]
+    # Untimed; runs before every repetition (e.g. to restore a file a transform rewrote).
+    setup: Optional[Callable[[], object]] = None
+
+
+def load_script(relative_path: str) -> ModuleType:
+    """Import one of the hyphen-named scripts/ files as a module."""
+    path = SOURCE_ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(path.stem.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_cases(root: Path, size: int, fill: float, documents: int) -> List[Case]:
+    site = Site(root)
+    write_directory(site.data_path, size, fill, documents)
+    directory = load(site)
+    renderer = HTMLRenderer(directory, site=site)
+    members = directory.list_staff("medical") + directory.list_staff("support")
+    html = renderer.render()
+    extra = make_member(size, random.Random(1), fill, documents)
+    target = members[len(members) // 2]
+    page = root / "legacy-page.html"
+    legacy_html = legacy_page(html)
+    transforms = {name: load_script(path) for name, path in TRANSFORM_SCRIPTS.items()}
+    single_pass = transforms["single_pass"].load_transforms()
+    page_versions = [html, html + "\n"]
+    # Minified pages have no line breaks; their backups must still deduplicate.
+    minified = minify_html(html)
+    minified_versions = [minified, minified.replace("</main>", "<p>edited</p></main>", 1)]
+    pretty_json = serialization.dumps(directory.data)
+
+    def reset_page() -> None:
+        page.write_text(legacy_html, encoding="utf-8")
+
+    def write_changed() -> None:
+        page_versions.reverse()
+        write_staff_page(page_versions[0], site)
+
+    def write_minified_changed() -> None:
+        minified_versions.reverse()
+        write_staff_page(minified_versions[0], site)
+
+    return [
+        Case("directory.load", directory.load),
+        Case(
+            "directory.list_staff",
+            lambda: [directory.list_staff(c) for c in directory.categories],
+            setup=directory.load,
+        ),
+        Case("directory.save", directory.save),
+        Case("json.dumps.pretty", lambda: serialization.dumps(directory.data)),
+        Case("json.dumps.compact", lambda: serialization.dumps(directory.data, compact=True)),
+        Case("json.loads", lambda: serialization.loads(pretty_json)),
+        Case("json.stream.support", lambda: sum(1 for _ in serialization.iter_array(site.data_path, "support"))),
+        Case("directory.upsert.existing", lambda: directory.upsert("medical", target)),
+        Case("directory.upsert.new", lambda: directory.upsert("medical", extra), setup=lambda: directory.remove("medical", extra.id)),
+        Case("render.staff_cards", lambda: [renderer._render_staff_card(member) for member in members]),
+        Case("render.page", renderer.render),
+        Case("write.staff_page.changed", write_changed),
+        Case("write.staff_page.unchanged", lambda: write_staff_page(page_versions[0], site)),
+        Case("write.staff_page.minified", write_minified_changed),
+        Case(
+            "transform.modern_navigation",
+            lambda: transforms["modern_navigation"].update_page_navigation(str(page)),
+            setup=reset_page,
+        ),
+        Case(
+            "transform.header_fix",
+            lambda: transforms["header_fix"].process_file(str(page)),
+            setup=reset_page,
+        ),
+        Case(
+            "transform.css_duplications",
+            lambda: transforms["css_duplications"].fix_file_duplications(str(page)),
+            setup=reset_page,
+        ),
+        Case(
+            "transform.single_pass",
+            lambda: transforms["single_pass"].transform_page(str(page), single_pass),
+            setup=reset_page,
+        ),
+    ]
+
+
+def measure(case: Case, repeat: int) -> Dict[str, object]:
+    timings: List[float] = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            if case.setup:
+                case.setup()
+            start = time.perf_counter()
+            case.run()
+            timings.append(time.perf_counter() - start)
+        if case.setup:
+            case.setup()
+        tracemalloc.start()
+        try:
+            case.run()
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "runs": repeat,
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmarks(
+    sizes: List[int], fill: float, documents: int, repeat: int, only: Optional[str] = None
+) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix="staff-bench-") as scratch:
+            for case in build_cases(Path(scratch), size, fill, documents):
+                if only and only not in case.name:
+                    continue
+                result = {"name": case.name, "size": size, **measure(case, repeat)}
+                results.append(result)
+                print(format_result(result))
+    return results
+
+
+def format_result(result: Dict[str, object]) -> str:
+    return (
+        f"{result['name']:<30} {result['size']:>8} "
+        f"{result['median_s'] * 1000:>11.2f} ms {result['peak_bytes'] / 1024:>12.1f} KiB"
+    )
+
+
+def compare(
+    current: List[Dict[str, object]], baseline: List[Dict[str, object]], threshold: float
+) -> List[str]:
+    """Return a line for every case whose median time or peak memory grew by more than threshold."""
+    previous: Dict[Tuple[str, int], Dict[str, object]] = {
+        (entry["name"], entry["size"]): entry for entry in baseline
+    }
+    regressions: List[str] = []
+    for entry in current:
+        before = previous.get((entry["name"], entry["size"]))
+        if before is None:
+            continue
+        for metric in ("median_s", "peak_bytes"):
+            if before[metric] and entry[metric] > before[metric] * (1 + threshold):
+                ratio = entry[metric] / before[metric]
+                regressions.append(f"{entry['name']} @ {entry['size']}: {metric} x{ratio:.2f}")
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark staff_manager hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Directory sizes to test.")
+    parser.add_argument("--fill", type=float, default=1.0, help="Share of optional fields filled (0-1).")
+    parser.add_argument("--documents", type=int, default=1, help="Documents per member.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (the median is reported).")
+    parser.add_argument("--only", metavar="TEXT", help="Only run cases whose name contains TEXT.")
+    parser.add_argument("--output", type=Path, help="Results file (default: bench_results/<timestamp>.json).")
+    parser.add_argument("--compare", type=Path, metavar="RESULTS", help="Earlier results file to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown/memory growth before --compare fails (default: 0.15 = 15%%).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    print(f"{'case':<30} {'size':>8} {'median':>14} {'peak memory':>16}")
+    results = run_benchmarks(args.sizes, args.fill, args.documents, args.repeat, args.only)
+
+    output = args.output or RESULTS_DIR / f"{_dt.datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "version": RESULTS_VERSION,
+        "created": iso_now(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {"fill": args.fill, "documents": args.documents, "repeat": args.repeat},
+        "json_backend": serialization.BACKEND,
+        "stream_backend": serialization.STREAM_BACKEND,
+        "results": results,
+    }
+    with atomic_open(output) as handle:
+        json.dump(document, handle, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with args.compare.open("r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline.get("results", []), args.threshold)
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
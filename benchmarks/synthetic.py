@@ -0,0 +1,131 @@
+"""Synthetic staff directories for benchmarking."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Dict, List
+
+from staff_manager.fileio import atomic_open
+from staff_manager.models import StaffDirectory, StaffMember
+from staff_manager.utils import slugify
+
+FIRST_NAMES = ("Avery", "Jordan", "Morgan", "Riley", "Casey", "Taylor", "Quinn", "Harper", "Rowan", "Emerson")
+LAST_NAMES = ("Shaw", "Patel", "Nguyen", "Garcia", "Brooks", "Kim", "Okafor", "Reed", "Lopez", "Hayes")
+TITLES = ("Nurse Practitioner", "Physician Assistant", "Medical Director", "Radiologic Technologist", "Front Desk Lead")
+CREDENTIALS = ("FNP-C", "PA-C", "MD", "DO", "RN", "ARRT", "BLS")
+SPECIALTIES = ("Urgent Care", "Primary Care", "Pediatrics", "Occupational Health", "Weight Loss", "Telemedicine")
+LOCATIONS = ("Collierville", "Southaven", "Millington", "Germantown", "Bartlett", "Olive Branch")
+LANGUAGES = ("English", "Spanish", "Vietnamese", "Arabic")
+TAGS = ("Leadership", "Bilingual", "Sports Medicine", "DOT Exams")
+BIO_SENTENCE = "Provides compassionate, evidence-based care for patients of every age. "
+
+# Optional fields, in the order they are filled as `fill` grows from 0 to 1.
+OPTIONAL_FIELDS = (
+    "credentials",
+    "specialties",
+    "description",
+    "experience_years",
+    "locations",
+    "image",
+    "education",
+    "email",
+    "phone",
+    "languages",
+    "linkedin",
+    "tags",
+)
+
+
+def make_member(index: int, rng: random.Random, fill: float = 1.0, documents: int = 1) -> StaffMember:
+    """Build one member with roughly `fill` of the optional fields populated."""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {index:06d}"
+    slug = slugify(name)
+    filled = set(OPTIONAL_FIELDS[: round(len(OPTIONAL_FIELDS) * fill)])
+    member = StaffMember(
+        id=slug,
+        name=name,
+        title=rng.choice(TITLES),
+        featured=index % 50 == 0,
+        last_modified="2025-10-14T20:09:23",
+    )
+    if "credentials" in filled:
+        member.credentials = rng.sample(CREDENTIALS, 2)
+    if "specialties" in filled:
+        member.specialties = rng.sample(SPECIALTIES, 2)
+    if "description" in filled:
+        member.description = BIO_SENTENCE * rng.randint(2, 6)
+    if "experience_years" in filled:
+        member.experience_years = rng.randint(1, 35)
+    if "locations" in filled:
+        member.locations = rng.sample(LOCATIONS, rng.randint(1, 3))
+    if "image" in filled:
+        member.image = f"assets/images/staff/{slug}.jpg"
+    if "education" in filled:
+        member.education = "University of Tennessee Health Science Center"
+    if "email" in filled:
+        member.email = f"{slug}@example.com"
+    if "phone" in filled:
+        member.phone = f"(901) 555-{index % 10000:04d}"
+    if "languages" in filled:
+        member.languages = rng.sample(LANGUAGES, rng.randint(1, 2))
+    if "linkedin" in filled:
+        member.linkedin = f"https://www.linkedin.com/in/{slug}"
+    if "tags" in filled:
+        member.tags = rng.sample(TAGS, 2)
+    member.documents = [
+        {"label": f"Document {number + 1}", "path": f"assets/files/staff/{slug}-{number + 1}.pdf"}
+        for number in range(documents)
+    ]
+    return member
+
+
+def generate_directory(
+    size: int, fill: float = 1.0, documents: int = 1, seed: int = 0
+) -> Dict[str, object]:
+    """Return staff_directory.json data with `size` members (three medical to every support)."""
+    rng = random.Random(seed)
+    members: Dict[str, List[Dict[str, object]]] = {category: [] for category in StaffDirectory.categories}
+    for index in range(size):
+        category = "support" if index % 4 == 3 else "medical"
+        members[category].append(make_member(index, rng, fill, documents).to_dict())
+    return {
+        "meta": {
+            "last_updated": "2025-10-14T20:09:23",
+            "image_dir": "assets/images/staff",
+            "document_dir": "assets/files/staff",
+        },
+        **members,
+    }
+
+
+def write_directory(path: Path, size: int, fill: float = 1.0, documents: int = 1, seed: int = 0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_open(path) as handle:
+        json.dump(generate_directory(size, fill, documents, seed), handle, indent=2, ensure_ascii=False)
+    return path
+
+
+LEGACY_HEADER = """
+    <header class="site-header">
+        <div class="header-container">
+            <nav class="main-navigation" aria-label="Main navigation">
+                <ul class="menu">
+                    <li class="menu-item"><a href="index.html">Home</a></li>
+                    <li class="menu-item"><a href="our-staff.html">Our Staff</a></li>
+                </ul>
+            </nav>
+            <div class="header-actions">
+                <a href="save-your-spot.html" class="btn btn-primary">Save Your Spot</a>
+            </div>
+        </div>
+    </header>
+"""
+
+
+def legacy_page(html: str) -> str:
+    """Give a generated page the pre-redesign header and duplicated stylesheet links the scripts/ transforms fix."""
+    stylesheet = '<link rel="stylesheet" href="assets/css/core/custom-redesign.css">'
+    html = html.replace("</head>", f"    {stylesheet}\n    {stylesheet}\n</head>", 1)
+    return html.replace("<main", LEGACY_HEADER.lstrip("\n") + "    <main", 1)
@@ -5,28 +5,16 @@ Modern Navigation Applier
 This script applies the modern navigation structure to all pages with old navigation
 """
 
-import re
 import os
-import shutil
+import sys
 from datetime import datetime
+from pathlib import Path
 
-# Pages that need navigation updates (excluding contact.html which is already done)
-PAGES_TO_UPDATE = [
-    "allergy-testing.html",
-    "gallery.html", 
-    "insurance.html",
-    "lab-testing.html",
-    "pay.html",
-    "physicals.html",
-    "primary-care.html",
-    "save-your-spot.html",
-    "services.html",
-    "telemedicine.html",
-    "urgent-care.html",
-    "vaccinations.html",
-    "weight-loss.html",
-    "x-ray.html"
-]
+# Shared atomic writer and HTML rewriter from the staff_manager package at the project root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from staff_manager.assets import fingerprint_page, manifest_pages
+from staff_manager.fileio import atomic_write
+from staff_manager.rewriter import Handler, rewrite_file
 
 # Page-specific current menu highlighting
 PAGE_HIGHLIGHTS = {
@@ -234,36 +222,80 @@ def get_mobile_navigation(page_name):
     </nav>
 '''
 
-def update_page_navigation(page_path):
-    """Update a single page with modern navigation"""
+class ModernNavigation(Handler):
+    """Swaps the old header navigation for the modern one and adds the mobile menu.
+
+    Pages already on the modern markup (nav inside .nav-container) are left alone.
+    """
+
+    rules = {
+        "nav.main-navigation": "navigation",
+        "div.header-actions": "header_actions",
+        ".mobile-menu-overlay": "mobile_overlay",
+        "header": "header",
+        "main": "main",
+    }
+
+    def __init__(self, page_name):
+        self.page_name = page_name
+        self.updated = False
+        self.has_overlay = False
+        self._header = None
+        self._header_before_main = None
+
+    def navigation(self, element):
+        if not self.updated and not element.within(".nav-container"):
+            element.replace(get_modern_navigation(self.page_name).lstrip())
+            self.updated = True
+
+    def header_actions(self, element):
+        # The modern markup brings its own header actions inside .action-buttons.
+        if self.updated and not element.within(".action-buttons"):
+            element.remove()
+
+    def mobile_overlay(self, element):
+        self.has_overlay = True
+
+    def header(self, element):
+        self._header = element
+
+    def main(self, element):
+        header = self._header
+        if header and header.closed and header.parent is element.parent and header.index == element.index - 1:
+            self._header_before_main = header
+
+    def finish(self):
+        if self._header_before_main and not self.has_overlay:
+            self._header_before_main.after(get_mobile_navigation(self.page_name))
+
+
+def page_handlers(page_path):
+    """This script's transform as rewriter handlers, for one pass over page_path."""
+    return [ModernNavigation(os.path.basename(page_path))]
+
+
+def update_page_navigation(page_path, backup_dir=None):
+    """Update a single page with modern navigation (the original is hard-linked into backup_dir)"""
     print(f"Updating {page_path}...")
     
-    with open(page_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     page_name = os.path.basename(page_path)
+    content = rewrite_file(page_path, page_handlers(page_path))
+    if content is None:
+        print(f"✅ {page_path} already has the modern navigation")
+        return
     
-    # Replace old navigation structure with modern one
-    # Pattern to match old navigation from <nav class="main-navigation"> to </div> (header-actions)
-    old_nav_pattern = r'<nav class="main-navigation".*?<div class="header-actions">.*?</div>'
-    modern_nav = get_modern_navigation(page_name)
-    
-    content = re.sub(old_nav_pattern, modern_nav, content, flags=re.DOTALL)
-    
-    # Add mobile navigation after </header> if not present
-    if 'mobile-menu-overlay' not in content:
-        mobile_nav = get_mobile_navigation(page_name)
-        content = re.sub(r'</header>\s*<main', f'</header>{mobile_nav}\n\n<main', content)
-    
-    # Write updated content
-    with open(page_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Keep CSS/JS links on their fingerprinted copies, then write atomically
+    content = fingerprint_page(page_path, content)
+    backup = os.path.join(backup_dir, page_name) if backup_dir else None
+    atomic_write(page_path, content, backup=backup)
     
     print(f"✅ Updated {page_path}")
 
 def main():
+    # Pages come from scripts/transform-pages.json, shared with the other transforms
+    pages = [str(path) for path in manifest_pages()]
     print("=== APPLYING MODERN NAVIGATION TO ALL PAGES ===")
-    print(f"Updating {len(PAGES_TO_UPDATE)} pages...")
+    print(f"Updating {len(pages)} pages...")
     print()
     
     # Create backup directory
@@ -274,14 +306,11 @@ def main():
     
     updated_count = 0
     
-    for page in PAGES_TO_UPDATE:
+    for page in pages:
         if os.path.exists(page):
-            # Create backup
-            shutil.copy2(page, backup_dir)
-            
-            # Update navigation
+            # Update navigation (backs the page up into backup_dir)
             try:
-                update_page_navigation(page)
+                update_page_navigation(page, backup_dir)
                 updated_count += 1
             except Exception as e:
                 print(f"❌ Error updating {page}: {e}")
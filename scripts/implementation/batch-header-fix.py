@@ -6,26 +6,15 @@ Applies mobile menu header structure to multiple HTML files
 """
 
 import os
-import re
+import sys
 from datetime import datetime
+from pathlib import Path
 
-# List of files to process (excluding already completed ones)
-FILES_TO_PROCESS = [
-    "insurance.html",
-    "lab-testing.html", 
-    "our-staff.html",
-    "patient-services.html",
-    "pay.html",
-    "physicals.html",
-    "primary-care.html",
-    "save-your-spot.html",
-    "services.html",
-    "telemedicine.html",
-    "urgent-care.html",
-    "vaccinations.html",
-    "weight-loss.html",
-    "x-ray.html"
-]
+# Shared atomic writer and HTML rewriter from the staff_manager package at the project root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from staff_manager.assets import fingerprint_page, manifest_pages
+from staff_manager.fileio import atomic_write
+from staff_manager.rewriter import Handler, rewrite_file
 
 # Mobile menu header template
 MOBILE_MENU_HEADER = '''                <!-- Mobile Menu Header -->
@@ -43,6 +32,38 @@ MOBILE_MENU_HEADER = '''                <!-- Mobile Menu Header -->
 
                 <!-- Navigation Menu -->'''
 
+class MobileMenuHeader(Handler):
+    """Adds the mobile menu header at the top of the main navigation, before its ul.menu.
+
+    Nothing is added if the page has a .mobile-menu-header anywhere.
+    """
+
+    rules = {
+        ".mobile-menu-header": "existing_header",
+        "nav.main-navigation > ul.menu": "menu",
+    }
+
+    def __init__(self):
+        self.present = False
+        self.navigation = None
+
+    def existing_header(self, element):
+        self.present = True
+
+    def menu(self, element):
+        if self.navigation is None and element.index == 0:
+            self.navigation = element.parent
+
+    def finish(self):
+        if self.navigation and not self.present:
+            self.navigation.prepend("\n" + MOBILE_MENU_HEADER)
+
+
+def page_handlers(page_path):
+    """This script's transform as rewriter handlers, for one pass over page_path."""
+    return [MobileMenuHeader()]
+
+
 def process_file(filename):
     """Process a single HTML file to add mobile menu header structure"""
     
@@ -50,35 +71,21 @@ def process_file(filename):
         print(f"❌ {filename} - FILE NOT FOUND")
         return False
     
-    # Check if already processed
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
+    handler = MobileMenuHeader()
+    new_content = rewrite_file(filename, [handler])
     
-    if 'mobile-menu-header' in content:
+    # Check if already processed
+    if handler.present:
         print(f"✅ {filename} - mobile-menu-header already present, skipping")
         return True
     
     print(f"🔧 Processing: {filename}")
     
-    # Create backup
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    backup_filename = f"{filename}.bak.header-{timestamp}"
-    with open(backup_filename, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    # Pattern to match: nav tag followed by ul.menu
-    pattern = r'(\s*<nav class="main-navigation"[^>]*>\s*)\n(\s*<ul class="menu">)'
-    
-    # Replacement: nav tag + mobile menu header + ul.menu
-    replacement = r'\1\n' + MOBILE_MENU_HEADER + r'\n\2'
-    
-    # Apply the replacement
-    new_content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
-    
-    if new_content != content:
-        # Write the updated content
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+    if new_content is not None:
+        new_content = fingerprint_page(filename, new_content)
+        # Write the updated content atomically; the original is kept as a hard-linked backup
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        atomic_write(filename, new_content, backup=f"{filename}.bak.header-{timestamp}")
         print(f"  ✅ Added mobile-menu-header structure")
         return True
     else:
@@ -87,6 +94,8 @@ def process_file(filename):
 
 def main():
     """Main processing function"""
+    # Pages come from scripts/transform-pages.json, shared with the other transforms
+    files_to_process = [str(path) for path in manifest_pages()]
     print("=== BATCH HEADER STRUCTURE FIX ===")
     print(f"Started at: {datetime.now()}")
     print()
@@ -94,7 +103,7 @@ def main():
     processed = 0
     skipped = 0
     
-    for filename in FILES_TO_PROCESS:
+    for filename in files_to_process:
         if process_file(filename):
             processed += 1
         else:
@@ -104,12 +113,12 @@ def main():
     print("=== SUMMARY ===")
     print(f"Files processed: {processed}")
     print(f"Files skipped: {skipped}")
-    print(f"Total files: {len(FILES_TO_PROCESS)}")
+    print(f"Total files: {len(files_to_process)}")
     print()
     
     # Verification
     print("=== VERIFICATION ===")
-    for filename in FILES_TO_PROCESS:
+    for filename in files_to_process:
         if os.path.exists(filename):
             with open(filename, 'r', encoding='utf-8') as f:
                 content = f.read()
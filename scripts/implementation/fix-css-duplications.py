@@ -6,86 +6,50 @@ Removes duplicate CSS file references from HTML files
 """
 
 import os
-import re
+import posixpath
+import sys
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
 
-# List of files that need CSS duplication fixes
-FILES_TO_FIX = [
-    "allergy-testing.html",
-    "contact.html", 
-    "gallery.html",
-    "insurance.html",
-    "lab-testing.html",
-    "our-staff.html",
-    "patient-services.html",
-    "pay.html",
-    "physicals.html",
-    "primary-care.html",
-    "save-your-spot.html",
-    "services.html",
-    "telemedicine.html",
-    "urgent-care.html",
-    "vaccinations.html",
-    "weight-loss.html",
-    "x-ray.html"
+# Shared atomic writer and HTML rewriter from the staff_manager package at the project root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from staff_manager.assets import fingerprint_page, manifest_pages, original_name
+from staff_manager.fileio import atomic_write
+from staff_manager.rewriter import Handler, rewrite_file
+
+# Stylesheets that must be linked at most once per page
+CSS_FILES_TO_CHECK = [
+    'custom-redesign.css',
+    'header-system.css',
+    'compact-layout.css',
+    'advanced-effects.css',
+    'mobile-optimizations.css'
 ]
 
-def remove_duplicate_css_lines(content, css_filename):
-    """Remove duplicate CSS link lines for a specific CSS file"""
-    
-    # Pattern to match CSS link lines for the specific file
-    pattern = rf'<link[^>]*href="[^"]*{re.escape(css_filename)}"[^>]*>'
-    
-    # Find all matches
-    matches = re.findall(pattern, content)
-    
-    if len(matches) <= 1:
-        return content, 0  # No duplicates
-    
-    # Keep only the first occurrence, remove the rest
-    first_match = matches[0]
-    
-    # Replace all occurrences with empty string
-    content_without_css = re.sub(pattern, '', content)
-    
-    # Add back the first occurrence at the appropriate location
-    # Look for a good place to insert it (after other CSS files)
-    if 'custom-redesign.css' in css_filename:
-        # Insert after Font Awesome or at the beginning of head section
-        if 'font-awesome' in content_without_css:
-            content_without_css = re.sub(
-                r'(<link[^>]*font-awesome[^>]*>)',
-                r'\1\n    ' + first_match,
-                content_without_css,
-                count=1
-            )
-        else:
-            # Insert after <head> tag
-            content_without_css = re.sub(
-                r'(<head[^>]*>)',
-                r'\1\n    ' + first_match,
-                content_without_css,
-                count=1
-            )
-    elif 'header-system.css' in css_filename:
-        # Insert after custom-redesign.css
-        if 'custom-redesign.css' in content_without_css:
-            content_without_css = re.sub(
-                r'(<link[^>]*custom-redesign\.css[^>]*>)',
-                r'\1\n    ' + first_match,
-                content_without_css,
-                count=1
-            )
-        else:
-            # Insert after <head> tag
-            content_without_css = re.sub(
-                r'(<head[^>]*>)',
-                r'\1\n    ' + first_match,
-                content_without_css,
-                count=1
-            )
-    
-    return content_without_css, len(matches) - 1
+class DuplicateStylesheets(Handler):
+    """Keeps the first link to each of CSS_FILES_TO_CHECK (or a fingerprinted copy) and removes the rest."""
+
+    rules = {"link[href]": "link"}
+
+    def __init__(self):
+        self.seen = set()
+        self.removed = {}
+
+    def link(self, element):
+        name = original_name(posixpath.basename(urlsplit(element.get("href")).path))
+        if name not in CSS_FILES_TO_CHECK:
+            return
+        if name in self.seen:
+            element.remove()
+            self.removed[name] = self.removed.get(name, 0) + 1
+        self.seen.add(name)
+
+
+def page_handlers(page_path):
+    """This script's transform as rewriter handlers, for one pass over page_path."""
+    return [DuplicateStylesheets()]
+
 
 def fix_file_duplications(filename):
     """Fix CSS duplications in a single file"""
@@ -96,62 +60,43 @@ def fix_file_duplications(filename):
     
     print(f"🔧 Processing: {filename}")
     
-    # Read file content
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Create backup
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    backup_filename = f"{filename}.bak.css-fix-{timestamp}"
-    with open(backup_filename, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    original_content = content
-    total_duplicates_removed = 0
-    
-    # Fix duplications for each CSS file
-    css_files_to_check = [
-        'custom-redesign.css',
-        'header-system.css',
-        'compact-layout.css',
-        'advanced-effects.css',
-        'mobile-optimizations.css'
-    ]
+    handler = DuplicateStylesheets()
+    content = rewrite_file(filename, [handler])
     
-    for css_file in css_files_to_check:
-        content, duplicates_removed = remove_duplicate_css_lines(content, css_file)
-        if duplicates_removed > 0:
-            print(f"  ✅ Removed {duplicates_removed} duplicate(s) of {css_file}")
-            total_duplicates_removed += duplicates_removed
+    for css_file in CSS_FILES_TO_CHECK:
+        if handler.removed.get(css_file):
+            print(f"  ✅ Removed {handler.removed[css_file]} duplicate(s) of {css_file}")
+    total_duplicates_removed = sum(handler.removed.values())
     
-    if total_duplicates_removed > 0:
-        # Write the fixed content
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+    if content is not None:
+        # Write the fixed content atomically; the original is kept as a hard-linked backup
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        content = fingerprint_page(filename, content)
+        atomic_write(filename, content, backup=f"{filename}.bak.css-fix-{timestamp}")
         print(f"  📊 Total duplicates removed: {total_duplicates_removed}")
         return True
     else:
         print(f"  ✅ No duplicates found")
-        # Remove the backup since no changes were made
-        os.remove(backup_filename)
         return True
 
 def main():
     """Main processing function"""
+    # Pages come from scripts/transform-pages.json, shared with the other transforms
+    files_to_fix = [str(path) for path in manifest_pages()]
     print("=== CSS DUPLICATION FIX ===")
     print(f"Started at: {datetime.now()}")
     print()
     
     processed = 0
     
-    for filename in FILES_TO_FIX:
+    for filename in files_to_fix:
         if fix_file_duplications(filename):
             processed += 1
         print()
     
     print("=== SUMMARY ===")
     print(f"Files processed: {processed}")
-    print(f"Total files: {len(FILES_TO_FIX)}")
+    print(f"Total files: {len(files_to_fix)}")
     print()
     
     print("=== CSS DUPLICATION FIX COMPLETE ===")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+"""
+Page Transform Runner
+Runs the registered page transforms (modern navigation, mobile menu header,
+CSS duplication fixes) over the pages listed in scripts/transform-pages.json.
+Each page is parsed once, with the handlers of every transform, and written
+at most once; pages are spread over a process pool.
+
+data/transform-state.json remembers each page's hash after its last
+successful run, so pages that have not changed since (and whose transforms
+have not changed either) are skipped without being parsed. --force runs
+every page regardless.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Shared atomic writer and HTML rewriter from the staff_manager package at the project root.
+sys.path.insert(0, str(SCRIPTS_DIR.parent))
+from staff_manager import rewriter
+from staff_manager.assets import fingerprint_page, manifest_pages
+from staff_manager.config import Site
+from staff_manager.fileio import atomic_write
+from staff_manager.rewriter import rewrite_file
+from staff_manager.utils import ensure_directory
+
+# (name, script, idempotent), in the order their handlers run. Only pages
+# whose every transform is idempotent can be skipped when unchanged.
+TRANSFORMS = [
+    ("modern-navigation", "apply-modern-navigation.py", True),
+    ("mobile-menu-header", "implementation/batch-header-fix.py", True),
+    ("css-duplications", "implementation/fix-css-duplications.py", True),
+]
+STATE_VERSION = 1
+
+# The transforms loaded in this (worker) process.
+_loaded = None
+
+def load_script(relative_path):
+    """Import one of the hyphen-named transform scripts as a module"""
+    path = SCRIPTS_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(path.stem.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def load_transforms():
+    """(name, module) for each transform in TRANSFORMS"""
+    return [(name, load_script(relative_path)) for name, relative_path, _idempotent in TRANSFORMS]
+
+def transforms_signature():
+    """Hash of the transform scripts and the rewriter: a page's last run only counts if they are unchanged"""
+    digest = hashlib.sha256()
+    for name, relative_path, _idempotent in TRANSFORMS:
+        digest.update(name.encode("utf-8"))
+        digest.update((SCRIPTS_DIR / relative_path).read_bytes())
+    digest.update(Path(rewriter.__file__).read_bytes())
+    return digest.hexdigest()
+
+def transform_page(page_path, transforms=None, backup=None):
+    """Run the handlers of transforms (default: all of them) over one page; returns (changed, edits per transform)"""
+    transforms = transforms or load_transforms()
+    handlers = {name: module.page_handlers(page_path) for name, module in transforms}
+    content = rewrite_file(page_path, [handler for group in handlers.values() for handler in group])
+    edits = {name: sum(handler.edits for handler in group) for name, group in handlers.items()}
+    if content is None:
+        return False, edits
+    # Keep CSS/JS links on their fingerprinted copies, then write atomically
+    content = fingerprint_page(page_path, content)
+    atomic_write(page_path, content, backup=backup)
+    return True, edits
+
+def _start_worker():
+    global _loaded
+    _loaded = load_transforms()
+
+def run_page(page_path, backup):
+    """Worker: transform one page; returns its result and new state entry (None if it failed)"""
+    start = time.perf_counter()
+    try:
+        changed, edits = transform_page(page_path, _loaded, backup)
+    except Exception as e:
+        return {"page": page_path, "error": str(e), "elapsed": time.perf_counter() - start, "entry": None}
+    elapsed = time.perf_counter() - start
+    stat = os.stat(page_path)
+    entry = {"stamp": [stat.st_mtime_ns, stat.st_size], "sha256": _hash_file(page_path)}
+    return {"page": page_path, "changed": changed, "edits": edits, "elapsed": elapsed, "entry": entry}
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_state(site, signature):
+    try:
+        with site.transform_state.open("r", encoding="utf-8") as handle:
+            state = json.load(handle)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if state.get("version") != STATE_VERSION or state.get("signature") != signature:
+        return {}
+    return state.get("pages", {})
+
+def unchanged_since_last_run(path, previous):
+    """path's state entry if it still has the hash recorded after its last run, else None (an unchanged stamp skips hashing)"""
+    if not previous:
+        return None
+    stat = path.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    if previous["stamp"] == stamp:
+        return previous
+    if previous["sha256"] == _hash_file(path):
+        return {**previous, "stamp": stamp}
+    return None
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the scripts/ page transforms over the pages in the manifest.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: one per CPU).")
+    parser.add_argument("--force", action="store_true", help="Transform every page, even those unchanged since the last run.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    site = Site()
+    print("=== PAGE TRANSFORMS ===")
+    print(f"Started at: {datetime.now()}")
+    print()
+
+    signature = transforms_signature()
+    previous = {} if args.force else load_state(site, signature)
+    skippable = all(idempotent for _name, _path, idempotent in TRANSFORMS)
+    state = {}
+    pending = []
+    for path in manifest_pages(site):
+        name = site.relative(path)
+        entry = unchanged_since_last_run(path, previous.get(name)) if skippable else None
+        if entry:
+            state[name] = entry
+        else:
+            pending.append(path)
+    skipped = len(state)
+
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    pages = [str(path) for path in pending]
+    backups = [f"{page}.bak.transform-{timestamp}" for page in pages]
+    started = time.perf_counter()
+    if len(pages) > 1 and args.workers > 1:
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(pages)), initializer=_start_worker) as pool:
+            results = list(pool.map(run_page, pages, backups))
+    else:
+        _start_worker()
+        results = [run_page(page, backup) for page, backup in zip(pages, backups)]
+    wall = time.perf_counter() - started
+
+    updated = failed = 0
+    for result in results:
+        name = site.relative(Path(result["page"]))
+        elapsed = f"{result['elapsed'] * 1000:8.1f} ms"
+        if result["entry"] is None:
+            print(f"❌ {name:<28} {elapsed}  {result['error']}")
+            failed += 1
+            continue
+        state[name] = result["entry"]
+        if result["changed"]:
+            counts = ", ".join(f"{transform} {count}" for transform, count in result["edits"].items() if count)
+            print(f"✅ {name:<28} {elapsed}  {counts}")
+            updated += 1
+        else:
+            print(f"·  {name:<28} {elapsed}  no changes")
+
+    if state != previous:
+        ensure_directory(site.transform_state.parent)
+        payload = {"version": STATE_VERSION, "signature": signature, "pages": state}
+        atomic_write(site.transform_state, json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+    print()
+    print("=== SUMMARY ===")
+    print(f"Pages updated: {updated}")
+    print(f"Pages unchanged: {len(results) - updated - failed}")
+    print(f"Pages skipped (unchanged since last run): {skipped}")
+    print(f"Pages failed: {failed}")
+    print(f"Transformed {len(results)} page(s) in {wall:.2f}s")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
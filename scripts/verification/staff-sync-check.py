@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+"""
+Staff Sync Check
+Runs staff_sync.py against a local stand-in for api/staff.php (http.server,
+same GET/POST schema, records kept in memory) and a scratch directory, and
+checks the push, pull and delete paths:
+
+1. first sync: local-only records are pushed, remote-only records pulled;
+2. a remote edit newer than the local record is pulled;
+3. a record deleted locally is deleted remotely, and one deleted remotely
+   is removed locally, instead of either coming back;
+4. a repeat sync has nothing to do.
+
+Nothing under the project root is touched. Exits 1 if any check fails.
+"""
+
+import datetime as _dt
+import json
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+from staff_manager.models import StaffDirectory, StaffMember
+from staff_sync import StaffAPIClient, SyncState, sync
+
+
+def _now():
+    return _dt.datetime.now(_dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S%z")
+
+
+class StandInAPI(BaseHTTPRequestHandler):
+    """GET returns every record; POST upserts "staff" ("mode": "upsert" also deletes "delete") or mirrors it."""
+
+    records = {}
+
+    def do_GET(self):
+        self._reply({"metadata": {"version": "1.0", "totalStaff": len(self.records)}, "staff": list(self.records.values())})
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        posted = payload.get("staff", [])
+        if payload.get("mode") != "upsert":
+            self.records.clear()
+        for record in posted:
+            self.records[record["id"]] = {**self.records.get(record["id"], {}), **record, "updatedAt": _now()}
+        if payload.get("mode") == "upsert":
+            for slug in payload.get("delete", []):
+                self.records.pop(slug, None)
+        self._reply({"ok": True})
+
+    def _reply(self, document):
+        body = json.dumps(document).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def remote_record(slug, name, updated):
+    return {"id": slug, "name": name, "title": "Nurse", "type": "support", "updatedAt": updated}
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = StaffAPIClient(f"http://127.0.0.1:{server.server_port}/api/staff.php")
+    failures = 0
+
+    def check(label, condition):
+        nonlocal failures
+        print(f"{'✅' if condition else '❌'} {label}")
+        failures += 0 if condition else 1
+
+    def ids(directory):
+        directory.load()
+        return {member.id for category in directory.categories for member in directory.list_staff(category)}
+
+    with tempfile.TemporaryDirectory() as scratch:
+        directory = StaffDirectory(Path(scratch) / "data" / "staff_directory.json", root=Path(scratch))
+        state = SyncState(Path(scratch) / "data" / "sync-state.json")
+        directory.upsert_many([
+            ("medical", StaffMember.from_dict({"name": "Ana Local", "last_modified": "2026-01-01T09:00:00"})),
+            ("medical", StaffMember.from_dict({"name": "Ben Local", "last_modified": "2026-01-01T09:00:00"})),
+        ])
+        StandInAPI.records["cara-remote"] = remote_record("cara-remote", "Cara Remote", "2026-01-01T09:00:00+0000")
+
+        print("=== STAFF SYNC CHECK ===")
+        plan = sync(directory, client, state=state)
+        check("first sync pushes local-only records", sorted(record["id"] for record in plan.push) == ["ana-local", "ben-local"])
+        check("first sync pulls remote-only records", [member.id for _category, member in plan.pull] == ["cara-remote"])
+        check("both sides hold all three records", ids(directory) == set(StandInAPI.records) == {"ana-local", "ben-local", "cara-remote"})
+
+        StandInAPI.records["cara-remote"] = {**StandInAPI.records["cara-remote"], "title": "Charge Nurse", "updatedAt": _now()}
+        plan = sync(directory, client, state=state)
+        check("a newer remote edit is pulled", directory.find("support", "cara-remote").title == "Charge Nurse" and not plan.push)
+
+        directory.remove("medical", "ben-local")
+        del StandInAPI.records["ana-local"]
+        plan = sync(directory, client, state=state)
+        check("a local deletion is deleted remotely", plan.delete_remote == ["ben-local"] and "ben-local" not in StandInAPI.records)
+        check("a remote deletion is removed locally", plan.delete_local == [("medical", "ana-local")] and "ana-local" not in ids(directory))
+        check("nothing is pushed or pulled back", not plan.push and not plan.pull)
+
+        plan = sync(directory, client, state=state)
+        check("a repeat sync has nothing to do", not (plan.push or plan.pull or plan.delete_remote or plan.delete_local))
+        check("only the surviving record is left", ids(directory) == set(StandInAPI.records) == {"cara-remote"})
+
+    server.shutdown()
+    print()
+    print(f"{'All checks passed' if not failures else f'{failures} check(s) failed'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""
+People First Urgent Care - staff directory library.
+
+The staff page manager as an importable package. A Site says where one
+checkout's data and generated files live; load/render/write build it:
+
+    from staff_manager import Site, load, render, write
+
+    site = Site(Path("/srv/p1st-preview"))
+    directory = load(site)
+    write(render(directory, site), site)
+
+Page templates are compiled once per process and shared by every Site.
+The Tkinter GUI (staff_manager.gui) is only imported when launched.
+"""
+
+from .build import generate_site, load, render, write
+from .config import Site
+from .models import StaffDirectory, StaffMember
+from .render import HTMLRenderer
+
+__all__ = [
+    "HTMLRenderer",
+    "Site",
+    "StaffDirectory",
+    "StaffMember",
+    "generate_site",
+    "load",
+    "render",
+    "write",
+]
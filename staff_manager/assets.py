@@ -0,0 +1,185 @@
+"""Content-hashed copies of the site's CSS and JS, so browsers can cache them for a year.
+
+fingerprint_assets() copies e.g. assets/css/layout-fixes.css to
+assets/css/layout-fixes.3fa4e1c2d05b.css, records the pair in
+assets/asset-manifest.json and lists every hashed copy in _headers with an
+immutable, year-long Cache-Control. Editing a file gives it a new name, and
+pages themselves are still revalidated on every view, so visitors get the new
+version straight away. Copies sit next to their originals, so relative url()s
+inside the CSS keep working.
+
+rewrite_references() points a page's href/src attributes at the hashed
+copies. HTMLRenderer reads the manifest itself; the scripts/ transforms call
+fingerprint_page() on the pages they write.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import os
+import posixpath
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import FINGERPRINT_DIRS, IMMUTABLE_CACHE, Site
+from .fileio import atomic_copy, atomic_write
+
+HASH_LENGTH = 12
+HASHED_NAME = re.compile(r"\.[0-9a-f]{12}(?=\.(?:css|js)$)")
+ATTRIBUTE = re.compile(r"""(\s(?:href|src)\s*=\s*)(["'])([^"'<>]*?)\2""", re.IGNORECASE)
+# Folders under the site root whose pages are never published or rewritten.
+SKIP_DIRS = {"node_modules", "__pycache__"}
+
+
+def original_name(name: str) -> str:
+    """layout-fixes.3fa4e1c2d05b.css -> layout-fixes.css (other names are returned unchanged)."""
+    return HASHED_NAME.sub("", name, count=1)
+
+
+def name_pattern(filename: str) -> str:
+    """Regex matching filename or any fingerprinted copy of it, for code that finds links by name."""
+    stem, _, suffix = filename.rpartition(".")
+    return re.escape(stem) + r"(?:\.[0-9a-f]{%d})?\." % HASH_LENGTH + re.escape(suffix)
+
+
+def load_manifest(site: Optional[Site] = None) -> Dict[str, str]:
+    site = site or Site()
+    try:
+        with site.asset_manifest.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {}
+
+
+def _asset_files(site: Site) -> List[Path]:
+    files: List[Path] = []
+    for folder in FINGERPRINT_DIRS:
+        files.extend(
+            path for path in (site.root / folder).rglob("*") if path.suffix in (".css", ".js") and path.is_file()
+        )
+    return sorted(files)
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    atomic_write(path, text)
+    return True
+
+
+def fingerprint_assets(site: Optional[Site] = None) -> Dict[str, str]:
+    """Create missing hashed copies, drop outdated ones, and rewrite the manifest and _headers."""
+    site = site or Site()
+    previous = load_manifest(site)
+    manifest: Dict[str, str] = {}
+    files = _asset_files(site)
+    for path in files:
+        if HASHED_NAME.search(path.name):
+            continue
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+        target = path.with_name(f"{path.stem}.{digest}{path.suffix}")
+        if not target.exists():
+            atomic_copy(path, target)
+        manifest[site.relative(path)] = site.relative(target)
+    # Keep the previous generation too: pages already open in a browser may still ask for it.
+    live = set(manifest.values()) | set(previous.values())
+    for path in files:
+        if HASHED_NAME.search(path.name) and site.relative(path) not in live:
+            path.unlink()
+    live = {target for target in live if (site.root / target).exists()}
+    _write_if_changed(site.asset_manifest, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    lines = ["# Written by staff_page_manager.py --fingerprint-assets; edits here are overwritten."]
+    for target in sorted(live):
+        lines += [f"/{target}", f"  Cache-Control: {IMMUTABLE_CACHE}"]
+    _write_if_changed(site.headers_file, "\n".join(lines) + "\n")
+    return manifest
+
+
+def rewrite_references(html: str, manifest: Dict[str, str], page: str) -> str:
+    """Point href/src attributes at fingerprinted assets; page is the site-relative path of html."""
+    if not manifest:
+        return html
+    base = posixpath.dirname(page)
+
+    def replace(match: re.Match) -> str:
+        url = match.group(3)
+        cut = min((index for index in (url.find("?"), url.find("#")) if index >= 0), default=len(url))
+        path, tail = url[:cut], url[cut:]
+        if not path.endswith((".css", ".js")) or ":" in path or path.startswith("//"):
+            return match.group(0)
+        directory, name = posixpath.split(path)
+        if path.startswith("/"):
+            resolved = posixpath.normpath(posixpath.join(directory, original_name(name)).lstrip("/"))
+        else:
+            resolved = posixpath.normpath(posixpath.join(base, directory, original_name(name)))
+        target = manifest.get(resolved)
+        if target is None:
+            return match.group(0)
+        new_path = posixpath.join(directory, posixpath.basename(target))
+        return f"{match.group(1)}{match.group(2)}{new_path}{tail}{match.group(2)}"
+
+    return ATTRIBUTE.sub(replace, html)
+
+
+def fingerprint_page(
+    path: os.PathLike,
+    html: str,
+    site: Optional[Site] = None,
+    manifest: Optional[Dict[str, str]] = None,
+) -> str:
+    """rewrite_references() for a page on disk, using the site's manifest unless one is given.
+
+    Pages outside the site root (scratch copies, benchmarks) are returned unchanged.
+    """
+    site = site or Site()
+    resolved = Path(path).resolve()
+    if site.root not in resolved.parents:
+        return html
+    manifest = load_manifest(site) if manifest is None else manifest
+    return rewrite_references(html, manifest, resolved.relative_to(site.root).as_posix())
+
+
+def site_pages(site: Optional[Site] = None) -> List[Path]:
+    """Published HTML pages under the site root (skips hidden, dependency and backup folders)."""
+    site = site or Site()
+    pages: List[Path] = []
+    for folder, subfolders, names in os.walk(site.root):
+        subfolders[:] = sorted(
+            name for name in subfolders
+            if not name.startswith((".", "backup")) and name not in SKIP_DIRS
+            and Path(folder, name) != site.backup_dir
+        )
+        pages.extend(Path(folder, name) for name in sorted(names) if name.endswith(".html"))
+    return pages
+
+
+def manifest_pages(site: Optional[Site] = None) -> List[Path]:
+    """The pages site.page_manifest selects: {"include": [globs], "exclude": [globs]}, relative to the root."""
+    site = site or Site()
+    with site.page_manifest.open("r", encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    excluded = manifest.get("exclude", [])
+    pages = {
+        path
+        for pattern in manifest.get("include", [])
+        for path in site.root.glob(pattern)
+        if path.is_file() and not any(fnmatch.fnmatchcase(site.relative(path), glob) for glob in excluded)
+    }
+    return sorted(pages)
+
+
+def rewrite_pages(site: Optional[Site] = None, manifest: Optional[Dict[str, str]] = None) -> List[Path]:
+    """Rewrite every published page to the current fingerprints; returns the pages that changed."""
+    site = site or Site()
+    manifest = load_manifest(site) if manifest is None else manifest
+    changed: List[Path] = []
+    for page in site_pages(site):
+        html = page.read_text(encoding="utf-8")
+        updated = rewrite_references(html, manifest, site.relative(page))
+        if updated != html:
+            atomic_write(page, updated)
+            changed.append(page)
+    return changed
@@ -0,0 +1,246 @@
+"""Append-only audit log of directory edits, shared by the GUI, CLI, daemon and staff_sync.py.
+
+Records are JSON lines in numbered segments under data/audit/:
+
+    audit-000001.jsonl          closed segment
+    audit-000001.index.json     its index: first/last timestamp and member id -> byte offsets
+    audit-000002.jsonl          live segment, appended to
+
+A segment is closed once it reaches max_bytes; its index is written then,
+so history queries seek straight to a member's records in closed segments
+and skip segments outside the requested time range. Only the live segment
+(at most max_bytes) is ever scanned. The oldest segments beyond `keep` are
+deleted. Each record looks like:
+
+    {"ts": "2025-10-14T19:54:46", "actor": "jdoe", "source": "gui", "action": "update",
+     "member": "jane-smith", "category": "medical", "message": "Saved staff member Jane Smith",
+     "diff": {"title": ["Nurse", "Nurse Practitioner"]}}
+"""
+
+from __future__ import annotations
+
+import getpass
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .fileio import atomic_write, file_lock
+from .utils import ensure_directory, iso_now
+
+AUDIT_MAX_BYTES = 1 << 20
+AUDIT_KEEP = 20
+SEGMENT_NAME = re.compile(r"audit-(\d{6})\.jsonl$")
+# Fields left out of diffs: they change on every save.
+UNDIFFED_FIELDS = {"last_modified"}
+
+# (segment name, byte offset) just past the last record seen.
+Position = Tuple[str, int]
+
+
+def audit_dir(data_path: Path) -> Path:
+    """Where the audit log for a given staff_directory.json lives."""
+    return data_path.parent / "audit"
+
+
+def _current_user() -> str:
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        return "unknown"
+
+
+def record_diff(before: Optional[Dict[str, object]], after: Optional[Dict[str, object]]) -> Dict[str, list]:
+    """{field: [old, new]} for every field that differs (missing fields count as None).
+
+    Changes between two empty values ("" -> None, [] -> None) are left out, so
+    adds and removes list only the fields that were filled in.
+    """
+    before, after = before or {}, after or {}
+    return {
+        key: [before.get(key), after.get(key)]
+        for key in list(before) + [key for key in after if key not in before]
+        if key not in UNDIFFED_FIELDS
+        and before.get(key) != after.get(key)
+        and (before.get(key) or after.get(key))
+    }
+
+
+class AuditLog:
+    def __init__(
+        self,
+        root: Path,
+        source: str = "api",
+        actor: Optional[str] = None,
+        max_bytes: int = AUDIT_MAX_BYTES,
+        keep: int = AUDIT_KEEP,
+    ):
+        self.root = root
+        # Which front end wrote a record (gui, cli, daemon, sync...) and on whose behalf.
+        self.source = source
+        self.actor = actor or _current_user()
+        self.max_bytes = max_bytes
+        self.keep = keep
+
+    def _segments(self) -> List[Path]:
+        if not self.root.exists():
+            return []
+        return sorted(path for path in self.root.iterdir() if SEGMENT_NAME.match(path.name))
+
+    @staticmethod
+    def _index_path(segment: Path) -> Path:
+        return segment.with_name(segment.name[: -len(".jsonl")] + ".index.json")
+
+    def entry(
+        self,
+        action: str,
+        message: str = "",
+        member: Optional[str] = None,
+        category: Optional[str] = None,
+        diff: Optional[Dict[str, list]] = None,
+    ) -> Dict[str, object]:
+        return {
+            "ts": iso_now(),
+            "actor": self.actor,
+            "source": self.source,
+            "action": action,
+            "member": member,
+            "category": category,
+            "message": message,
+            "diff": diff or {},
+        }
+
+    def record(self, action: str, message: str = "", **fields: object) -> Dict[str, object]:
+        """Append one record built by entry() and return it."""
+        entry = self.entry(action, message, **fields)
+        self.append([entry])
+        return entry
+
+    def append(self, entries: Iterable[Dict[str, object]]) -> None:
+        """Append records in one write (rotating first if the live segment is full)."""
+        payload = b"".join(
+            json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+            for entry in entries
+        )
+        if not payload:
+            return
+        ensure_directory(self.root)
+        with file_lock(self.root / ".lock"):
+            segments = self._segments()
+            live = segments[-1] if segments else self.root / "audit-000001.jsonl"
+            size = live.stat().st_size if live.exists() else 0
+            if size and size + len(payload) > self.max_bytes:
+                self._write_index(live)
+                number = int(SEGMENT_NAME.match(live.name).group(1)) + 1
+                live = self.root / f"audit-{number:06d}.jsonl"
+                for old in (segments + [live])[: -self.keep]:
+                    old.unlink()
+                    self._index_path(old).unlink(missing_ok=True)
+            with live.open("ab") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def _scan(self, segment: Path, start: int = 0) -> Iterator[Tuple[int, int, Dict[str, object]]]:
+        """(offset, end offset, record) for each complete line from start on."""
+        with segment.open("rb") as handle:
+            handle.seek(start)
+            offset = start
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    # Another process is still writing this record.
+                    return
+                yield offset, offset + len(line), json.loads(line)
+                offset += len(line)
+
+    def _write_index(self, segment: Path) -> Dict[str, object]:
+        members: Dict[str, List[int]] = {}
+        first = last = None
+        count = 0
+        for offset, _end, entry in self._scan(segment):
+            first = first or entry["ts"]
+            last = entry["ts"]
+            count += 1
+            if entry.get("member"):
+                members.setdefault(entry["member"], []).append(offset)
+        index = {"first": first, "last": last, "count": count, "members": members}
+        atomic_write(self._index_path(segment), json.dumps(index, separators=(",", ":")))
+        return index
+
+    def _index(self, segment: Path) -> Dict[str, object]:
+        try:
+            with self._index_path(segment).open("r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            # Closed before its index was written (e.g. a crash mid-rotation).
+            return self._write_index(segment)
+
+    @staticmethod
+    def _read_at(segment: Path, offsets: List[int]) -> List[Dict[str, object]]:
+        entries = []
+        with segment.open("rb") as handle:
+            for offset in offsets:
+                handle.seek(offset)
+                entries.append(json.loads(handle.readline()))
+        return entries
+
+    def history(
+        self,
+        member: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, object]]:
+        """Matching records, oldest first; with limit, only the newest `limit` of them.
+
+        since/until are ISO timestamps or prefixes of one ("2025-10", "2025-10-14T09").
+        """
+
+        def wanted(entry: Dict[str, object]) -> bool:
+            return (
+                (member is None or entry.get("member") == member)
+                and (since is None or entry["ts"] >= since)
+                and (until is None or entry["ts"][: len(until)] <= until)
+            )
+
+        found: List[Dict[str, object]] = []
+        segments = self._segments()
+        for position, segment in enumerate(reversed(segments)):
+            if position == 0:
+                entries = [entry for _offset, _end, entry in self._scan(segment)]
+            else:
+                index = self._index(segment)
+                if not index["count"]:
+                    continue
+                if since is not None and index["last"] < since:
+                    break
+                if until is not None and index["first"][: len(until)] > until:
+                    continue
+                if member is not None:
+                    entries = self._read_at(segment, index["members"].get(member, []))
+                else:
+                    entries = [entry for _offset, _end, entry in self._scan(segment)]
+            found[:0] = [entry for entry in entries if wanted(entry)]
+            if limit is not None and len(found) >= limit:
+                break
+        return found[-limit:] if limit is not None else found
+
+    def position(self) -> Position:
+        segments = self._segments()
+        if not segments:
+            return ("", 0)
+        return (segments[-1].name, segments[-1].stat().st_size)
+
+    def read_since(self, position: Position) -> Tuple[List[Dict[str, object]], Position]:
+        """Records appended after position (by any process), and the position after them."""
+        name, start = position
+        entries: List[Dict[str, object]] = []
+        for segment in self._segments():
+            if segment.name < name:
+                continue
+            if segment.name > name:
+                name, start = segment.name, 0
+            for _offset, start, entry in self._scan(segment, start):
+                entries.append(entry)
+        return entries, (name, start)
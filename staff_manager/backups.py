@@ -0,0 +1,200 @@
+"""Deduplicated, compressed backups of generated pages.
+
+Each saved version is split into content-defined chunks of bytes. Chunks
+are stored once, zlib-compressed, under chunks/<sha256> and a small JSON
+manifest per version lists them in order:
+
+    backup_staff_pages/
+        chunks/3f/3fa4...e1
+        versions/20251014-195446-3fa4e1c2.json
+
+Chunk boundaries come from the bytes themselves, not from line breaks, so
+editing one staff card changes one or two chunks even in a minified page
+or compact JSON with no newlines at all: the store grows with the size of
+the edits rather than the number of generates. Old versions are pruned by
+count and/or age, and chunks nobody references any more are removed.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import hashlib
+import json
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .config import BACKUP_KEEP
+from .fileio import atomic_open, atomic_write
+from .utils import ensure_directory
+
+# Content-defined chunking on bytes: every byte maps to one of four symbols, and
+# each run of the symbols in CHUNK_CANDIDATE (found in C with a regex, at a few
+# percent of positions in HTML or JSON) is a candidate boundary. A candidate becomes
+# a boundary when the CRC of the CHUNK_WINDOW bytes before it matches
+# CHUNK_MASK, so boundaries depend only on nearby bytes and survive insertions
+# and deletions elsewhere. Chunks are MIN_CHUNK_BYTES to MAX_CHUNK_BYTES long
+# (about 4 KiB on average) whether or not the data has line breaks.
+CHUNK_SYMBOLS = bytes(hashlib.sha256(bytes([value])).digest()[0] & 3 for value in range(256))
+CHUNK_CANDIDATE = re.compile(b"\x00\x02")
+CHUNK_WINDOW = 32
+CHUNK_MASK = 0x7F
+MIN_CHUNK_BYTES = 1 << 10
+MAX_CHUNK_BYTES = 1 << 15
+LEGACY_TIMESTAMP = re.compile(r"(\d{8})[-_](\d{6})")
+
+
+def split_chunks(data: bytes) -> List[bytes]:
+    symbols = data.translate(CHUNK_SYMBOLS)
+    chunks: List[bytes] = []
+    start = 0
+    while start < len(data):
+        end = min(start + MAX_CHUNK_BYTES, len(data))
+        for candidate in CHUNK_CANDIDATE.finditer(symbols, start + MIN_CHUNK_BYTES, end):
+            cut = candidate.end()
+            if (zlib.crc32(data[cut - CHUNK_WINDOW:cut]) & CHUNK_MASK) == 0:
+                end = cut
+                break
+        chunks.append(data[start:end])
+        start = end
+    return chunks
+
+
+class BackupStore:
+    def __init__(self, root: Path, keep: Optional[int] = BACKUP_KEEP, max_age_days: Optional[float] = None):
+        self.root = root
+        self.chunk_dir = root / "chunks"
+        self.version_dir = root / "versions"
+        # Retention: newest `keep` versions per file, none older than max_age_days (None = no limit).
+        self.keep = keep
+        self.max_age_days = max_age_days
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunk_dir / digest[:2] / digest
+
+    def versions(self, name: Optional[str] = None) -> List[Dict[str, object]]:
+        """Manifests, oldest first, optionally only those for the file called name."""
+        manifests: List[Dict[str, object]] = []
+        if not self.version_dir.exists():
+            return manifests
+        for path in self.version_dir.glob("*.json"):
+            with path.open("r", encoding="utf-8") as handle:
+                manifest = json.load(handle)
+            if name is None or manifest["name"] == name:
+                manifests.append(manifest)
+        # Ids only have one-second resolution; "saved" keeps microseconds for ordering.
+        manifests.sort(key=lambda manifest: manifest["saved"])
+        return manifests
+
+    def save(self, name: str, data: bytes, saved: Optional[_dt.datetime] = None) -> Optional[str]:
+        """Store data as a new version of name; returns its id, or None if it matches the latest."""
+        digest = hashlib.sha256(data).hexdigest()
+        history = self.versions(name)
+        if history and history[-1]["sha256"] == digest:
+            return None
+        saved = saved or _dt.datetime.now()
+        chunk_ids: List[str] = []
+        stored = 0
+        for chunk in split_chunks(data):
+            chunk_id = hashlib.sha256(chunk).hexdigest()
+            chunk_ids.append(chunk_id)
+            path = self._chunk_path(chunk_id)
+            if not path.exists():
+                ensure_directory(path.parent)
+                packed = zlib.compress(chunk, 9)
+                # Atomic, so a chunk that exists is always complete and safe to reuse.
+                atomic_write(path, packed)
+                stored += len(packed)
+        version_id = f"{saved.strftime('%Y%m%d-%H%M%S')}-{digest[:8]}"
+        manifest = {
+            "id": version_id,
+            "name": name,
+            "saved": saved.isoformat(),
+            "size": len(data),
+            "stored": stored,
+            "sha256": digest,
+            "chunks": chunk_ids,
+        }
+        ensure_directory(self.version_dir)
+        with atomic_open(self.version_dir / f"{version_id}.json") as handle:
+            json.dump(manifest, handle, indent=2)
+        self.prune()
+        return version_id
+
+    def find(self, version_id: str) -> Dict[str, object]:
+        """Manifest for version_id; a unique prefix is enough."""
+        matches = [manifest for manifest in self.versions() if manifest["id"].startswith(version_id)]
+        if len(matches) != 1:
+            problem = "no backup" if not matches else "more than one backup"
+            raise ValueError(f"{problem} matches {version_id!r}")
+        return matches[0]
+
+    def read(self, version_id: str) -> bytes:
+        manifest = self.find(version_id)
+        data = b"".join(zlib.decompress(self._chunk_path(chunk).read_bytes()) for chunk in manifest["chunks"])
+        if hashlib.sha256(data).hexdigest() != manifest["sha256"]:
+            raise ValueError(f"backup {manifest['id']} is corrupt")
+        return data
+
+    def prune(self) -> int:
+        """Apply the retention policy; returns the number of versions removed."""
+        by_name: Dict[str, List[Dict[str, object]]] = {}
+        for manifest in self.versions():
+            by_name.setdefault(manifest["name"], []).append(manifest)
+        cutoff = None
+        if self.max_age_days is not None:
+            cutoff = _dt.datetime.now() - _dt.timedelta(days=self.max_age_days)
+        expired: List[str] = []
+        for history in by_name.values():
+            for index, manifest in enumerate(history):
+                too_many = self.keep is not None and index < len(history) - self.keep
+                too_old = cutoff is not None and _dt.datetime.fromisoformat(manifest["saved"]) < cutoff
+                if too_many or too_old:
+                    expired.append(manifest["id"])
+        for version_id in expired:
+            (self.version_dir / f"{version_id}.json").unlink()
+        if expired:
+            self._collect_garbage()
+        return len(expired)
+
+    def _collect_garbage(self) -> None:
+        live = {chunk for manifest in self.versions() for chunk in manifest["chunks"]}
+        for path in self.chunk_dir.glob("*/*"):
+            if path.name not in live:
+                path.unlink()
+
+    def import_files(self, paths: Iterable[Path]) -> List[str]:
+        """Move old full-copy backups (e.g. our-staff.20251014-195446.html) into the store.
+
+        The page name drops the timestamp; the time comes from the file or
+        folder name when it has one, otherwise from the file's mtime. Imported
+        files are deleted once stored.
+        """
+        paths = list(paths)
+        files: List[Path] = []
+        for path in paths:
+            files.extend(sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path])
+        # Importing the store's own folder picks up only the loose legacy copies.
+        files = [path for path in files if not {self.chunk_dir, self.version_dir} & set(path.parents)]
+        entries = []
+        for path in files:
+            match = LEGACY_TIMESTAMP.search(path.name) or LEGACY_TIMESTAMP.search(path.parent.name)
+            if match:
+                saved = _dt.datetime.strptime("".join(match.groups()), "%Y%m%d%H%M%S")
+            else:
+                saved = _dt.datetime.fromtimestamp(path.stat().st_mtime)
+            name = re.sub(r"\.\d{8}[-_]\d{6}(?=\.)", "", path.name)
+            entries.append((saved, name, path))
+        imported: List[str] = []
+        for saved, name, path in sorted(entries):
+            version_id = self.save(name, path.read_bytes(), saved=saved)
+            if version_id:
+                imported.append(version_id)
+            path.unlink()
+        for path in paths:
+            if path.is_dir():
+                for folder in sorted(path.rglob("*"), reverse=True) + [path]:
+                    if folder.is_dir() and not any(folder.iterdir()):
+                        folder.rmdir()
+        return imported
@@ -0,0 +1,253 @@
+"""Writing generated pages and the JSON feed, plus the load/render/write API."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import serialization
+from .backups import BackupStore
+from .compress import precompress, remove_compressed
+from .config import FEED_CHUNK_SIZE, SEGMENT_FIELDS, Site
+from .fileio import atomic_write
+from .minify import minify_html
+from .models import StaffDirectory, StaffMember
+from .profiling import PROFILER
+from .render import HTMLRenderer, media_warnings
+from .search import build_search_index
+from .sitemap import write_sitemap
+from .utils import ensure_directory
+
+
+def write_if_changed(path: Path, html: str) -> bool:
+    with PROFILER.span("write"):
+        if path.exists() and path.read_text(encoding="utf-8") == html:
+            return False
+        ensure_directory(path.parent)
+        atomic_write(path, html)
+        return True
+
+
+def backup_store(site: Optional[Site] = None) -> BackupStore:
+    site = site or Site()
+    return BackupStore(site.backup_dir, keep=site.backup_keep, max_age_days=site.backup_max_age_days)
+
+
+def write_staff_page(html: str, site: Optional[Site] = None) -> None:
+    site = site or Site()
+    page = site.output_page
+    with PROFILER.span("write"):
+        current = page.read_bytes() if page.exists() else None
+    if current is not None and current.decode("utf-8") == html:
+        print(f"{site.relative(page)} is already up to date")
+        precompress([page], site)
+        return
+    if current is not None:
+        with PROFILER.span("backup copy"):
+            version = backup_store(site).save(page.name, current)
+        if version:
+            print(f"Backed up existing page as {version} in {site.relative(site.backup_dir)}/")
+    with PROFILER.span("write"):
+        ensure_directory(page.parent)
+        atomic_write(page, html)
+    print(f"Wrote updated page to {site.relative(page)}")
+    precompress([page], site)
+
+
+def write_generated_pages(pages: Dict[Path, str], site: Optional[Site] = None) -> None:
+    """Write the secondary pages under our-staff/, skipping unchanged ones and pruning stale ones."""
+    site = site or Site()
+    managed = [f"{field_name}/*.html" for field_name in SEGMENT_FIELDS]
+    managed += [f"{category}/page-*.html" for category in StaffDirectory.categories]
+    for pattern in managed:
+        for stale in site.segment_dir.glob(pattern):
+            if stale not in pages:
+                stale.unlink()
+                remove_compressed(stale)
+                print(f"Removed stale page {site.relative(stale)}")
+    written = [path for path, html in pages.items() if write_if_changed(path, html)]
+    if written:
+        print(f"Wrote {len(written)} of {len(pages)} pages under {site.relative(site.segment_dir)}/")
+
+
+def write_profile_pages(pages: Dict[Path, str], site: Optional[Site] = None) -> None:
+    """Write the member pages our-staff/<id>.html, rewriting only those whose content hash changed.
+
+    data/profile-state.json keeps each page's SHA-256 and file stamp, so an
+    unchanged page costs a stat() rather than a read. Any other
+    our-staff/*.html (except index.html) belongs to a member who is no
+    longer in the directory and is deleted.
+    """
+    site = site or Site()
+    try:
+        with site.profile_state.open("r", encoding="utf-8") as handle:
+            state: Dict[str, Dict[str, object]] = json.load(handle)
+    except (FileNotFoundError, ValueError):
+        state = {}
+    seen: Dict[str, Dict[str, object]] = {}
+    written = 0
+    for path, html in pages.items():
+        name = site.relative(path)
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        previous = state.get(name)
+        try:
+            stat = path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+        except FileNotFoundError:
+            stamp = None
+        if previous and previous["sha256"] == digest and previous["stamp"] == stamp:
+            seen[name] = previous
+            continue
+        with PROFILER.span("write"):
+            ensure_directory(path.parent)
+            atomic_write(path, html)
+            stat = path.stat()
+        seen[name] = {"sha256": digest, "stamp": [stat.st_mtime_ns, stat.st_size]}
+        written += 1
+    # Prune from the folder, not the state file, which a fresh checkout does not have.
+    # Segment and pagination pages live in subfolders; index.html is the hand-written redirect.
+    for stale in site.segment_dir.glob("*.html"):
+        if stale not in pages and stale.name != "index.html":
+            stale.unlink()
+            remove_compressed(stale)
+            print(f"Removed stale page {site.relative(stale)}")
+    if seen != state:
+        ensure_directory(site.profile_state.parent)
+        atomic_write(site.profile_state, json.dumps(seen, indent=2, sort_keys=True) + "\n")
+    if written:
+        print(f"Wrote {written} of {len(pages)} member pages under {site.relative(site.segment_dir)}/")
+
+
+def profile_lastmod(directory: StaffDirectory, site: Optional[Site] = None) -> Dict[Path, str]:
+    """Each member page's sitemap <lastmod>: the member's last_modified."""
+    site = site or Site(directory.root)
+    return {
+        site.profile_page(member.id): member.last_modified
+        for category in directory.categories
+        for member in directory.list_staff(category)
+        if member.last_modified
+    }
+
+
+def build_staff_feed(
+    members_by_category: Dict[str, List[StaffMember]],
+    chunk_size: int = FEED_CHUNK_SIZE,
+    site: Optional[Site] = None,
+) -> Dict[Path, str]:
+    """Return the feed chunks plus manifest; chunk names carry a hash of their contents."""
+    site = site or Site()
+    files: Dict[Path, str] = {}
+    categories: Dict[str, object] = {}
+    for category, members in members_by_category.items():
+        chunk_names: List[str] = []
+        for start in range(0, len(members), chunk_size):
+            with PROFILER.span("feed build"):
+                payload = serialization.dumps(
+                    [member.to_dict() for member in members[start:start + chunk_size]], compact=True
+                )
+                digest = hashlib.sha256(payload).hexdigest()[:12]
+            name = f"{category}.{digest}.json"
+            files[site.feed_dir / name] = payload.decode("utf-8")
+            chunk_names.append(name)
+        categories[category] = {"total": len(members), "chunks": chunk_names}
+    manifest = {"version": 1, "chunk_size": chunk_size, "categories": categories}
+    files[site.feed_manifest] = serialization.dumps(manifest).decode("utf-8")
+    return files
+
+
+def write_staff_feed(files: Dict[Path, str], site: Optional[Site] = None) -> None:
+    site = site or Site()
+    if site.feed_dir.exists():
+        for stale in site.feed_dir.glob("*.json"):
+            if stale not in files:
+                stale.unlink()
+                remove_compressed(stale)
+    written = [path for path, payload in files.items() if write_if_changed(path, payload)]
+    chunks = len(files) - 1
+    print(
+        f"Staff feed: {chunks} chunks in {site.relative(site.feed_dir)}/ "
+        f"({len(written)} file(s) updated)"
+    )
+
+
+def load(site: Optional[Site] = None, read_only: bool = False, lazy: bool = False) -> StaffDirectory:
+    """Read the site's staff directory JSON (see StaffDirectory for read_only and lazy)."""
+    site = site or Site()
+    return StaffDirectory(site.data_path, root=site.root, read_only=read_only, lazy=lazy)
+
+
+def render(
+    directory: StaffDirectory,
+    site: Optional[Site] = None,
+    page_size: Optional[int] = None,
+    lazy: bool = False,
+    chunk_size: int = FEED_CHUNK_SIZE,
+    renderer: Optional[HTMLRenderer] = None,
+) -> Dict[Path, str]:
+    """Return every generated file (pages and JSON feed) keyed by output path, without writing.
+
+    Pass a long-lived renderer (built with the same page_size/lazy options) to
+    reuse its card cache between calls.
+    """
+    site = site or Site(directory.root)
+    renderer = renderer or HTMLRenderer(
+        directory, page_size=page_size, feed_chunk_size=chunk_size if lazy else None, site=site
+    )
+    outputs = renderer.render_site()
+    members = {category: directory.list_staff(category) for category in directory.categories}
+    outputs.update(build_staff_feed(members, chunk_size, site))
+    return outputs
+
+
+def write(
+    outputs: Dict[Path, str],
+    site: Optional[Site] = None,
+    lastmod: Optional[Dict[Path, str]] = None,
+    minify: bool = False,
+) -> None:
+    """Write the result of render(): backs up the main page, prunes stale pages and chunks, updates sitemap.xml.
+
+    lastmod (see profile_lastmod()) gives pages their own sitemap <lastmod>.
+    minify is the production build: pages are minified (the media warnings
+    comment goes too, so the warnings are printed instead). Every output gets
+    .gz/.br copies next to it (see compress.py).
+    """
+    site = site or Site()
+    if minify:
+        for warning in media_warnings(outputs[site.output_page]):
+            print(f"Media warning: {warning}")
+        with PROFILER.span("minify"):
+            outputs = {
+                path: minify_html(text) if path.suffix == ".html" else text for path, text in outputs.items()
+            }
+    pages = dict(outputs)
+    write_staff_page(pages.pop(site.output_page), site)
+    feed = {path: text for path, text in pages.items() if path.parent == site.feed_dir}
+    profiles = {path: text for path, text in pages.items() if path.parent == site.segment_dir}
+    write_generated_pages(
+        {path: text for path, text in pages.items() if path not in feed and path not in profiles}, site
+    )
+    write_profile_pages(profiles, site)
+    write_staff_feed(feed, site)
+    with PROFILER.span("write"):
+        if write_sitemap(outputs, site, lastmod):
+            print(f"Updated {site.relative(site.sitemap)}")
+    compressed = precompress(list(outputs) + [site.sitemap], site)
+    if compressed:
+        print(f"Precompressed {compressed} file(s)")
+
+
+def generate_site(
+    directory: StaffDirectory,
+    page_size: Optional[int] = None,
+    lazy: bool = False,
+    chunk_size: int = FEED_CHUNK_SIZE,
+    site: Optional[Site] = None,
+    minify: bool = False,
+) -> None:
+    site = site or Site(directory.root)
+    outputs = render(directory, site, page_size=page_size, lazy=lazy, chunk_size=chunk_size)
+    write(outputs, site, profile_lastmod(directory, site), minify=minify)
+    build_search_index(directory, site)
@@ -0,0 +1,632 @@
+"""Command-line entry point and the text-menu fallback for the staff manager."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .assets import fingerprint_assets, rewrite_pages
+from .audit import AuditLog, audit_dir
+from .build import backup_store, generate_site
+from .config import BACKUP_KEEP, FEED_CHUNK_SIZE, PROJECT_ROOT, Site
+from .daemon import default_socket_path, send_command, serve_daemon
+from .fileio import atomic_write
+from .links import check_links
+from .models import StaffDirectory, StaffMember, store_document_file, store_image_file
+from .profiling import PROFILER
+from .search import build_search_index
+from .utils import (
+    clean_list,
+    ensure_directory,
+    format_list,
+    iso_now,
+    normalize_phone,
+    print_rule,
+    slugify,
+    validate_email,
+    validate_url,
+)
+from .watch import watch_and_regenerate
+
+
+class StaffManagerCLI:
+    def __init__(self, directory: StaffDirectory):
+        self.directory = directory
+
+    def run(self) -> None:
+        while True:
+            print_rule("=")
+            print("People First Urgent Care — Staff Page Manager")
+            print_rule("=")
+            print("1) List staff")
+            print("2) Add staff member")
+            print("3) Edit staff member")
+            print("4) Remove staff member")
+            print("5) Attach documents")
+            print("6) Generate staff page")
+            print("7) Quit")
+            choice = input("Select an option: ").strip()
+            if choice == "1":
+                self.handle_list()
+            elif choice == "2":
+                self.handle_add()
+            elif choice == "3":
+                self.handle_edit()
+            elif choice == "4":
+                self.handle_remove()
+            elif choice == "5":
+                self.handle_attach_documents()
+            elif choice == "6":
+                self.handle_generate()
+            elif choice == "7":
+                print("Goodbye!")
+                break
+            else:
+                print("Invalid selection. Please try again.")
+
+    def handle_list(self) -> None:
+        category = self.prompt_category()
+        members = self.directory.list_staff(category)
+        if not members:
+            print(f"No {category} staff found.")
+            return
+        print_rule()
+        for member in members:
+            print(f"{member.name} — {member.title}")
+            print(f"  ID: {member.id}")
+            if member.specialties:
+                print(f"  Specialties: {format_list(member.specialties)}")
+            if member.email:
+                print(f"  Email: {member.email}")
+            if member.phone:
+                print(f"  Phone: {member.phone}")
+            print_rule()
+
+    def handle_add(self) -> None:
+        category = self.prompt_category()
+        print("Enter staff information. Leave blank to skip optional fields.")
+        details = self.prompt_member_details()
+        slug = slugify(details["name"])
+        if self.directory.find(category, slug):
+            print("A staff member with this name already exists. Please edit instead.")
+            return
+        member = StaffMember.from_dict({"id": slug, **details})
+        self.directory.upsert(category, member)
+        print(f"Added {member.name} to {category} staff.")
+
+    def handle_edit(self) -> None:
+        category = self.prompt_category()
+        slug = self.prompt_member_slug(category)
+        if not slug:
+            return
+        member = self.directory.find(category, slug)
+        if not member:
+            print("Staff member not found.")
+            return
+        print(f"Editing {member.name}. Press Enter to keep the current value.")
+        updated = self.prompt_member_details(existing=member)
+        member = StaffMember.from_dict({"id": slug, **updated})
+        self.directory.upsert(category, member)
+        print(f"Updated {member.name}.")
+
+    def handle_remove(self) -> None:
+        category = self.prompt_category()
+        slug = self.prompt_member_slug(category)
+        if not slug:
+            return
+        member = self.directory.find(category, slug)
+        if not member:
+            print("No staff member found with that ID.")
+            return
+        confirm = input(f"Type DELETE to remove {member.name}: ").strip()
+        if confirm != "DELETE":
+            print("Cancelled.")
+            return
+        if self.directory.remove(category, slug):
+            print(f"Removed {member.name}.")
+        else:
+            print("Could not remove member (not found).")
+
+    def handle_attach_documents(self) -> None:
+        category = self.prompt_category()
+        slug = self.prompt_member_slug(category)
+        if not slug:
+            return
+        member = self.directory.find(category, slug)
+        if not member:
+            print("Staff member not found.")
+            return
+        while True:
+            label = input("Document label (e.g., Curriculum Vitae) [blank to stop]: ").strip()
+            if not label:
+                break
+            doc_path = self.prompt_file_path("Path to document file")
+            if not doc_path:
+                print("Skipped document.")
+                continue
+            stored_path = store_document_file(self.directory, doc_path, member.id, suffix=slugify(label))
+            member.documents.append({"label": label, "path": stored_path})
+            member.last_modified = iso_now()
+            self.directory.upsert(category, member)
+            print(f"Attached document '{label}'.")
+
+    def handle_generate(self) -> None:
+        generate_site(self.directory)
+        if self.directory.audit:
+            self.directory.audit.record("generate", "Generated our-staff.html")
+        print("Staff page generated successfully.")
+
+    def prompt_category(self) -> str:
+        while True:
+            choice = input("Select category: [1] Medical, [2] Support: ").strip().lower()
+            if choice in ("1", "medical", "m"):
+                return "medical"
+            if choice in ("2", "support", "s"):
+                return "support"
+            print("Invalid choice. Please enter 1 or 2.")
+
+    def prompt_member_slug(self, category: str) -> Optional[str]:
+        members = self.directory.list_staff(category)
+        if not members:
+            print("No staff available.")
+            return None
+        for index, member in enumerate(members, start=1):
+            print(f"[{index}] {member.name} ({member.id})")
+        choice = input("Select a staff member by number or enter an ID: ").strip()
+        if not choice:
+            return None
+        if choice.isdigit():
+            idx = int(choice) - 1
+            if 0 <= idx < len(members):
+                return members[idx].id
+            print("Invalid number.")
+            return None
+        return choice
+
+    def prompt_member_details(self, existing: Optional[StaffMember] = None) -> Dict[str, object]:
+        def ask(prompt_text: str, default: str = "") -> str:
+            if default:
+                response = input(f"{prompt_text} [{default}]: ").strip()
+                return response or default
+            return input(f"{prompt_text}: ").strip()
+
+        name = ask("Full name", existing.name if existing else "")
+        while not name:
+            print("Name is required.")
+            name = input("Full name: ").strip()
+        title = ask("Title", existing.title if existing else "")
+        credentials = ask(
+            "Credentials (comma separated)",
+            format_list(existing.credentials) if existing and existing.credentials else "",
+        )
+        specialties = ask(
+            "Specialties (comma separated)",
+            format_list(existing.specialties) if existing and existing.specialties else "",
+        )
+        description = ask("Short bio/description", existing.description if existing else "")
+        experience = ask(
+            "Years of experience",
+            str(existing.experience_years) if existing and existing.experience_years is not None else "",
+        )
+        experience_years = int(experience) if experience.isdigit() else None
+        locations = ask(
+            "Primary clinic locations (comma separated)",
+            format_list(existing.locations) if existing and existing.locations else "",
+        )
+        languages = ask(
+            "Languages (comma separated)",
+            format_list(existing.languages) if existing and existing.languages else "",
+        )
+        education = ask("Education", existing.education if existing else "")
+        email = ask("Email", existing.email if existing else "")
+        while email and not validate_email(email):
+            print("Invalid email format.")
+            email = ask("Email", existing.email if existing else "")
+        phone = ask("Phone", existing.phone if existing else "")
+        phone = normalize_phone(phone) if phone else ""
+        linkedin = ask("LinkedIn URL", existing.linkedin if existing else "")
+        while linkedin and not validate_url(linkedin):
+            print("Invalid URL. Must start with http:// or https://")
+            linkedin = ask("LinkedIn URL", existing.linkedin if existing else "")
+        tags = ask(
+            "Highlight tags (comma separated)",
+            format_list(existing.tags) if existing and existing.tags else "",
+        )
+        featured_input = ask(
+            "Feature this provider? (y/N)",
+            "y" if existing and existing.featured else "n",
+        )
+        featured = featured_input.lower() in ("y", "yes")
+
+        image_path = existing.image if existing else ""
+        if ask("Update headshot image? (y/N)", "n").lower() in ("y", "yes"):
+            image_file = self.prompt_file_path("Path to image file")
+            if image_file:
+                image_path = store_image_file(self.directory, image_file, slugify(name))
+
+        documents = existing.documents[:] if existing else []
+        if ask("Update supporting documents? (y/N)", "n").lower() in ("y", "yes"):
+            documents = []
+            while True:
+                label = input("Document label (blank to finish): ").strip()
+                if not label:
+                    break
+                doc_src = self.prompt_file_path("Path to document file")
+                if not doc_src:
+                    print("No document selected, skipping.")
+                    continue
+                stored = store_document_file(
+                    self.directory, doc_src, slugify(name), suffix=slugify(label)
+                )
+                documents.append({"label": label, "path": stored})
+
+        return {
+            "name": name,
+            "title": title,
+            "credentials": clean_list(credentials),
+            "specialties": clean_list(specialties),
+            "description": description,
+            "experience_years": experience_years,
+            "locations": clean_list(locations),
+            "languages": clean_list(languages),
+            "education": education,
+            "email": email,
+            "phone": phone,
+            "linkedin": linkedin,
+            "image": image_path,
+            "documents": documents,
+            "tags": clean_list(tags),
+            "featured": featured,
+            "last_modified": iso_now(),
+        }
+
+    def prompt_file_path(self, prompt_text: str) -> Optional[Path]:
+        path_text = input(f"{prompt_text}: ").strip()
+        if not path_text:
+            return None
+        path = Path(path_text).expanduser()
+        if not path.exists():
+            print("File does not exist.")
+            return None
+        return path
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Manage the People First Urgent Care staff directory.")
+    parser.add_argument(
+        "--generate",
+        action="store_true",
+        help="Skip interaction and regenerate the staff page immediately.",
+    )
+    layout = parser.add_mutually_exclusive_group()
+    layout.add_argument(
+        "--page-size",
+        type=int,
+        metavar="N",
+        help="Split each staff grid into pages of N cards (featured staff stay on page one).",
+    )
+    layout.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Render only the first feed chunk of each grid and lazy-load the rest from the JSON feed.",
+    )
+    parser.add_argument(
+        "--feed-chunk",
+        type=int,
+        default=FEED_CHUNK_SIZE,
+        metavar="N",
+        help=f"Members per JSON feed chunk (default: {FEED_CHUNK_SIZE}).",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Production build: minify the generated pages and drop HTML comments.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Regenerate whenever the directory JSON, includes/ or media folders change.",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="Quiet period to wait for after a change before regenerating (default: 0.5).",
+    )
+    parser.add_argument(
+        "--sse-port",
+        type=int,
+        metavar="PORT",
+        help="With --watch, serve staff-updated Server-Sent Events on this local port.",
+    )
+    parser.add_argument(
+        "--json-format",
+        choices=("pretty", "compact"),
+        help="Rewrite data/staff_directory.json indented (pretty) or without whitespace (compact) and exit; later saves keep the choice.",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay running with warm caches and rebuild on commands sent to a local Unix socket.",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        metavar="PATH",
+        help="Daemon socket path (default: data/staff-manager.sock under the site root).",
+    )
+    parser.add_argument(
+        "--send",
+        metavar="JSON",
+        help='Send one command to a running daemon, e.g. \'{"command": "regenerate"}\', and print the reply.',
+    )
+    parser.add_argument(
+        "--search-index",
+        action="store_true",
+        help="Rebuild assets/search/index.json (re-parsing only changed pages) and exit.",
+    )
+    parser.add_argument(
+        "--fingerprint-assets",
+        action="store_true",
+        help="Give assets/css and assets/js content-hashed copies with year-long caching, point every page at them, and exit.",
+    )
+    parser.add_argument(
+        "--check-links",
+        action="store_true",
+        help="Check every local href/src in the published pages (re-checking only what changed) and exit; status 1 if any are broken.",
+    )
+    parser.add_argument(
+        "--history",
+        nargs="?",
+        const="",
+        metavar="MEMBER_ID",
+        help="Print the audit log of directory edits (optionally for one member) and exit.",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="DATE",
+        help="With --history, only records at or after DATE (ISO date or timestamp, e.g. 2025-10-14).",
+    )
+    parser.add_argument(
+        "--history-limit",
+        type=int,
+        default=50,
+        metavar="N",
+        help="With --history, show at most the newest N records (default: 50; 0 = all).",
+    )
+    backups = parser.add_mutually_exclusive_group()
+    backups.add_argument(
+        "--list-backups",
+        action="store_true",
+        help="List stored backups of the generated page and exit.",
+    )
+    backups.add_argument(
+        "--restore-backup",
+        metavar="VERSION",
+        help="Restore a backup (an id from --list-backups, or a unique prefix of one) and exit.",
+    )
+    backups.add_argument(
+        "--import-backups",
+        type=Path,
+        nargs="*",
+        metavar="PATH",
+        help="Move old full-copy backups (files or folders; default: loose copies in backup_staff_pages/) into the store.",
+    )
+    parser.add_argument(
+        "--restore-to",
+        type=Path,
+        metavar="PATH",
+        help="With --restore-backup, write here instead of over the original page.",
+    )
+    parser.add_argument(
+        "--backup-keep",
+        type=int,
+        default=BACKUP_KEEP,
+        metavar="N",
+        help=f"Backups to keep per page (default: {BACKUP_KEEP}; 0 = unlimited).",
+    )
+    parser.add_argument(
+        "--backup-max-age",
+        type=float,
+        metavar="DAYS",
+        help="Also drop backups older than DAYS.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-phase timing breakdown (load, hydrate, render, write...) when done.",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        metavar="PATH",
+        help="With profiling, also save a Chrome trace (*.json) or cProfile stats (any other name).",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        default=PROJECT_ROOT,
+        help="Site checkout to manage (default: the directory containing this script).",
+    )
+    parser.add_argument(
+        "--cli",
+        action="store_true",
+        help="Use the text-based menu instead of the GUI.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if not (args.profile or args.profile_output):
+        return run(args)
+
+    PROFILER.enable()
+    stats = None
+    if args.profile_output and args.profile_output.suffix != ".json":
+        import cProfile
+
+        stats = cProfile.Profile()
+        stats.enable()
+    try:
+        return run(args)
+    finally:
+        if stats:
+            stats.disable()
+            stats.dump_stats(args.profile_output)
+            print(f"Wrote cProfile stats to {args.profile_output} (view with python3 -m pstats)")
+        elif args.profile_output:
+            PROFILER.write_chrome_trace(args.profile_output)
+            print(f"Wrote Chrome trace to {args.profile_output}")
+        PROFILER.report()
+
+
+def run_backups(args: argparse.Namespace, site: Site) -> int:
+    store = backup_store(site)
+    if args.list_backups:
+        versions = store.versions()
+        if not versions:
+            print(f"No backups in {site.relative(site.backup_dir)}/")
+        for manifest in versions:
+            print(
+                f"{manifest['id']}  {manifest['saved'][:19]}  {manifest['name']:<24} "
+                f"{manifest['size']:>10,} bytes  (+{manifest['stored']:,} stored)"
+            )
+        return 0
+    if args.restore_backup:
+        manifest = store.find(args.restore_backup)
+        target = args.restore_to or site.root / manifest["name"]
+        data = store.read(manifest["id"])
+        if target.exists():
+            store.save(target.name, target.read_bytes())
+        ensure_directory(target.parent)
+        atomic_write(target, data)
+        print(f"Restored {manifest['id']} to {target}")
+        return 0
+    imported = store.import_files(args.import_backups or sorted(site.backup_dir.glob("*.html")))
+    print(f"Imported {len(imported)} backup(s) into {site.relative(site.backup_dir)}/")
+    return 0
+
+
+def show_history(args: argparse.Namespace, site: Site) -> int:
+    audit = AuditLog(audit_dir(site.data_path))
+    entries = audit.history(member=args.history or None, since=args.since, limit=args.history_limit or None)
+    if not entries:
+        print("No matching audit records.")
+        return 0
+    for entry in entries:
+        member = f" {entry['member']}" if entry.get("member") else ""
+        print(f"{entry['ts']}  {entry['action']}{member}: {entry['message']} ({entry['actor']}, {entry['source']})")
+        for field_name, (before, after) in entry.get("diff", {}).items():
+            print(f"    {field_name}: {before!r} -> {after!r}")
+    return 0
+
+
+def report_links(site: Site) -> int:
+    broken, counts = check_links(site)
+    for link in broken:
+        print(link)
+    print(
+        f"Checked {counts['references']} reference(s) to {counts['targets']} target(s) in {counts['pages']} page(s) "
+        f"({counts['parsed']} re-parsed): {len(broken)} broken"
+    )
+    return 1 if broken else 0
+
+
+def run(args: argparse.Namespace) -> int:
+    site = Site(
+        args.root,
+        backup_keep=args.backup_keep or None,
+        backup_max_age_days=args.backup_max_age,
+    )
+    if args.list_backups or args.restore_backup or args.import_backups is not None:
+        try:
+            return run_backups(args, site)
+        except ValueError as exc:
+            print(exc)
+            return 1
+    if args.history is not None:
+        return show_history(args, site)
+    if args.check_links:
+        return report_links(site)
+    if args.fingerprint_assets:
+        manifest = fingerprint_assets(site)
+        pages = rewrite_pages(site, manifest)
+        print(f"Fingerprinted {len(manifest)} asset(s); updated {len(pages)} page(s) and {site.relative(site.headers_file)}")
+        return 0
+    if args.send:
+        reply = send_command(args.socket or default_socket_path(site), json.loads(args.send))
+        print(json.dumps(reply))
+        return 0 if reply.get("ok") else 1
+
+    # Building never edits the directory, so those modes open it read-only and a build
+    # can run against a checkout it must not touch. The text menu shows one category
+    # at a time and only reads the others when it needs them.
+    building = (args.generate or args.watch or args.daemon or args.search_index) and not args.json_format
+    directory = StaffDirectory(
+        site.data_path,
+        root=site.root,
+        read_only=building and not args.daemon,
+        lazy=args.cli and not building,
+    )
+    if directory.audit:
+        directory.audit.source = "daemon" if args.daemon else "cli"
+
+    if args.json_format:
+        directory.data["meta"]["json_format"] = args.json_format
+        directory.save()
+        print(f"Saved {site.relative(directory.data_path)} in {args.json_format} format")
+        return 0
+
+    if args.search_index:
+        parsed = build_search_index(directory, site)
+        print(f"Updated {site.relative(site.search_index)} ({parsed} page(s) re-parsed)")
+        return 0
+
+    generate_options = {
+        "page_size": args.page_size,
+        "lazy": args.lazy,
+        "chunk_size": args.feed_chunk,
+        "minify": args.minify,
+    }
+    if args.daemon:
+        serve_daemon(directory, socket_path=args.socket, site=site, **generate_options)
+        return 0
+
+    if args.watch:
+        watch_and_regenerate(
+            directory,
+            debounce=args.debounce,
+            sse_port=args.sse_port,
+            site=site,
+            **generate_options,
+        )
+        return 0
+
+    if args.generate:
+        generate_site(directory, site=site, **generate_options)
+        return 0
+
+    ensure_directory(directory.image_dir)
+    ensure_directory(directory.document_dir)
+    if not args.cli:
+        # Tkinter is only imported here, so headless runs never pay for (or trip over) Tk.
+        try:
+            from . import gui
+        except ImportError:
+            print("Tkinter is not available; falling back to CLI.")
+        else:
+            try:
+                app = gui.StaffManagerGUI(directory)
+            except gui.tk.TclError as exc:
+                print(f"Cannot open the GUI ({exc}); falling back to CLI.")
+            else:
+                app.run()
+                return 0
+
+    manager = StaffManagerCLI(directory)
+    manager.run()
+    return 0
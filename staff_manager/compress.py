@@ -0,0 +1,111 @@
+"""Precompressed .gz/.br copies of generated files, for static hosts that serve them as-is.
+
+A host configured for it (nginx gzip_static/brotli_static, most CDNs)
+sends our-staff.html.br or .gz to browsers that accept it instead of
+compressing on every request. Copies are made at the highest levels, since
+they are written once and served many times, in a thread pool (zlib and
+brotli release the GIL). data/compress-state.json keeps each source's
+SHA-256 and file stamp, so a file is only recompressed when its bytes
+change. Brotli is optional: without the brotli package only .gz copies are
+written.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config import Site
+from .fileio import atomic_write
+from .profiling import PROFILER
+from .utils import ensure_directory
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSED_SUFFIXES = (".gz", ".br")
+# The copies this installation writes.
+ACTIVE_SUFFIXES = COMPRESSED_SUFFIXES if brotli else (".gz",)
+
+
+def compressed_path(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
+
+
+def compress(data: bytes) -> Dict[str, bytes]:
+    """suffix -> compressed bytes."""
+    # mtime=0 keeps the .gz bytes identical for identical input.
+    copies = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli:
+        copies[".br"] = brotli.compress(data, quality=11)
+    return copies
+
+
+def remove_compressed(path: Path) -> None:
+    for suffix in COMPRESSED_SUFFIXES:
+        compressed_path(path, suffix).unlink(missing_ok=True)
+
+
+def _has_copies(path: Path) -> bool:
+    return all(compressed_path(path, suffix).exists() for suffix in ACTIVE_SUFFIXES)
+
+
+def _refresh(path: Path, previous: Optional[Dict[str, object]]) -> Tuple[Dict[str, object], bool]:
+    """Hash path and rewrite its copies if the hash changed; returns its new state entry and whether it did."""
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    stale = not (previous and previous["sha256"] == digest and _has_copies(path))
+    if stale:
+        for suffix, payload in compress(data).items():
+            atomic_write(compressed_path(path, suffix), payload)
+        for suffix in set(COMPRESSED_SUFFIXES) - set(ACTIVE_SUFFIXES):
+            compressed_path(path, suffix).unlink(missing_ok=True)
+    stat = path.stat()
+    return {"stamp": [stat.st_mtime_ns, stat.st_size], "sha256": digest}, stale
+
+
+def precompress(paths: Iterable[Path], site: Optional[Site] = None, workers: Optional[int] = None) -> int:
+    """Bring the compressed copies of paths up to date; returns how many were recompressed.
+
+    A source whose mtime and size are unchanged is skipped without reading
+    it. Sources that no longer exist lose their copies.
+    """
+    site = site or Site()
+    try:
+        with site.compress_state.open("r", encoding="utf-8") as handle:
+            state: Dict[str, Dict[str, object]] = json.load(handle)
+    except (FileNotFoundError, ValueError):
+        state = {}
+    # Forget files deleted since (pruned pages and feed chunks).
+    updated = {name: entry for name, entry in state.items() if (site.root / name).exists()}
+    pending: List[Path] = []
+    for path in dict.fromkeys(paths):
+        name = site.relative(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            remove_compressed(path)
+            updated.pop(name, None)
+            continue
+        previous = state.get(name)
+        if previous and previous["stamp"] == [stat.st_mtime_ns, stat.st_size] and _has_copies(path):
+            continue
+        pending.append(path)
+    compressed = 0
+    if pending:
+        with PROFILER.span("compress"), ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            names = [site.relative(path) for path in pending]
+            for name, (entry, stale) in zip(names, pool.map(_refresh, pending, [state.get(name) for name in names])):
+                updated[name] = entry
+                compressed += stale
+    if updated != state:
+        ensure_directory(site.compress_state.parent)
+        atomic_write(site.compress_state, json.dumps(updated, indent=2, sort_keys=True) + "\n")
+    return compressed
@@ -0,0 +1,132 @@
+"""Default paths and the Site object that says where a site's data and output live."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+DEFAULT_DATA_PATH = DATA_DIR / "staff_directory.json"
+DEFAULT_IMAGE_DIR = PROJECT_ROOT / "assets" / "images" / "staff"
+DEFAULT_DOCUMENT_DIR = PROJECT_ROOT / "assets" / "files" / "staff"
+OUTPUT_PAGE = PROJECT_ROOT / "our-staff.html"
+SEGMENT_DIR = PROJECT_ROOT / "our-staff"
+BACKUP_DIR = PROJECT_ROOT / "backup_staff_pages"
+BACKUP_KEEP = 50
+# Seconds StaffDirectory.save() waits for another process's write lock.
+LOCK_TIMEOUT = 10.0
+FEED_DIR = PROJECT_ROOT / "assets" / "data" / "staff-feed"
+FEED_MANIFEST = FEED_DIR / "manifest.json"
+FEED_CHUNK_SIZE = 24
+PLACEHOLDER_IMAGE = "assets/images/healthcare-team-professional.jpg"
+INCLUDES_DIR = PROJECT_ROOT / "includes"
+SITE_URL = "https://www.peoplefirsturgentcare.com"
+DEFAULT_DESCRIPTION = "Meet the dedicated healthcare professionals at People First Urgent Care."
+
+# Folders (relative to the site root) whose CSS/JS get content-hashed copies for long-lived caching.
+FINGERPRINT_DIRS = ("assets/css", "assets/js")
+# Served with Cache-Control: public, max-age=31536000, immutable.
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+# Bios longer than this are cut to an excerpt on the staff cards; the full text is on the member's page.
+CARD_BIO_LIMIT = 160
+
+# StaffMember list fields that get their own small landing pages under our-staff/<field>/.
+SEGMENT_FIELDS = {"locations": "Location", "specialties": "Specialty"}
+
+
+@dataclass
+class Site:
+    """One site checkout: its data file and every generated output path.
+
+    Paths left as None default to the standard layout under root, so
+    Site(Path("/srv/branch-a")) describes a full copy of this project.
+    """
+
+    root: Path = PROJECT_ROOT
+    data_path: Optional[Path] = None
+    output_page: Optional[Path] = None
+    segment_dir: Optional[Path] = None
+    backup_dir: Optional[Path] = None
+    feed_dir: Optional[Path] = None
+    includes_dir: Optional[Path] = None
+    site_url: str = SITE_URL
+    # Backup retention for generated pages: versions kept per page, and maximum age.
+    backup_keep: Optional[int] = BACKUP_KEEP
+    backup_max_age_days: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root).resolve()
+        self.data_path = Path(self.data_path or self.root / "data" / "staff_directory.json")
+        self.output_page = Path(self.output_page or self.root / "our-staff.html")
+        self.segment_dir = Path(self.segment_dir or self.root / "our-staff")
+        self.backup_dir = Path(self.backup_dir or self.root / "backup_staff_pages")
+        self.feed_dir = Path(self.feed_dir or self.root / "assets" / "data" / "staff-feed")
+        self.includes_dir = Path(self.includes_dir or self.root / "includes")
+
+    @property
+    def feed_manifest(self) -> Path:
+        return self.feed_dir / "manifest.json"
+
+    @property
+    def profile_state(self) -> Path:
+        """Content hash and file stamp of each member page, so unchanged ones are not rewritten."""
+        return self.data_path.parent / "profile-state.json"
+
+    @property
+    def compress_state(self) -> Path:
+        """Source hash and file stamp of each precompressed output, so unchanged files are not recompressed."""
+        return self.data_path.parent / "compress-state.json"
+
+    @property
+    def page_manifest(self) -> Path:
+        """Globs of the hand-written pages the scripts/ transforms run over."""
+        return self.root / "scripts" / "transform-pages.json"
+
+    @property
+    def transform_state(self) -> Path:
+        """Hash and file stamp of each page after its last transform run, so unchanged pages are skipped."""
+        return self.data_path.parent / "transform-state.json"
+
+    def profile_page(self, member_id: str) -> Path:
+        """A member's own page, our-staff/<id>.html."""
+        return self.segment_dir / f"{member_id}.html"
+
+    @property
+    def sitemap(self) -> Path:
+        return self.root / "sitemap.xml"
+
+    @property
+    def sitemap_state(self) -> Path:
+        """Content hash and change time of each sitemap page, for <lastmod>."""
+        return self.data_path.parent / "sitemap-state.json"
+
+    @property
+    def search_index(self) -> Path:
+        return self.root / "assets" / "search" / "index.json"
+
+    @property
+    def search_cache(self) -> Path:
+        """Per-page hashes and entries, so the search index only re-parses changed pages."""
+        return self.data_path.parent / "search-cache.json"
+
+    @property
+    def link_cache(self) -> Path:
+        """Per-page references and per-folder target results, so --check-links only re-checks what changed."""
+        return self.data_path.parent / "link-cache.json"
+
+    @property
+    def asset_manifest(self) -> Path:
+        """Original -> fingerprinted asset paths written by --fingerprint-assets."""
+        return self.root / "assets" / "asset-manifest.json"
+
+    @property
+    def headers_file(self) -> Path:
+        """Netlify _headers file giving the fingerprinted assets their long cache lifetime."""
+        return self.root / "_headers"
+
+    def relative(self, path: Path) -> str:
+        """Path relative to the site root, for status messages and URLs."""
+        return path.relative_to(self.root).as_posix()
@@ -0,0 +1,218 @@
+"""--daemon: keep the directory and rendered cards warm and rebuild on request over a Unix socket.
+
+Each connection sends one JSON object per line and gets one JSON reply per line:
+
+    {"command": "regenerate"}
+    {"command": "upsert", "category": "medical", "member": {"id": "jane-smith", "name": "Jane Smith", ...}}
+    {"command": "remove", "id": "jane-smith"}
+    {"command": "reload"}
+    {"command": "status"}
+    {"command": "shutdown"}
+
+Replies look like {"ok": true, "written": 2, "elapsed_ms": 3.1} or
+{"ok": false, "error": "..."}. Commands are handled one at a time, so a
+burst of CMS hooks never interleaves writes; a connection that sends
+nothing for IDLE_TIMEOUT seconds is closed so it cannot hold up the rest.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .build import profile_lastmod, render, write
+from .config import FEED_CHUNK_SIZE, Site
+from .models import StaffDirectory, StaffMember
+from .render import HTMLRenderer
+from .search import build_search_index
+
+# Seconds a connection may wait between request lines before the daemon hangs up.
+IDLE_TIMEOUT = 10.0
+
+
+def default_socket_path(site: Site) -> Path:
+    return site.data_path.parent / "staff-manager.sock"
+
+
+class StaffDaemon:
+    """Owns one warm StaffDirectory and HTMLRenderer and turns commands into rebuilds."""
+
+    def __init__(
+        self,
+        directory: StaffDirectory,
+        site: Optional[Site] = None,
+        page_size: Optional[int] = None,
+        lazy: bool = False,
+        chunk_size: int = FEED_CHUNK_SIZE,
+        minify: bool = False,
+    ):
+        self.directory = directory
+        self.site = site or Site(directory.root)
+        self.chunk_size = chunk_size
+        self.minify = minify
+        self.renderer = HTMLRenderer(
+            directory,
+            page_size=page_size,
+            feed_chunk_size=chunk_size if lazy else None,
+            site=self.site,
+            keep_card_cache=True,
+        )
+        # Last outputs written, so a rebuild that changes nothing skips the filesystem entirely.
+        self.outputs: Dict[Path, str] = {}
+        self.data_stamp = self._stat_data()
+        self.running = True
+
+    def _stat_data(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.directory.data_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self) -> None:
+        """Reload the JSON (and drop every cached card) if something else rewrote it."""
+        stamp = self._stat_data()
+        if stamp != self.data_stamp:
+            self.directory.load()
+            self.renderer.forget_cards()
+            self.data_stamp = self._stat_data()
+
+    def _saved(self, version_before: Optional[int] = None) -> None:
+        self.data_stamp = self._stat_data()
+        if version_before is not None and self.directory.version != version_before + 1:
+            # save() merged in records another process wrote, so any card may be stale.
+            self.renderer.forget_cards()
+
+    def regenerate(self) -> Dict[str, object]:
+        outputs = render(self.directory, self.site, chunk_size=self.chunk_size, renderer=self.renderer)
+        changed = [path for path, text in outputs.items() if self.outputs.get(path) != text]
+        if changed or set(outputs) != set(self.outputs):
+            write(outputs, self.site, profile_lastmod(self.directory, self.site), minify=self.minify)
+            # After the first build only the pages this rebuild wrote can have new search entries.
+            build_search_index(self.directory, self.site, changed=changed if self.outputs else None)
+        self.outputs = outputs
+        return {"written": len(changed)}
+
+    def handle(self, request: Dict[str, object]) -> Dict[str, object]:
+        command = request.get("command")
+        if command == "shutdown":
+            self.running = False
+            return {}
+        if command == "status":
+            counts = {category: self.directory.count(category) for category in self.directory.categories}
+            return {"members": counts, "cached_cards": len(self.renderer._card_cache)}
+        self._refresh()
+        version = self.directory.version
+        if command == "reload":
+            self.directory.load()
+            self.renderer.forget_cards()
+            self._saved()
+        elif command == "upsert":
+            category = request.get("category")
+            if category not in self.directory.categories:
+                raise ValueError(f"category must be one of {', '.join(self.directory.categories)}")
+            data = request.get("member")
+            if not isinstance(data, dict) or not data.get("name"):
+                raise ValueError("member must be an object with at least a name")
+            member = StaffMember.from_dict(data)
+            self.directory.upsert_many([(category, member)])
+            self._saved(version)
+            self.renderer.forget_cards([member.id])
+        elif command == "remove":
+            member_id = str(request.get("id", ""))
+            removed = [
+                category for category in self.directory.categories if self.directory.remove(category, member_id)
+            ]
+            if not removed:
+                raise ValueError(f"no staff member with id {member_id!r}")
+            self._saved(version)
+            self.renderer.forget_cards([member_id])
+        elif command != "regenerate":
+            raise ValueError(f"unknown command {command!r}")
+        return self.regenerate()
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    timeout = IDLE_TIMEOUT
+
+    def handle(self) -> None:
+        try:
+            self._serve()
+        except TimeoutError:
+            pass
+
+    def _serve(self) -> None:
+        daemon: StaffDaemon = self.server.daemon
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            start = time.perf_counter()
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+                reply = {"ok": True, **daemon.handle(request)}
+            except Exception as exc:
+                # A malformed member payload surfaces as TypeError/KeyError; reply rather than drop the connection.
+                reply = {"ok": False, "error": str(exc) if isinstance(exc, (OSError, ValueError)) else f"{type(exc).__name__}: {exc}"}
+            reply["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if not daemon.running:
+                return
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path, daemon: StaffDaemon):
+        self.daemon = daemon
+        super().__init__(str(socket_path), _CommandHandler)
+
+
+def serve_daemon(
+    directory: StaffDirectory,
+    socket_path: Optional[Path] = None,
+    site: Optional[Site] = None,
+    **generate_options: object,
+) -> None:
+    """Build once, then rebuild on commands from socket_path until shutdown or Ctrl+C."""
+    site = site or Site(directory.root)
+    socket_path = socket_path or default_socket_path(site)
+    if socket_path.exists():
+        # Refuse to steal the socket from a daemon that is still answering.
+        try:
+            send_command(socket_path, {"command": "status"}, timeout=2.0)
+        except OSError:
+            socket_path.unlink()
+        else:
+            raise OSError(f"a daemon is already listening on {socket_path}")
+    daemon = StaffDaemon(directory, site=site, **generate_options)
+    daemon.regenerate()
+    server = _DaemonServer(socket_path, daemon)
+    os.chmod(socket_path, 0o600)
+    print(f"Daemon listening on {socket_path} (Ctrl+C to stop)...")
+    try:
+        while daemon.running:
+            server.handle_request()
+    except KeyboardInterrupt:
+        print("\nDaemon stopped.")
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def send_command(socket_path: Path, request: Dict[str, object], timeout: float = 30.0) -> Dict[str, object]:
+    """Send one request to a running daemon and return its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as replies:
+            line = replies.readline()
+    if not line:
+        raise OSError(f"no reply from daemon on {socket_path}")
+    return json.loads(line)
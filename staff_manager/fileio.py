@@ -0,0 +1,138 @@
+"""Atomic file replacement shared by every writer in the project.
+
+Readers (the web server serving our-staff.html, a second manager process)
+see either the old file or the new one, never a truncated mix: data goes to a
+temporary file in the target's directory, is fsynced, and os.replace() swaps
+it in. The scripts/ tools import this module too. file_lock() serializes
+writers across processes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import secrets
+import shutil
+import time
+from pathlib import Path
+from typing import IO, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def fsync_directory(path: Path) -> None:
+    """Persist renames in path (a no-op where directories cannot be opened, e.g. Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def atomic_open(
+    path: Union[str, Path],
+    mode: str = "w",
+    *,
+    backup: Optional[Union[str, Path]] = None,
+    sync_dir: bool = False,
+    encoding: Optional[str] = "utf-8",
+) -> Iterator[IO]:
+    """Open a temp file that replaces path when the block exits cleanly.
+
+    The new file keeps the permissions of the one it replaces (or the usual
+    umask default). backup, if given, becomes a hard link to the previous
+    file, so keeping the old version costs a rename rather than a copy.
+    sync_dir also fsyncs the directory so the rename itself survives a crash.
+    If the block raises, the temp file is removed and path is untouched.
+    """
+    if mode not in ("w", "wb"):
+        raise ValueError("atomic_open only supports 'w' and 'wb'")
+    path = Path(path)
+    temp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, mode, encoding=None if "b" in mode else encoding) as handle:
+            yield handle
+            handle.flush()
+            os.fsync(handle.fileno())
+        try:
+            os.chmod(temp, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        if backup is not None and path.exists():
+            _link_or_copy(path, Path(backup))
+        os.replace(temp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp)
+        raise
+    if sync_dir:
+        fsync_directory(path.parent)
+
+
+def atomic_write(
+    path: Union[str, Path],
+    data: Union[str, bytes],
+    *,
+    backup: Optional[Union[str, Path]] = None,
+    sync_dir: bool = False,
+) -> None:
+    with atomic_open(path, "wb" if isinstance(data, bytes) else "w", backup=backup, sync_dir=sync_dir) as handle:
+        handle.write(data)
+
+
+def atomic_copy(source: Union[str, Path], target: Union[str, Path]) -> None:
+    """shutil.copy2 that never leaves a half-copied target behind."""
+    with open(source, "rb") as reader, atomic_open(target, "wb") as handle:
+        shutil.copyfileobj(reader, handle)
+        handle.flush()
+        shutil.copystat(source, handle.name)
+
+
+@contextlib.contextmanager
+def file_lock(path: Union[str, Path], timeout: float = 10.0, poll: float = 0.05) -> Iterator[None]:
+    """Hold an exclusive lock on path (created if missing) for the block.
+
+    Raises TimeoutError if another process keeps it for longer than timeout
+    seconds. The lock is advisory: only writers that also take it are
+    serialized, and readers never need it because writes are atomic.
+    """
+    deadline = time.monotonic() + timeout
+    with open(path, "a+b") as handle:
+        while True:
+            try:
+                if fcntl:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"timed out after {timeout:g}s waiting for {path}") from None
+                time.sleep(poll)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
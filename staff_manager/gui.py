@@ -0,0 +1,774 @@
+"""
+Tkinter GUI for the staff page manager.
+
+Imported lazily by staff_manager.cli.run() so headless runs (--generate,
+--cli, --watch) never load Tk.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from pathlib import Path
+from tkinter import filedialog, messagebox, simpledialog, ttk
+from typing import Dict, List, Optional
+
+from .audit import Position
+from .build import generate_site
+from .fileio import atomic_copy
+from .models import StaffDirectory, StaffMember, store_document_file, store_image_file
+from .utils import (
+    clean_list,
+    format_list,
+    iso_now,
+    normalize_phone,
+    slugify,
+    validate_email,
+    validate_url,
+)
+
+BRAND_PRIMARY = "#05A65C"
+BRAND_PRIMARY_DARK = "#048A4F"
+BRAND_DARK = "#0D3B33"
+BRAND_TEXT = "#1F2933"
+BRAND_MUTED = "#4A5568"
+BRAND_BG = "#F5F8F7"
+CARD_BG = "#FFFFFF"
+BORDER_COLOR = "#DCE4E1"
+FONT_BASE = ("Helvetica Neue", 11)
+FONT_LABEL = ("Helvetica Neue", 11)
+FONT_HEADING = ("Helvetica Neue", 14, "bold")
+# Activity log rows kept in the listbox; older history stays in data/audit/.
+AUDIT_ROWS = 50
+
+
+class ScrollableFrame(ttk.Frame):
+    def __init__(self, parent: tk.Widget, style: str = "Card.TFrame", **kwargs):
+        super().__init__(parent, style=style, **kwargs)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(
+            self,
+            background=CARD_BG,
+            highlightthickness=0,
+            bd=0,
+        )
+        self.v_scroll = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self.v_scroll.set)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.v_scroll.grid(row=0, column=1, sticky="ns")
+
+        self.content = ttk.Frame(self.canvas, style=style)
+        self.content.columnconfigure(0, weight=1)
+        self._window = self.canvas.create_window((0, 0), window=self.content, anchor="nw")
+
+        self.content.bind("<Configure>", self._on_frame_configure)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self._bind_scroll_events(self.canvas)
+        self._bind_scroll_events(self.content)
+
+    def _on_frame_configure(self, event: tk.Event) -> None:
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _on_canvas_configure(self, event: tk.Event) -> None:
+        width = event.width
+        self.canvas.itemconfigure(self._window, width=width)
+
+    def _bind_scroll_events(self, widget: tk.Widget) -> None:
+        widget.bind("<MouseWheel>", self._on_mousewheel, add="+")
+        widget.bind("<Button-4>", self._on_mousewheel, add="+")
+        widget.bind("<Button-5>", self._on_mousewheel, add="+")
+
+    def _on_mousewheel(self, event: tk.Event) -> None:
+        if getattr(event, "num", None) == 5 or event.delta < 0:
+            self.canvas.yview_scroll(1, "units")
+        elif getattr(event, "num", None) == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-1, "units")
+
+
+class StaffManagerGUI:
+    def __init__(self, directory: StaffDirectory):
+        self.directory = directory
+        self.root = tk.Tk()
+        self.root.title("People First Urgent Care — Staff Manager")
+        self.root.report_callback_exception = self._report_callback_exception
+        self.root.geometry("1200x720")
+        self.root.minsize(1100, 650)
+
+        self.style: Optional[ttk.Style] = None
+        self.category_var = tk.StringVar(value="medical")
+        self.name_var = tk.StringVar()
+        self.title_var = tk.StringVar()
+        self.credentials_var = tk.StringVar()
+        self.specialties_var = tk.StringVar()
+        self.experience_var = tk.StringVar()
+        self.locations_var = tk.StringVar()
+        self.languages_var = tk.StringVar()
+        self.education_var = tk.StringVar()
+        self.email_var = tk.StringVar()
+        self.phone_var = tk.StringVar()
+        self.linkedin_var = tk.StringVar()
+        self.tags_var = tk.StringVar()
+        self.image_var = tk.StringVar()
+        self.featured_var = tk.BooleanVar(value=False)
+        self.status_var = tk.StringVar(value="Ready.")
+
+        self.status_label: Optional[ttk.Label] = None
+        self._pending_status_style = "Status.TLabel"
+        self.current_slug: Optional[str] = None
+        self.document_data: List[Dict[str, str]] = []
+        self.current_members: List[StaffMember] = []
+        self.audit_listbox: Optional[tk.Listbox] = None
+        # End of the shared audit log as last shown in the listbox.
+        self.audit_position: Position = ("", 0)
+        if self.directory.audit:
+            self.directory.audit.source = "gui"
+
+        self._configure_theme()
+
+        self._build_ui()
+        self.refresh_staff_list()
+        self._load_audit_rows()
+
+    def run(self) -> None:
+        self.root.mainloop()
+
+    def _report_callback_exception(self, exc_type, exc, traceback) -> None:
+        # Most often another admin or a --generate run holding the directory lock too long.
+        if isinstance(exc, TimeoutError):
+            messagebox.showerror("Directory busy", f"{exc}. Please try again.")
+            self.set_status("Save failed: the directory is locked by another process.", error=True)
+            return
+        tk.Tk.report_callback_exception(self.root, exc_type, exc, traceback)
+
+    def _configure_theme(self) -> None:
+        self.root.configure(background=BRAND_BG)
+        style = ttk.Style(self.root)
+        try:
+            style.theme_use("clam")
+        except tk.TclError:
+            pass
+
+        self.root.option_add("*Font", FONT_BASE)
+
+        style.configure(".", background=BRAND_BG, foreground=BRAND_TEXT, font=FONT_BASE)
+        style.configure("Main.TFrame", background=BRAND_BG)
+        style.configure("Sidebar.TFrame", background=CARD_BG)
+        style.configure("SidebarHeader.TLabel", background=CARD_BG, foreground=BRAND_PRIMARY, font=("Helvetica Neue", 12, "bold"))
+        style.configure("Card.TFrame", background=CARD_BG)
+        style.configure("Card.TLabelframe", background=CARD_BG, borderwidth=1, relief="solid")
+        style.configure("Card.TLabelframe.Label", background=CARD_BG, foreground=BRAND_DARK, font=FONT_HEADING)
+        style.configure("CardLabel.TLabel", background=CARD_BG, foreground=BRAND_MUTED, font=FONT_LABEL)
+        style.configure("Card.TEntry", fieldbackground=CARD_BG, foreground=BRAND_TEXT)
+        style.map("Card.TEntry", fieldbackground=[("focus", "#FFFFFF")])
+        style.configure("Card.TCombobox", fieldbackground=CARD_BG, background=CARD_BG, foreground=BRAND_TEXT)
+        style.map("Card.TCombobox", fieldbackground=[("focus", "#FFFFFF")])
+        style.configure("Card.TCheckbutton", background=CARD_BG, foreground=BRAND_TEXT, font=FONT_LABEL)
+        style.configure("Accent.TButton", background=BRAND_PRIMARY, foreground="#FFFFFF", padding=(12, 6), font=("Helvetica Neue", 11, "bold"), borderwidth=0)
+        style.map("Accent.TButton", background=[("active", BRAND_PRIMARY_DARK), ("disabled", "#A0AEC0")])
+        style.configure("Secondary.TButton", background="#E2E8F0", foreground=BRAND_DARK, padding=(12, 6), font=FONT_LABEL, borderwidth=0)
+        style.map("Secondary.TButton", background=[("active", "#CBD5E1")])
+        style.configure("Danger.TButton", background="#E53E3E", foreground="#FFFFFF", padding=(12, 6), font=FONT_LABEL, borderwidth=0)
+        style.map("Danger.TButton", background=[("active", "#C53030")])
+        style.configure("Status.TLabel", background=BRAND_PRIMARY, foreground="#FFFFFF", font=FONT_LABEL, padding=(12, 6))
+        style.configure("StatusWarning.TLabel", background="#C05621", foreground="#FFFFFF", font=FONT_LABEL, padding=(12, 6))
+
+        self.root.option_add("*TCombobox*Listbox*Font", FONT_BASE)
+        self.root.option_add("*TCombobox*Listbox*Background", CARD_BG)
+        self.root.option_add("*TCombobox*Listbox*Foreground", BRAND_TEXT)
+        self.style = style
+
+    def _build_ui(self) -> None:
+        main_frame = ttk.Frame(self.root, padding=16, style="Main.TFrame")
+        main_frame.pack(fill="both", expand=True)
+        main_frame.columnconfigure(0, weight=1, uniform="cols")
+        main_frame.columnconfigure(1, weight=2, uniform="cols")
+        main_frame.rowconfigure(0, weight=1)
+
+        # Left pane: category and staff list
+        left = ttk.Frame(main_frame, style="Sidebar.TFrame", padding=16)
+        left.grid(row=0, column=0, sticky="nsew", padx=(0, 12))
+        left.rowconfigure(2, weight=1)
+
+        ttk.Label(left, text="Staff Category", style="SidebarHeader.TLabel").grid(row=0, column=0, sticky="w")
+        category_combo = ttk.Combobox(
+            left,
+            textvariable=self.category_var,
+            values=("medical", "support"),
+            state="readonly",
+            style="Card.TCombobox",
+        )
+        category_combo.grid(row=1, column=0, sticky="ew", pady=(4, 12))
+        category_combo.bind("<<ComboboxSelected>>", lambda event: self.on_category_change())
+
+        list_frame = ttk.Frame(left, style="Card.TFrame", borderwidth=1, relief="solid")
+        list_frame.grid(row=2, column=0, sticky="nsew")
+        list_frame.rowconfigure(0, weight=1)
+        list_frame.columnconfigure(0, weight=1)
+
+        self.staff_listbox = tk.Listbox(list_frame, exportselection=False)
+        self.staff_listbox.grid(row=0, column=0, sticky="nsew")
+        self.staff_listbox.bind("<<ListboxSelect>>", self.on_select_staff)
+        self.staff_listbox.configure(
+            bg=CARD_BG,
+            fg=BRAND_TEXT,
+            selectbackground=BRAND_PRIMARY,
+            selectforeground="#FFFFFF",
+            highlightthickness=1,
+            highlightcolor=BORDER_COLOR,
+            highlightbackground=BORDER_COLOR,
+            relief="flat",
+            borderwidth=0,
+        )
+
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.staff_listbox.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.staff_listbox.configure(yscrollcommand=scrollbar.set)
+
+        button_frame = ttk.Frame(left, style="Sidebar.TFrame")
+        button_frame.grid(row=3, column=0, sticky="ew", pady=(12, 0))
+        button_frame.columnconfigure(0, weight=1)
+        button_frame.columnconfigure(1, weight=1)
+        ttk.Button(button_frame, text="New Staff", command=self.clear_form, style="Accent.TButton").grid(row=0, column=0, sticky="ew", pady=4, padx=(0, 6))
+        ttk.Button(button_frame, text="Duplicate", command=self.duplicate_member, style="Secondary.TButton").grid(row=0, column=1, sticky="ew", pady=4)
+        ttk.Button(button_frame, text="Delete", command=self.delete_member, style="Danger.TButton").grid(row=1, column=0, sticky="ew", pady=4, padx=(0, 6))
+        ttk.Button(button_frame, text="Generate Page", command=self.generate_page, style="Accent.TButton").grid(row=1, column=1, sticky="ew", pady=4)
+
+        # Right pane: form
+        right = ttk.Frame(main_frame, style="Main.TFrame")
+        right.grid(row=0, column=1, sticky="nsew")
+        right.columnconfigure(0, weight=1)
+        right.rowconfigure(0, weight=1)
+        right.rowconfigure(1, weight=0)
+
+        form_scroll = ScrollableFrame(right, style="Card.TFrame")
+        form_scroll.grid(row=0, column=0, sticky="nsew", pady=(0, 12))
+        form_scroll.content.columnconfigure(0, weight=1)
+
+        form = ttk.LabelFrame(form_scroll.content, text="Staff Details", padding=16, style="Card.TLabelframe")
+        form.grid(row=0, column=0, sticky="nsew")
+        for col in range(2):
+            form.columnconfigure(col, weight=1)
+
+        row = 0
+        self._add_labeled_entry(form, "Full Name *", self.name_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Title", self.title_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Credentials (comma separated)", self.credentials_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Specialties (comma separated)", self.specialties_var, row)
+        row += 1
+
+        ttk.Label(form, text="Short Bio / Description", style="CardLabel.TLabel").grid(row=row, column=0, sticky="nw", pady=(6, 2))
+        self.description_text = tk.Text(form, height=6, wrap="word")
+        self.description_text.grid(row=row, column=1, sticky="ew", pady=(6, 2))
+        self.description_text.configure(
+            bg=CARD_BG,
+            fg=BRAND_TEXT,
+            insertbackground=BRAND_PRIMARY,
+            highlightcolor=BRAND_PRIMARY,
+            highlightbackground=BORDER_COLOR,
+            highlightthickness=1,
+            borderwidth=0,
+            relief="flat",
+            padx=6,
+            pady=6,
+        )
+        row += 1
+
+        self._add_labeled_entry(form, "Years of Experience", self.experience_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Primary Clinic Locations", self.locations_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Languages", self.languages_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Education", self.education_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Email", self.email_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Phone", self.phone_var, row)
+        row += 1
+        self._add_labeled_entry(form, "LinkedIn URL", self.linkedin_var, row)
+        row += 1
+        self._add_labeled_entry(form, "Highlight Tags", self.tags_var, row)
+        row += 1
+
+        # Image selector
+        ttk.Label(form, text="Headshot Image", style="CardLabel.TLabel").grid(row=row, column=0, sticky="w", pady=(6, 2))
+        image_frame = ttk.Frame(form, style="Card.TFrame")
+        image_frame.grid(row=row, column=1, sticky="ew", pady=(6, 2))
+        image_frame.columnconfigure(0, weight=1)
+        image_entry = ttk.Entry(image_frame, textvariable=self.image_var, state="readonly", style="Card.TEntry")
+        image_entry.grid(row=0, column=0, sticky="ew")
+        ttk.Button(image_frame, text="Choose…", command=self.choose_image, style="Secondary.TButton").grid(row=0, column=1, padx=(6, 0))
+        row += 1
+
+        featured_check = ttk.Checkbutton(
+            form, text="Featured Provider", variable=self.featured_var, style="Card.TCheckbutton"
+        )
+        featured_check.grid(row=row, column=1, sticky="w", pady=(6, 2))
+        row += 1
+
+        # Documents list
+        ttk.Label(form, text="Documents", style="CardLabel.TLabel").grid(row=row, column=0, sticky="nw", pady=(6, 2))
+        docs_frame = ttk.Frame(form, style="Card.TFrame")
+        docs_frame.grid(row=row, column=1, sticky="nsew", pady=(6, 2))
+        docs_frame.columnconfigure(0, weight=1)
+        docs_frame.rowconfigure(0, weight=1)
+
+        self.document_listbox = tk.Listbox(docs_frame, height=4)
+        self.document_listbox.grid(row=0, column=0, sticky="nsew")
+        self.document_listbox.configure(
+            bg=CARD_BG,
+            fg=BRAND_TEXT,
+            selectbackground=BRAND_PRIMARY,
+            selectforeground="#FFFFFF",
+            highlightthickness=1,
+            highlightbackground=BORDER_COLOR,
+            highlightcolor=BORDER_COLOR,
+            relief="flat",
+            borderwidth=0,
+        )
+        doc_scroll = ttk.Scrollbar(docs_frame, orient="vertical", command=self.document_listbox.yview)
+        doc_scroll.grid(row=0, column=1, sticky="ns")
+        self.document_listbox.configure(yscrollcommand=doc_scroll.set)
+
+        doc_button_frame = ttk.Frame(docs_frame, style="Card.TFrame")
+        doc_button_frame.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(6, 0))
+        ttk.Button(doc_button_frame, text="Add Document", command=self.add_document, style="Secondary.TButton").grid(row=0, column=0, sticky="ew")
+        ttk.Button(doc_button_frame, text="Remove Selected", command=self.remove_document, style="Danger.TButton").grid(row=0, column=1, sticky="ew", padx=(6, 0))
+        doc_button_frame.columnconfigure(0, weight=1)
+        doc_button_frame.columnconfigure(1, weight=1)
+        row += 1
+
+        action_row = ttk.Frame(form, style="Card.TFrame")
+        action_row.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(12, 0))
+        ttk.Button(action_row, text="Save Changes", command=self.save_member, style="Accent.TButton").grid(row=0, column=0, sticky="ew")
+        ttk.Button(action_row, text="Export JSON Only", command=self.export_json_only, style="Secondary.TButton").grid(row=0, column=1, sticky="ew", padx=(6, 0))
+        ttk.Button(action_row, text="Generate Page Now", command=self.generate_page, style="Accent.TButton").grid(row=0, column=2, sticky="ew")
+        action_row.columnconfigure(0, weight=1)
+        action_row.columnconfigure(1, weight=1)
+        action_row.columnconfigure(2, weight=1)
+
+        log_frame = ttk.LabelFrame(right, text="Activity Log", padding=12, style="Card.TLabelframe")
+        log_frame.grid(row=1, column=0, sticky="nsew", pady=(16, 0))
+        log_frame.columnconfigure(0, weight=1)
+        log_frame.rowconfigure(0, weight=1)
+
+        self.audit_listbox = tk.Listbox(log_frame, height=6)
+        self.audit_listbox.grid(row=0, column=0, sticky="nsew")
+        self.audit_listbox.configure(
+            bg=CARD_BG,
+            fg=BRAND_MUTED,
+            selectbackground=BRAND_PRIMARY,
+            selectforeground="#FFFFFF",
+            highlightthickness=1,
+            highlightbackground=BORDER_COLOR,
+            highlightcolor=BORDER_COLOR,
+            relief="flat",
+            borderwidth=0,
+        )
+        audit_scroll = ttk.Scrollbar(log_frame, orient="vertical", command=self.audit_listbox.yview)
+        audit_scroll.grid(row=0, column=1, sticky="ns")
+        self.audit_listbox.configure(yscrollcommand=audit_scroll.set)
+
+        self.status_label = ttk.Label(self.root, textvariable=self.status_var, anchor="w", style="Status.TLabel")
+        self.status_label.pack(fill="x", padx=16, pady=(0, 8))
+        if self._pending_status_style:
+            self.status_label.configure(style=self._pending_status_style)
+            self._pending_status_style = "Status.TLabel"
+
+    def _add_labeled_entry(self, parent: ttk.Frame, label: str, variable: tk.StringVar, row: int) -> None:
+        ttk.Label(parent, text=label, style="CardLabel.TLabel").grid(row=row, column=0, sticky="w", pady=(6, 2))
+        entry = ttk.Entry(parent, textvariable=variable, style="Card.TEntry")
+        entry.grid(row=row, column=1, sticky="ew", pady=(6, 2))
+
+    def set_status(self, message: str, error: bool = False) -> None:
+        style_name = "StatusWarning.TLabel" if error else "Status.TLabel"
+        prefix = "⚠ " if error else ""
+        if self.status_label is not None:
+            self.status_label.configure(style=style_name)
+        else:
+            self._pending_status_style = style_name
+        self.status_var.set(f"{prefix}{message}")
+
+    def refresh_staff_list(self, select_slug: Optional[str] = None) -> None:
+        category = self.category_var.get()
+        self.current_members = self.directory.list_staff(category)
+        self.staff_listbox.delete(0, tk.END)
+        for member in self.current_members:
+            label = f"{member.name} — {member.title}" if member.title else member.name
+            self.staff_listbox.insert(tk.END, label)
+        if select_slug:
+            for idx, member in enumerate(self.current_members):
+                if member.id == select_slug:
+                    self.staff_listbox.selection_clear(0, tk.END)
+                    self.staff_listbox.selection_set(idx)
+                    self.staff_listbox.activate(idx)
+                    self.staff_listbox.see(idx)
+                    self.load_member(member)
+                    break
+
+    def on_category_change(self) -> None:
+        self.clear_form()
+        self.refresh_staff_list()
+
+    def on_select_staff(self, _event: object) -> None:
+        selection = self.staff_listbox.curselection()
+        if not selection:
+            return
+        member = self.current_members[selection[0]]
+        self.load_member(member)
+
+    def load_member(self, member: StaffMember) -> None:
+        self.current_slug = member.id
+        self.name_var.set(member.name)
+        self.title_var.set(member.title)
+        self.credentials_var.set(format_list(member.credentials))
+        self.specialties_var.set(format_list(member.specialties))
+        self.description_text.delete("1.0", tk.END)
+        self.description_text.insert("1.0", member.description.strip())
+        self.experience_var.set("" if member.experience_years is None else str(member.experience_years))
+        self.locations_var.set(format_list(member.locations))
+        self.languages_var.set(format_list(member.languages))
+        self.education_var.set(member.education)
+        self.email_var.set(member.email)
+        self.phone_var.set(member.phone)
+        self.linkedin_var.set(member.linkedin)
+        self.tags_var.set(format_list(member.tags))
+        self.image_var.set(member.image)
+        self.featured_var.set(member.featured)
+        self.document_data = [dict(doc) for doc in member.documents]
+        self._refresh_document_list()
+        self.set_status(f"Loaded {member.name}.")
+
+    def clear_form(self) -> None:
+        self.current_slug = None
+        self.staff_listbox.selection_clear(0, tk.END)
+        self.name_var.set("")
+        self.title_var.set("")
+        self.credentials_var.set("")
+        self.specialties_var.set("")
+        self.description_text.delete("1.0", tk.END)
+        self.experience_var.set("")
+        self.locations_var.set("")
+        self.languages_var.set("")
+        self.education_var.set("")
+        self.email_var.set("")
+        self.phone_var.set("")
+        self.linkedin_var.set("")
+        self.tags_var.set("")
+        self.image_var.set("")
+        self.featured_var.set(False)
+        self.document_data = []
+        self._refresh_document_list()
+        self.set_status("Ready.")
+
+    def collect_form_data(self) -> Optional[Dict[str, object]]:
+        name = self.name_var.get().strip()
+        if not name:
+            messagebox.showerror("Validation error", "Name is required.")
+            return None
+        slug_candidate = self.current_slug or slugify(name)
+        email = self.email_var.get().strip()
+        if email and not validate_email(email):
+            messagebox.showerror("Validation error", "Email address is not valid.")
+            return None
+        linkedin = self.linkedin_var.get().strip()
+        if linkedin and not validate_url(linkedin):
+            messagebox.showerror("Validation error", "LinkedIn URL must start with http:// or https://")
+            return None
+        experience = self.experience_var.get().strip()
+        experience_years: Optional[int] = None
+        if experience:
+            if experience.isdigit():
+                experience_years = int(experience)
+            else:
+                messagebox.showerror("Validation error", "Years of experience must be a whole number.")
+                return None
+
+        description = self.description_text.get("1.0", tk.END).strip()
+        phone = normalize_phone(self.phone_var.get().strip()) if self.phone_var.get().strip() else ""
+
+        try:
+            image_path = self._ensure_image_asset(self.image_var.get().strip(), slug_candidate)
+        except ValueError:
+            return None
+
+        try:
+            documents = self._ensure_document_assets(slug_candidate)
+        except ValueError:
+            return None
+
+        return {
+            "name": name,
+            "title": self.title_var.get().strip(),
+            "credentials": clean_list(self.credentials_var.get()),
+            "specialties": clean_list(self.specialties_var.get()),
+            "description": description,
+            "experience_years": experience_years,
+            "locations": clean_list(self.locations_var.get()),
+            "languages": clean_list(self.languages_var.get()),
+            "education": self.education_var.get().strip(),
+            "email": email,
+            "phone": phone,
+            "linkedin": linkedin,
+            "image": image_path,
+            "documents": documents,
+            "tags": clean_list(self.tags_var.get()),
+            "featured": bool(self.featured_var.get()),
+            "last_modified": iso_now(),
+        }
+
+    def save_member(self) -> None:
+        data = self.collect_form_data()
+        if not data:
+            return
+        category = self.category_var.get()
+        slug = self.current_slug or slugify(data["name"])  # type: ignore[arg-type]
+        existing = self.directory.find(category, slug)
+        if existing and self.current_slug is None:
+            overwrite = messagebox.askyesno(
+                "Overwrite existing record",
+                "A staff member with this name already exists. Update the existing record?",
+            )
+            if not overwrite:
+                return
+        member = StaffMember.from_dict({"id": slug, **data})
+        self.directory.upsert(category, member)
+        self.current_slug = slug
+        self.refresh_staff_list(select_slug=slug)
+        self.set_status(f"Saved {member.name}.")
+        messagebox.showinfo("Staff saved", f"{member.name} has been saved.")
+        self._append_audit_rows()
+
+    def delete_member(self) -> None:
+        if not self.current_slug:
+            messagebox.showinfo("No selection", "Please select a staff member to delete.")
+            return
+        category = self.category_var.get()
+        member = self.directory.find(category, self.current_slug)
+        if not member:
+            messagebox.showerror("Not found", "The selected staff member could not be located.")
+            return
+        confirm = messagebox.askyesno(
+            "Confirm delete", f"Remove {member.name} from the directory?"
+        )
+        if not confirm:
+            return
+        if self.directory.remove(category, member.id):
+            self.clear_form()
+            self.refresh_staff_list()
+            self.set_status(f"Removed {member.name}.")
+            messagebox.showinfo("Deleted", f"{member.name} has been removed.")
+            self._append_audit_rows()
+
+    def choose_image(self) -> None:
+        if filedialog is None:
+            return
+        if not self.name_var.get().strip():
+            messagebox.showerror("Missing name", "Enter the staff member's name before choosing an image.")
+            return
+        file_path = filedialog.askopenfilename(
+            title="Select headshot image",
+            filetypes=(
+                ("Image files", "*.jpg *.jpeg *.png *.webp *.gif"),
+                ("All files", "*.*"),
+            ),
+        )
+        if not file_path:
+            return
+        slug = self.current_slug or slugify(self.name_var.get())
+        stored = store_image_file(self.directory, Path(file_path), slug)
+        self.image_var.set(stored)
+        self.set_status("Image saved.")
+        self.log_audit(f"Updated headshot for {self.name_var.get().strip() or slug}", "image", member=slug)
+
+    def add_document(self) -> None:
+        if filedialog is None or simpledialog is None:
+            return
+        if not self.name_var.get().strip():
+            messagebox.showerror("Missing name", "Enter the staff member's name before adding documents.")
+            return
+        label = simpledialog.askstring("Document Label", "Document label:")
+        if not label:
+            return
+        file_path = filedialog.askopenfilename(
+            title="Select document",
+            filetypes=(
+                ("PDF files", "*.pdf"),
+                ("Word documents", "*.doc *.docx"),
+                ("All files", "*.*"),
+            ),
+        )
+        if not file_path:
+            return
+        slug = self.current_slug or slugify(self.name_var.get())
+        stored = store_document_file(self.directory, Path(file_path), slug, suffix=slugify(label))
+        self.document_data.append({"label": label, "path": stored})
+        self._refresh_document_list()
+        self.set_status(f"Added document '{label}'.")
+        self.log_audit(f"Attached document '{label}'", "document", member=slug)
+
+    def remove_document(self) -> None:
+        selection = self.document_listbox.curselection()
+        if not selection:
+            messagebox.showinfo("No selection", "Select a document to remove.")
+            return
+        idx = selection[0]
+        doc = self.document_data[idx]
+        confirm = messagebox.askyesno(
+            "Remove document", f"Remove '{doc['label']}' from this staff member?"
+        )
+        if not confirm:
+            return
+        del self.document_data[idx]
+        self._refresh_document_list()
+        self.set_status(f"Removed document '{doc['label']}'.")
+        self.log_audit(f"Removed document '{doc['label']}'", "document", member=self.current_slug)
+
+    def _refresh_document_list(self) -> None:
+        self.document_listbox.delete(0, tk.END)
+        for doc in self.document_data:
+            self.document_listbox.insert(tk.END, f"{doc['label']} ({doc['path']})")
+
+    def generate_page(self) -> None:
+        generate_site(self.directory)
+        messagebox.showinfo("Generation complete", "our-staff.html has been regenerated.")
+        self.set_status("Staff page generated.")
+        self.log_audit("Generated our-staff.html", "generate")
+
+    def duplicate_member(self) -> None:
+        if not self.current_slug:
+            messagebox.showinfo("No selection", "Select a staff member to duplicate.")
+            return
+        category = self.category_var.get()
+        member = self.directory.find(category, self.current_slug)
+        if not member:
+            messagebox.showerror("Not found", "Unable to locate the selected staff member.")
+            return
+        base_name = f"{member.name} (Copy)"
+        new_name = base_name
+        suffix = 1
+        new_slug = slugify(new_name)
+        while self.directory.find(category, new_slug):
+            suffix += 1
+            new_name = f"{base_name} {suffix}"
+            new_slug = slugify(new_name)
+        member_dict = member.to_dict()
+        member_dict["id"] = new_slug
+        member_dict["name"] = new_name
+        member_dict["last_modified"] = iso_now()
+        duplicate = StaffMember.from_dict(member_dict)
+        self.directory.upsert(category, duplicate)
+        self.refresh_staff_list(select_slug=new_slug)
+        self.set_status(f"Duplicated {member.name}.")
+        self._append_audit_rows()
+
+    def export_json_only(self) -> None:
+        self.directory.save()
+        if filedialog is None:
+            messagebox.showinfo("Export complete", "Directory saved to default JSON file.")
+            self.log_audit("Exported staff_directory.json", "export")
+            return
+        target = filedialog.asksaveasfilename(
+            title="Export staff directory JSON",
+            defaultextension=".json",
+            initialfile="staff_directory.json",
+            filetypes=(("JSON files", "*.json"), ("All files", "*.*")),
+        )
+        if not target:
+            self.set_status("Export cancelled.")
+            return
+        atomic_copy(self.directory.data_path, Path(target))
+        messagebox.showinfo("Export complete", f"Directory exported to {target}.")
+        self.set_status("Exported directory JSON.")
+        self.log_audit(f"Exported staff directory to {target}", "export")
+
+    def log_audit(self, message: str, action: str = "note", member: Optional[str] = None) -> None:
+        """Record a GUI action that is not a directory edit (those are logged by StaffDirectory)."""
+        audit = self.directory.audit
+        if audit is None:
+            self._show_audit_rows([{"ts": iso_now(), "message": message}])
+            return
+        audit.record(action, message, member=member, category=self.category_var.get() if member else None)
+        self._append_audit_rows()
+
+    def _load_audit_rows(self) -> None:
+        audit = self.directory.audit
+        if audit is None:
+            return
+        self.audit_position = audit.position()
+        self._show_audit_rows(audit.history(limit=AUDIT_ROWS))
+
+    def _append_audit_rows(self) -> None:
+        """Show records appended since the last call, including those from other processes."""
+        audit = self.directory.audit
+        if audit is None:
+            return
+        entries, self.audit_position = audit.read_since(self.audit_position)
+        self._show_audit_rows(entries)
+
+    def _show_audit_rows(self, entries: List[Dict[str, object]]) -> None:
+        if self.audit_listbox is None or not entries:
+            return
+        for entry in entries:
+            row = f"[{str(entry['ts'])[11:19]}] {entry['message']}"
+            if entry.get("source", "gui") != "gui":
+                row += f" ({entry['source']}, {entry['actor']})"
+            self.audit_listbox.insert(tk.END, row)
+        excess = self.audit_listbox.size() - AUDIT_ROWS
+        if excess > 0:
+            self.audit_listbox.delete(0, excess - 1)
+        self.audit_listbox.see(tk.END)
+
+    def _ensure_image_asset(self, path_str: str, slug: str) -> str:
+        if not path_str:
+            return ""
+        project_path = self.directory.root / path_str
+        if project_path.exists():
+            try:
+                rel = project_path.relative_to(self.directory.root)
+            except ValueError:
+                rel = path_str
+            else:
+                rel = str(rel)
+            self.image_var.set(rel)
+            return rel
+        candidate = Path(path_str).expanduser()
+        if not candidate.exists():
+            messagebox.showerror("File not found", f"The image file '{path_str}' could not be located.")
+            self.set_status("Image file not found; please choose a valid file.", error=True)
+            raise ValueError("Image missing")
+        stored = store_image_file(self.directory, candidate, slug)
+        self.image_var.set(stored)
+        self.log_audit(f"Copied headshot to {stored}")
+        return stored
+
+    def _ensure_document_assets(self, slug: str) -> List[Dict[str, str]]:
+        updated: List[Dict[str, str]] = []
+        for doc in self.document_data:
+            label = doc.get("label", "Document")
+            path_str = doc.get("path", "")
+            if not path_str:
+                continue
+            project_path = self.directory.root / path_str
+            if project_path.exists():
+                try:
+                    rel = project_path.relative_to(self.directory.root)
+                    rel_path = str(rel)
+                except ValueError:
+                    rel_path = path_str
+                updated.append({"label": label, "path": rel_path})
+                continue
+            candidate = Path(path_str).expanduser()
+            if not candidate.exists():
+                messagebox.showerror("File not found", f"The document '{label}' could not be located at '{path_str}'.")
+                self.set_status(f"Document '{label}' not found; please reattach.", error=True)
+                raise ValueError("Document missing")
+            stored = store_document_file(self.directory, candidate, slug, suffix=slugify(label))
+            updated.append({"label": label, "path": stored})
+            self.log_audit(f"Copied document '{label}' to {stored}")
+        self.document_data = updated
+        return updated
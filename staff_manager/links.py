@@ -0,0 +1,258 @@
+"""Link and asset integrity check for every published page (--check-links).
+
+Each page is streamed through html.parser once for its local references
+(href, src, srcset, poster and object data) and the ids it defines. The
+references form a graph of target -> referring pages, and every target is
+checked against a listing of its folder, one os.scandir() per folder.
+Reported problems:
+
+- missing: the file does not exist (a folder counts if it has an index.html);
+- missing anchor: page.html#id where page.html defines no such id or name;
+- outside site: the path climbs above the site root.
+
+External URLs (http:, mailto:, tel:, //host ...) are not fetched. Partials
+(files with no <html>, <head> or <body>, e.g. includes/header.html) resolve
+from the site root, where they are injected, and their same-page #fragments
+are not checked.
+
+data/link-cache.json keeps each page's references and ids with its SHA-256
+and file stamp, and the result of every target with the mtime of its
+folder, so a re-run only re-parses pages whose bytes changed and only
+re-lists folders whose entries changed. A run with nothing changed just
+stats the pages and folders.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import os
+import posixpath
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+from . import serialization
+from .assets import site_pages
+from .config import Site
+from .fileio import atomic_write
+from .profiling import PROFILER
+from .utils import ensure_directory
+
+READ_CHUNK = 1 << 16
+CACHE_VERSION = 1
+# Attributes holding one URL, and those holding a srcset candidate list.
+URL_ATTRIBUTES = {"href", "src", "poster", "data"}
+SRCSET_ATTRIBUTES = {"srcset"}
+# Values that are filled in at runtime rather than real paths.
+TEMPLATE_MARKERS = ("{{", "${", "<?", "%7B%7B")
+
+
+class ReferenceExtractor(HTMLParser):
+    """Collects one page's local references and the ids it defines as it is fed."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        # [url, line]
+        self.references: List[List[object]] = []
+        self.ids: Set[str] = set()
+        self.partial = True
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        line = self.getpos()[0]
+        if tag in ("html", "head", "body"):
+            self.partial = False
+        for name, value in attrs:
+            if not value:
+                continue
+            if name == "id" or (name == "name" and tag == "a"):
+                self.ids.add(value)
+            elif name in URL_ATTRIBUTES:
+                self._add(value, line)
+            elif name in SRCSET_ATTRIBUTES:
+                for candidate in value.split(","):
+                    if candidate.strip():
+                        self._add(candidate.split()[0], line)
+
+    handle_startendtag = handle_starttag
+
+    def _add(self, url: str, line: int) -> None:
+        url = url.strip()
+        if is_local(url):
+            self.references.append([url, line])
+
+
+def is_local(url: str) -> bool:
+    """Whether url points into this site (not another host, a data: URI or a template placeholder)."""
+    if not url or url == "#" or url.startswith("//") or any(marker in url for marker in TEMPLATE_MARKERS):
+        return False
+    return not urlsplit(url).scheme
+
+
+@dataclass
+class BrokenLink:
+    page: str
+    line: int
+    url: str
+    target: str
+    problem: str
+
+    def __str__(self) -> str:
+        return f"{self.page}:{self.line}: {self.problem}: {self.url}"
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(READ_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_references(path: Path) -> ReferenceExtractor:
+    parser = ReferenceExtractor()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(READ_CHUNK), b""):
+            parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser
+
+
+def resolve(page: str, url: str, partial: bool = False) -> Tuple[Optional[str], str]:
+    """(target path relative to the root, fragment) for a reference on page.
+
+    The target is "" for a fragment on the same page and None when the
+    path climbs out of the site. Partials resolve from the root.
+    """
+    parts = urlsplit(url)
+    path = unquote(parts.path)
+    if not path:
+        return "", parts.fragment
+    base = "" if path.startswith("/") or partial else posixpath.dirname(page)
+    target = posixpath.normpath(posixpath.join(base, path.lstrip("/")))
+    if target == ".." or target.startswith("../"):
+        return None, parts.fragment
+    if path.endswith("/") or target == ".":
+        target = posixpath.join(target, "index.html") if target != "." else "index.html"
+    return target, parts.fragment
+
+
+def _load_cache(path: Path) -> Dict[str, Dict[str, object]]:
+    try:
+        cache = serialization.loads(path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) and cache.get("version") == CACHE_VERSION else {}
+
+
+def _folder_entries(folder: Path) -> Dict[str, bool]:
+    """name -> whether it is a folder, for everything in folder ({} if it does not exist)."""
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def check_targets(
+    site: Site, targets: Set[str], cached: Dict[str, Dict[str, object]]
+) -> Tuple[Dict[str, bool], Dict[str, Dict[str, object]]]:
+    """(target -> exists, new folder cache); folders whose mtime is unchanged reuse their cached results."""
+    by_folder: Dict[str, Set[str]] = {}
+    for target in targets:
+        by_folder.setdefault(posixpath.dirname(target), set()).add(target)
+    exists: Dict[str, bool] = {}
+    folders: Dict[str, Dict[str, object]] = {}
+    for folder, folder_targets in by_folder.items():
+        try:
+            mtime = (site.root / folder).stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            mtime = None
+        previous = cached.get(folder)
+        # target -> True, False, or "folder" for a subfolder (served through its index page)
+        results: Dict[str, object] = {}
+        if previous and previous["mtime"] == mtime:
+            results = {target: found for target, found in previous["targets"].items() if target in folder_targets}
+        unknown = folder_targets.difference(results)
+        if unknown:
+            entries = _folder_entries(site.root / folder) if mtime is not None else {}
+            for target in unknown:
+                name = posixpath.basename(target)
+                results[target] = "folder" if entries.get(name) else name in entries
+        for target, found in results.items():
+            # A subfolder's index page can come and go without touching this folder's mtime.
+            exists[target] = (site.root / target / "index.html").is_file() if found == "folder" else found
+        folders[folder] = {"mtime": mtime, "targets": results}
+    return exists, folders
+
+
+def check_links(site: Optional[Site] = None) -> Tuple[List[BrokenLink], Dict[str, int]]:
+    """Every broken local reference in the published pages, and counts for the summary."""
+    site = site or Site()
+    cache = _load_cache(site.link_cache)
+    cached_pages: Dict[str, Dict[str, object]] = cache.get("pages", {})
+    pages: Dict[str, Dict[str, object]] = {}
+    parsed = 0
+    with PROFILER.span("check links"):
+        for path in site_pages(site):
+            name = site.relative(path)
+            stat = path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            previous = cached_pages.get(name)
+            if previous and previous["stamp"] == stamp:
+                pages[name] = previous
+                continue
+            digest = _hash_file(path)
+            if previous and previous["sha256"] == digest:
+                pages[name] = {**previous, "stamp": stamp}
+                continue
+            extractor = extract_references(path)
+            pages[name] = {
+                "stamp": stamp,
+                "sha256": digest,
+                "references": extractor.references,
+                "ids": sorted(extractor.ids),
+                "partial": extractor.partial,
+            }
+            parsed += 1
+
+        # target -> [(page, line, url, fragment)]
+        graph: Dict[Optional[str], List[Tuple[str, int, str, str]]] = {}
+        for name, page in pages.items():
+            for url, line in page["references"]:
+                target, fragment = resolve(name, url, page["partial"])
+                if target == "":
+                    if page["partial"]:
+                        # The fragment belongs to whichever page includes the partial.
+                        continue
+                    target = name
+                graph.setdefault(target, []).append((name, line, url, fragment))
+
+        exists, folders = check_targets(site, {target for target in graph if target}, cache.get("folders", {}))
+        ids = {name: set(page["ids"]) for name, page in pages.items()}
+        broken: List[BrokenLink] = []
+        for target, references in graph.items():
+            for page, line, url, fragment in references:
+                if target is None:
+                    broken.append(BrokenLink(page, line, url, "", "outside site"))
+                elif not exists.get(target, True):
+                    broken.append(BrokenLink(page, line, url, target, "missing"))
+                elif fragment and target in ids and fragment not in ids[target]:
+                    broken.append(BrokenLink(page, line, url, target, "missing anchor"))
+        broken.sort(key=lambda link: (link.page, link.line, link.url))
+
+        updated = {"version": CACHE_VERSION, "pages": pages, "folders": folders}
+        if updated != cache:
+            ensure_directory(site.link_cache.parent)
+            atomic_write(site.link_cache, serialization.dumps(updated, compact=True))
+    counts = {
+        "pages": len(pages),
+        "parsed": parsed,
+        "references": sum(len(references) for references in graph.values()),
+        "targets": len(graph),
+    }
+    return broken, counts
@@ -0,0 +1,108 @@
+"""Whitespace, comment and quote stripping for generated HTML (--minify).
+
+The templates and card fragments are indented for people reading the
+source; browsers collapse that whitespace anyway. minify_html():
+
+- collapses every run of whitespace in text to one space, and drops it
+  entirely next to block-level tags, where it is never rendered;
+- removes comments (except IE conditional comments), unless keep_comments;
+- unquotes attribute values that need no quotes (class=staff-card);
+- squeezes whitespace and comments out of inline <style> blocks.
+
+<script>, <pre> and <textarea> contents are left exactly as they are.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, Optional, Tuple
+
+TOKEN = re.compile(
+    r"""(?P<comment><!--.*?-->)"""
+    r"""|(?P<raw>(?P<open><(?P<raw_name>script|style|pre|textarea)\b(?:[^>"']|"[^"]*"|'[^']*')*>)(?P<body>.*?)(?P<close></(?P=raw_name)\s*>))"""
+    r"""|(?P<tag><[!/]?[a-zA-Z](?:[^>"']|"[^"]*"|'[^']*')*>)"""
+    r"""|(?P<text>[^<]+|<)""",
+    re.DOTALL | re.IGNORECASE,
+)
+TAG = re.compile(r"<(/?)([^\s/>]+)(.*?)(/?)>$", re.DOTALL)
+ATTRIBUTE = re.compile(r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?""")
+# Values that parse the same without quotes.
+UNQUOTED_VALUE = re.compile(r"[\w./:#%,;+?&@-]+")
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+WHITESPACE = re.compile(r"\s+")
+
+# Whitespace before or after these tags never renders, so it can go entirely.
+BLOCK_TAGS = {
+    "!doctype", "address", "article", "aside", "base", "blockquote", "body", "br", "dd", "details",
+    "dialog", "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2",
+    "h3", "h4", "h5", "h6", "head", "header", "hr", "html", "li", "link", "main", "meta", "nav",
+    "noscript", "ol", "option", "p", "script", "section", "style", "summary", "table", "tbody",
+    "td", "template", "tfoot", "th", "thead", "title", "tr", "ul",
+}
+
+
+def _minify_tag(tag: str) -> str:
+    match = TAG.match(tag)
+    if match is None:
+        return tag
+    closing, name, attributes, self_closing = match.groups()
+    parts = [f"<{closing}{name}"]
+    for attribute in ATTRIBUTE.finditer(attributes):
+        attr_name, double, single, bare = attribute.groups()
+        value = next((part for part in (double, single, bare) if part is not None), None)
+        if value is None:
+            parts.append(attr_name)
+        elif UNQUOTED_VALUE.fullmatch(value):
+            parts.append(f"{attr_name}={value}")
+        elif single is not None:
+            parts.append(f"{attr_name}='{value}'")
+        else:
+            parts.append(f'{attr_name}="{value}"')
+    # A space keeps "/" from being read as part of an unquoted value.
+    return " ".join(parts) + (" />" if self_closing else ">")
+
+
+def _minify_css(css: str) -> str:
+    css = WHITESPACE.sub(" ", CSS_COMMENT.sub("", css))
+    return CSS_PUNCTUATION.sub(r"\1", css).replace(";}", "}").strip()
+
+
+def _tag_name(tag: str) -> str:
+    return tag[1:].lstrip("/").split(None, 1)[0].rstrip("/>").lower()
+
+
+def minify_html(html: str, keep_comments: bool = False) -> str:
+    # (text, tag name or None for text) for each piece, so text can see its neighbours.
+    pieces: List[Tuple[str, Optional[str]]] = []
+    for match in TOKEN.finditer(html):
+        if match.group("comment"):
+            comment = match.group("comment")
+            if keep_comments or comment.startswith("<!--[if"):
+                pieces.append((comment, "!--"))
+        elif match.group("raw"):
+            name = match.group("raw_name").lower()
+            body = match.group("body")
+            if name == "style":
+                body = _minify_css(body)
+            pieces.append((_minify_tag(match.group("open")) + body + match.group("close"), name))
+        elif match.group("tag"):
+            tag = match.group("tag")
+            pieces.append((_minify_tag(tag), _tag_name(tag)))
+        else:
+            pieces.append((match.group("text"), None))
+
+    output: List[str] = []
+    for index, (text, name) in enumerate(pieces):
+        if name is not None:
+            output.append(text)
+            continue
+        text = WHITESPACE.sub(" ", text)
+        before = pieces[index - 1][1] if index else "html"
+        after = pieces[index + 1][1] if index + 1 < len(pieces) else "html"
+        if before in BLOCK_TAGS:
+            text = text.lstrip()
+        if after in BLOCK_TAGS:
+            text = text.rstrip()
+        output.append(text)
+    return "".join(output)
@@ -0,0 +1,394 @@
+"""Staff records and the JSON-backed directory that stores them."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .audit import AuditLog, audit_dir, record_diff
+from .config import DEFAULT_DATA_PATH, DEFAULT_DOCUMENT_DIR, DEFAULT_IMAGE_DIR, LOCK_TIMEOUT, PROJECT_ROOT
+from .fileio import atomic_copy, file_lock
+from .profiling import PROFILER
+from .storage import JsonDirectoryFile
+from .utils import ensure_directory, iso_now, slugify
+
+DEFAULT_IMAGE_SUBDIR = str(DEFAULT_IMAGE_DIR.relative_to(PROJECT_ROOT))
+DEFAULT_DOCUMENT_SUBDIR = str(DEFAULT_DOCUMENT_DIR.relative_to(PROJECT_ROOT))
+
+
+def copy_file_to_directory(source: Path, target_dir: Path, target_name: str) -> Path:
+    ensure_directory(target_dir)
+    target_path = target_dir / target_name
+    atomic_copy(source, target_path)
+    return target_path
+
+
+def store_image_file(directory: "StaffDirectory", source: Path, slug: str) -> str:
+    extension = source.suffix.lower() or ".jpg"
+    target_name = f"{slug}{extension}"
+    stored = copy_file_to_directory(source, directory.image_dir, target_name)
+    return str(stored.relative_to(directory.root))
+
+
+def store_document_file(
+    directory: "StaffDirectory", source: Path, slug: str, suffix: Optional[str] = None
+) -> str:
+    extension = source.suffix.lower() or ".pdf"
+    suffix_part = f"-{suffix}" if suffix else ""
+    target_name = f"{slug}{suffix_part}{extension}"
+    stored = copy_file_to_directory(source, directory.document_dir, target_name)
+    return str(stored.relative_to(directory.root))
+
+
+@dataclass
+class StaffMember:
+    id: str
+    name: str
+    title: str = ""
+    credentials: List[str] = field(default_factory=list)
+    specialties: List[str] = field(default_factory=list)
+    description: str = ""
+    experience_years: Optional[int] = None
+    locations: List[str] = field(default_factory=list)
+    languages: List[str] = field(default_factory=list)
+    education: str = ""
+    email: str = ""
+    phone: str = ""
+    linkedin: str = ""
+    image: str = ""
+    documents: List[Dict[str, str]] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    featured: bool = False
+    last_modified: str = field(default_factory=iso_now)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "title": self.title,
+            "credentials": self.credentials,
+            "specialties": self.specialties,
+            "description": self.description,
+            "experience_years": self.experience_years,
+            "locations": self.locations,
+            "languages": self.languages,
+            "education": self.education,
+            "email": self.email,
+            "phone": self.phone,
+            "linkedin": self.linkedin,
+            "image": self.image,
+            "documents": self.documents,
+            "tags": self.tags,
+            "featured": self.featured,
+            "last_modified": self.last_modified,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "StaffMember":
+        return cls(
+            id=data["id"] if "id" in data else slugify(str(data.get("name", "staff-member"))),
+            name=data.get("name", ""),
+            title=data.get("title", ""),
+            credentials=list(data.get("credentials", [])),
+            specialties=list(data.get("specialties", [])),
+            description=data.get("description", ""),
+            experience_years=data.get("experience_years"),
+            locations=list(data.get("locations", [])),
+            languages=list(data.get("languages", [])),
+            education=data.get("education", ""),
+            email=data.get("email", ""),
+            phone=data.get("phone", ""),
+            linkedin=data.get("linkedin", ""),
+            image=data.get("image", ""),
+            documents=list(data.get("documents", [])),
+            tags=list(data.get("tags", [])),
+            featured=bool(data.get("featured", False)),
+            last_modified=data["last_modified"] if "last_modified" in data else iso_now(),
+        )
+
+
+class StaffDirectory:
+    categories = ("medical", "support")
+
+    def __init__(
+        self,
+        data_path: Path = DEFAULT_DATA_PATH,
+        root: Path = PROJECT_ROOT,
+        lock_timeout: float = LOCK_TIMEOUT,
+        read_only: bool = False,
+        lazy: bool = False,
+        audit: bool = True,
+    ):
+        self.data_path = data_path
+        # meta.image_dir and meta.document_dir are relative to the site root.
+        self.root = root
+        self.lock_path = data_path.with_name(data_path.name + ".lock")
+        self.lock_timeout = lock_timeout
+        # read_only never creates, locks or writes anything; save() raises PermissionError.
+        self.read_only = read_only
+        # lazy reads only meta up front and each category the first time it is used.
+        self.lazy = lazy
+        self.store = JsonDirectoryFile(data_path)
+        # Edits are appended to data/audit/; front ends set audit.source to say who made them.
+        self.audit = AuditLog(audit_dir(data_path)) if audit and not read_only else None
+        self.data: Dict[str, object] = {}
+        # Hydrated, sorted members per category; dropped whenever the data is loaded or saved.
+        self._members: Dict[str, List[StaffMember]] = {}
+        # Records as last read from or written to disk (category -> id -> record), used to
+        # work out what this process changed when another one saved in the meantime.
+        # Records are always replaced, never edited in place, so identity marks a change.
+        self._base: Dict[str, Dict[str, Dict[str, object]]] = {}
+        self._base_meta: Dict[str, object] = {}
+        self.load()
+
+    @property
+    def version(self) -> int:
+        """meta.version: bumped by every save, so a mismatch means someone else saved."""
+        return int(self.data.get("meta", {}).get("version", 0))
+
+    def load(self) -> None:
+        self._members.clear()
+        if not self.store.exists():
+            self.data = self._normalize({})
+            if self.read_only:
+                self._snapshot()
+                return
+            ensure_directory(self.data_path.parent)
+            self.save()
+            return
+        if self.lazy:
+            with PROFILER.span("load"):
+                meta = self.store.read_meta()
+            self.data = {"meta": meta}
+            self._normalize(self.data, categories=False)
+        else:
+            self.data = self._read()
+        self._snapshot()
+
+    def _read(self) -> Dict[str, object]:
+        with PROFILER.span("load"):
+            data = self.store.read()
+        return self._normalize(data)
+
+    def _normalize(self, data: Dict[str, object], categories: bool = True) -> Dict[str, object]:
+        meta = data.setdefault("meta", {})
+        meta.setdefault("last_updated", iso_now())
+        meta.setdefault("image_dir", DEFAULT_IMAGE_SUBDIR)
+        meta.setdefault("document_dir", DEFAULT_DOCUMENT_SUBDIR)
+        if categories:
+            for category in self.categories:
+                data.setdefault(category, [])
+        return data
+
+    def _snapshot(self) -> None:
+        self._base = {
+            category: {entry.get("id"): entry for entry in self.data[category]}
+            for category in self.categories
+            if category in self.data
+        }
+        self._base_meta = dict(self.data["meta"])
+
+    def records(self, category: str) -> List[Dict[str, object]]:
+        """The raw records of one category, read from disk on first use in lazy mode."""
+        if category not in self.data:
+            with PROFILER.span("load"):
+                records = list(self.store.iter_records(category))
+            self.data[category] = records
+            self._base[category] = {entry.get("id"): entry for entry in records}
+        return self.data[category]
+
+    def count(self, category: str) -> int:
+        return len(self.records(category))
+
+    def save(self) -> None:
+        """Write the directory under the lock, merging in records other processes saved since load()."""
+        if self.read_only:
+            raise PermissionError(f"{self.data_path} was opened read-only")
+        self._members.clear()
+        with PROFILER.span("save"), file_lock(self.lock_path, self.lock_timeout):
+            # Reads never take the lock: writes are atomic, so a reader sees one version or the next.
+            # Only meta is decoded here; the whole file is re-read only when someone else saved.
+            disk_meta = self.store.read_meta() if self.store.exists() else None
+            disk_version = int((disk_meta or {}).get("version", 0))
+            if disk_meta is not None and disk_version != int(self._base_meta.get("version", 0)):
+                self._merge(self._read())
+            elif disk_meta is not None and self.lazy:
+                self._fill_unloaded(self._read())
+            self.data["meta"]["version"] = disk_version + 1
+            self.data["meta"]["last_updated"] = iso_now()
+            self.store.write(self.data, compact=self.compact)
+        self._snapshot()
+
+    def _fill_unloaded(self, disk: Dict[str, object]) -> None:
+        """Lazy mode: take the categories (and any other keys) this process never read from disk."""
+        for key, value in disk.items():
+            if key not in self.data:
+                self.data[key] = value
+        # Keep the usual key order: meta, the categories, then anything else.
+        order = ["meta", *self.categories]
+        self.data = {
+            **{key: self.data[key] for key in order if key in self.data},
+            **{key: value for key, value in self.data.items() if key not in order},
+        }
+
+    @property
+    def compact(self) -> bool:
+        """meta.json_format == "compact": write the file without indentation (smaller, faster)."""
+        return self.data.get("meta", {}).get("json_format") == "compact"
+
+    def _merge(self, disk: Dict[str, object]) -> None:
+        """Apply this process's record-level edits on top of the newer copy on disk.
+
+        Records only one side changed keep that side's version. When both sides
+        changed the same record, the newer last_modified wins (ties go to this
+        process). A record deleted here but edited elsewhere is kept.
+        """
+        # Categories never read in lazy mode cannot hold edits; the disk copy stands.
+        loaded = [category for category in self.categories if category in self.data]
+        ours = {
+            category: {entry.get("id"): entry for entry in self.data[category]}
+            for category in loaded
+        }
+        ours_anywhere = {member_id for records in ours.values() for member_id in records}
+        conflicts = 0
+        for category in loaded:
+            base = self._base.get(category, {})
+            merged = {entry.get("id"): entry for entry in disk.get(category, [])}
+            for member_id in base.keys() | ours[category].keys():
+                before, mine = base.get(member_id), ours[category].get(member_id)
+                if mine is before or mine == before:
+                    continue
+                theirs = merged.get(member_id)
+                changed_there = theirs != before
+                if mine is None:
+                    if changed_there and theirs is not None and member_id not in ours_anywhere:
+                        conflicts += 1
+                        continue
+                    merged.pop(member_id, None)
+                elif changed_there and theirs is not None:
+                    conflicts += 1
+                    if str(theirs.get("last_modified", "")) > str(mine.get("last_modified", "")):
+                        continue
+                    merged[member_id] = mine
+                else:
+                    merged[member_id] = mine
+            disk[category] = list(merged.values())
+        meta = disk["meta"]
+        for key, value in self.data["meta"].items():
+            if self._base_meta.get(key) != value:
+                meta[key] = value
+        self.data = disk
+        note = f"; {conflicts} record(s) edited on both sides, newest kept" if conflicts else ""
+        print(f"Merged with changes saved by another process{note}.")
+
+    @property
+    def image_dir(self) -> Path:
+        return self.root / self.data["meta"]["image_dir"]
+
+    @property
+    def document_dir(self) -> Path:
+        return self.root / self.data["meta"]["document_dir"]
+
+    def list_staff(self, category: str) -> List[StaffMember]:
+        """Members sorted by name. They are shared between calls: edit via find() and upsert()."""
+        entries = self._members.get(category)
+        if entries is None:
+            with PROFILER.span("hydrate"):
+                entries = [StaffMember.from_dict(item) for item in self.records(category)]
+                entries.sort(key=lambda member: member.name.lower())
+            self._members[category] = entries
+        return list(entries)
+
+    def find(self, category: str, slug: str) -> Optional[StaffMember]:
+        if category in self.data:
+            entries = self.data[category]
+            entry = next((entry for entry in entries if entry.get("id") == slug), None)
+        else:
+            # Not loaded yet (lazy mode): fetch the one record without keeping the category.
+            entry = self.store.find(category, slug)
+        return StaffMember.from_dict(entry) if entry is not None else None
+
+    def upsert(self, category: str, member: StaffMember) -> None:
+        bucket = self.records(category)
+        record = member.to_dict()
+        for index, entry in enumerate(bucket):
+            if entry.get("id") == member.id:
+                bucket[index] = record
+                self.save()
+                self._log_changes([(category, entry, record)])
+                return
+        bucket.append(record)
+        self.save()
+        self._log_changes([(category, None, record)])
+
+    def upsert_many(self, entries: List[Tuple[str, StaffMember]]) -> None:
+        """Insert or replace several members with a single save; moves members between categories."""
+        changes: List[Tuple[str, Optional[Dict[str, object]], Dict[str, object]]] = []
+        for category, member in entries:
+            record = member.to_dict()
+            before = None
+            for other in self.categories:
+                if other != category:
+                    kept = [entry for entry in self.records(other) if entry.get("id") != member.id]
+                    if len(kept) != len(self.data[other]):
+                        before = next(entry for entry in self.data[other] if entry.get("id") == member.id)
+                    self.data[other] = kept
+            bucket = self.records(category)
+            for index, entry in enumerate(bucket):
+                if entry.get("id") == member.id:
+                    before = entry
+                    bucket[index] = record
+                    break
+            else:
+                bucket.append(record)
+            changes.append((category, before, record))
+        self.save()
+        self._log_changes(changes)
+
+    def remove(self, category: str, slug: str) -> bool:
+        bucket = self.records(category)
+        for index, entry in enumerate(bucket):
+            if entry.get("id") == slug:
+                del bucket[index]
+                self.save()
+                self._log_changes([(category, entry, None)])
+                return True
+        return False
+
+    def _log_changes(
+        self, changes: List[Tuple[str, Optional[Dict[str, object]], Optional[Dict[str, object]]]]
+    ) -> None:
+        """Append one audit record per (category, record before, record after) that really changed.
+
+        Called after save(): an edit the merge dropped in favour of another
+        process's newer record is logged as a "conflict" (with the diff that
+        was not applied) rather than as if it had been written.
+        """
+        if self.audit is None:
+            return
+        written = {
+            (category, entry.get("id")): entry
+            for category in self.categories
+            for entry in self.data.get(category, [])
+        }
+        entries = []
+        for category, before, after in changes:
+            diff = record_diff(before, after)
+            if before is not None and after is not None and not diff:
+                continue
+            record = after or before
+            if written.get((category, record.get("id"))) != after:
+                action = "conflict"
+                attempted = "deletion of" if after is None else "edit to"
+                message = f"Discarded {attempted} staff member {record.get('name', '')}: another process saved a newer version"
+            elif after is None:
+                action, message = "remove", f"Deleted staff member {record.get('name', '')}"
+            elif before is None:
+                action, message = "add", f"Added staff member {record.get('name', '')}"
+            else:
+                action, message = "update", f"Saved staff member {record.get('name', '')}"
+            entries.append(
+                self.audit.entry(action, message, member=record.get("id"), category=category, diff=diff)
+            )
+        self.audit.append(entries)
@@ -0,0 +1,87 @@
+"""Timing spans behind --profile."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .fileio import atomic_write
+from .utils import print_rule
+
+
+class Profiler:
+    """Named timing spans for --profile; while disabled, span() hands back a shared no-op."""
+
+    _disabled = contextlib.nullcontext()
+
+    def __init__(self) -> None:
+        self.enabled = False
+        # (name, start offset, duration, self time) in seconds, in completion order.
+        self.records: List[Tuple[str, float, float, float]] = []
+        self._children: List[float] = []
+        self._origin = time.perf_counter()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.records.clear()
+        self._origin = time.perf_counter()
+
+    def span(self, name: str):
+        if not self.enabled:
+            return self._disabled
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str):
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            nested = self._children.pop()
+            if self._children:
+                self._children[-1] += duration
+            self.records.append((name, start - self._origin, duration, duration - nested))
+
+    def report(self) -> None:
+        """Print calls, total and self time per phase (self time excludes nested phases)."""
+        wall = time.perf_counter() - self._origin
+        phases: Dict[str, List[float]] = {}
+        for name, _start, duration, own in sorted(self.records, key=lambda record: record[1]):
+            totals = phases.setdefault(name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
+            totals[2] += own
+        print_rule()
+        print(f"{'Phase':<18}{'Calls':>7}{'Total ms':>11}{'Self ms':>11}{'Self %':>8}")
+        for name, (calls, total, own) in phases.items():
+            share = own / wall * 100 if wall else 0.0
+            print(f"{name:<18}{calls:>7}{total * 1000:>11.1f}{own * 1000:>11.1f}{share:>7.1f}%")
+        untracked = wall - sum(own for _name, _start, _duration, own in self.records)
+        print(f"{'(untracked)':<18}{'':>7}{'':>11}{untracked * 1000:>11.1f}")
+        print(f"{'Wall time':<18}{'':>7}{wall * 1000:>11.1f}")
+        print_rule()
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the spans in Chrome trace-event format (open in chrome://tracing or Perfetto)."""
+        events = [
+            {
+                "name": name,
+                "cat": "staff_page_manager",
+                "ph": "X",
+                "ts": round(start * 1_000_000, 1),
+                "dur": round(duration * 1_000_000, 1),
+                "pid": os.getpid(),
+                "tid": 0,
+            }
+            for name, start, duration, _own in self.records
+        ]
+        atomic_write(path, json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+
+PROFILER = Profiler()
@@ -0,0 +1,692 @@
+"""HTML rendering for our-staff.html and the generated pages under our-staff/ (listings and one page per member)."""
+
+from __future__ import annotations
+
+import os
+import re
+import textwrap
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .assets import load_manifest
+from .config import CARD_BIO_LIMIT, DEFAULT_DESCRIPTION, PLACEHOLDER_IMAGE, SEGMENT_FIELDS, Site
+from .models import StaffDirectory, StaffMember
+from .profiling import PROFILER
+from .utils import asset_url, format_list, shorten, slugify
+
+
+# Page templates are dedented once at import and shared by every renderer/site.
+# Fragments spliced in with _template_line() use the dedented indentation.
+HEAD_TEMPLATE = textwrap.dedent(
+    """\
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=0">
+        <title>{title}</title>
+        <meta name="description" content="{description}">
+        <meta name="theme-color" content="#1aa060">
+        <link rel="canonical" href="{canonical}">{extra_links}
+        <meta property="og:title" content="{title}">
+        <meta property="og:description" content="{description}">
+        <meta property="og:type" content="website">
+        <meta property="og:url" content="{canonical}">
+        <meta property="og:image" content="{site_url}/assets/images/dr-hamad-ahmad.jpg">
+        <meta name="twitter:card" content="summary_large_image">
+        <meta name="twitter:title" content="{title}">
+        <meta name="twitter:description" content="{description}">
+        <meta name="twitter:image" content="{site_url}/assets/images/dr-hamad-ahmad.jpg">
+        <link rel="icon" href="{prefix}assets/images/favicon.ico" type="image/x-icon">
+        <link rel="stylesheet" href="{prefix}assets/css/core/mobile-optimizations.css">
+        <link rel="stylesheet" href="{prefix}assets/css/components/compact-layout.css">
+        <link rel="stylesheet" href="{prefix}assets/css/components/advanced-effects.css">
+        <link rel="stylesheet" href="{prefix}assets/css/components/buttons/action-buttons.css">
+        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+        <link rel="stylesheet" href="{prefix}assets/css/core/custom-redesign.css">
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Montserrat:wght@400;500;600;700&display=swap" rel="stylesheet">
+        <link rel="stylesheet" href="{prefix}assets/css/header-system-complete.css">
+        <link rel="stylesheet" href="{prefix}assets/css/layout-fixes.css">
+        <style>
+            .staff-card .staff-image.image-zoom-container{{
+                display:flex;
+                justify-content:center;
+                align-items:center;
+            }}
+            .staff-card .staff-image.image-zoom-container img{{
+                margin:0 auto;
+            }}
+        </style>
+    </head>
+    """
+)
+
+BODY_TEMPLATE = textwrap.dedent(
+    """\
+    <body>
+        <div data-include="header"></div>
+        <main id="main-content">
+            <section class="page-header page-header-with-bg" style="background-image: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5)), url('assets/images/medical-office-doctors.jpg');">
+                <div class="container">
+                    <span class="page-badge">Our Team</span>
+                    <h1 class="gradient-text">Our Staff</h1>
+                    <p>Meet our team of dedicated healthcare professionals</p>
+                </div>
+                <div class="header-shape-divider">
+                    <svg data-name="Layer 1" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1200 120" preserveAspectRatio="none">
+                        <path d="M0,0V120H1200V0Z" class="shape-fill"></path>
+                    </svg>
+                </div>
+            </section>
+            <section class="section">
+                <div class="container">
+                    <div class="section-header">
+                        <span class="section-badge">Healthcare Experts</span>
+                        <h2 class="gradient-text">Medical Providers</h2>
+                        <p>Our experienced team of healthcare professionals</p>
+                    </div>
+                    <div class="staff-grid" role="list" aria-label="Medical providers"{medical_feed}>
+    {medical_cards}
+                    </div>{medical_nav}
+                    <div class="section-header">
+                        <span class="section-badge">Administrative Team</span>
+                        <h2 class="gradient-text">Support Staff</h2>
+                        <p>The team that keeps our practice running smoothly</p>
+                    </div>
+                    <div class="staff-grid support-staff-grid" role="list" aria-label="Support staff"{support_feed}>
+    {support_cards}
+                    </div>{support_nav}
+                </div>
+            </section>
+        </main>
+        <div data-include="footer"></div>
+    """
+)
+
+LISTING_BODY_TEMPLATE = textwrap.dedent(
+    """\
+    <body>
+        <div data-include="header"></div>
+        <main id="main-content">
+            <section class="page-header page-header-with-bg" style="background-image: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5)), url('{prefix}assets/images/medical-office-doctors.jpg');">
+                <div class="container">
+                    <span class="page-badge">{badge}</span>
+                    <h1 class="gradient-text">{heading}</h1>
+                    <p><a href="{prefix}{index_page}">View our full staff directory</a></p>
+                </div>
+            </section>
+            <section class="section">
+                <div class="container">
+                    <div class="{grid_class}" role="list" aria-label="{heading}">
+    {cards}
+                    </div>{nav_line}
+                </div>
+            </section>
+        </main>
+        <div data-include="footer"></div>
+    """
+)
+
+PROFILE_BODY_TEMPLATE = textwrap.dedent(
+    """\
+    <body>
+        <div data-include="header"></div>
+        <main id="main-content">
+            <section class="page-header page-header-with-bg" style="background-image: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5)), url('{prefix}assets/images/medical-office-doctors.jpg');">
+                <div class="container">
+                    <span class="page-badge">{badge}</span>
+                    <h1 class="gradient-text">{name}</h1>
+                    <p>{title}</p>
+                </div>
+            </section>
+            <section class="section">
+                <div class="container">
+    {profile}
+                    <p><a href="{prefix}{index_page}">Back to our full staff directory</a></p>
+                </div>
+            </section>
+        </main>
+        <div data-include="footer"></div>
+    """
+)
+
+FOOTER_TEMPLATE = textwrap.dedent(
+    """\
+        <script src="{prefix}assets/js/core/custom.js" defer></script>
+        <script src="{prefix}assets/js/core/main.js" defer></script>
+        <script src="{prefix}assets/js/mobile/mobile-enhancements.js" defer></script>
+        <script src="{prefix}assets/js/header-inline.js" defer></script>
+        <script src="{prefix}assets/js/footer-inline.js" defer></script>
+        <script src="{prefix}assets/js/core/header-system-new.js" defer></script>{extra_scripts}
+    </body>
+    </html>
+    """
+)
+
+
+WARNINGS_COMMENT = re.compile(r"\A<!-- Media warnings:\n(.*?)\n-->\n", re.DOTALL)
+
+
+def media_warnings(html: str) -> List[str]:
+    """The warnings listed in the comment HTMLRenderer puts at the top of our-staff.html."""
+    match = WARNINGS_COMMENT.match(html)
+    return [line[len("  - "):] for line in match.group(1).split("\n")] if match else []
+
+
+def paginate_members(members: List[StaffMember], page_size: int) -> List[List[StaffMember]]:
+    """Split members into pages of page_size, keeping every featured member on page one."""
+    featured = [member for member in members if member.featured]
+    others = [member for member in members if not member.featured]
+    first_count = max(page_size - len(featured), 0)
+    pages = [featured + others[:first_count]]
+    for start in range(first_count, len(others), page_size):
+        pages.append(others[start:start + page_size])
+    return pages
+
+
+class HTMLRenderer:
+    # category -> (section badge, section heading, grid classes)
+    category_sections = {
+        "medical": ("Healthcare Experts", "Medical Providers", "staff-grid"),
+        "support": ("Administrative Team", "Support Staff", "staff-grid support-staff-grid"),
+    }
+
+    def __init__(
+        self,
+        directory: StaffDirectory,
+        page_size: Optional[int] = None,
+        feed_chunk_size: Optional[int] = None,
+        site: Optional[Site] = None,
+        keep_card_cache: bool = False,
+    ):
+        self.directory = directory
+        self.site = site or Site(directory.root)
+        # When set, each category grid is split into pages of this many cards.
+        self.page_size = page_size
+        # When set, only the first feed chunk of each grid is rendered; staff-feed.js loads the rest.
+        self.feed_chunk_size = feed_chunk_size
+        # Card fragments keyed by (asset prefix, member id); reset at the start of each pass
+        # unless keep_card_cache is set, in which case callers use forget_cards() on edits.
+        self.keep_card_cache = keep_card_cache
+        self._card_cache: Dict[Tuple[str, str], str] = {}
+        # Fingerprinted asset paths from --fingerprint-assets, re-read when the manifest changes.
+        self._assets: Dict[str, str] = {}
+        self._assets_stamp: Optional[Tuple[int, int]] = None
+        self._head_template = HEAD_TEMPLATE
+        self._footer_template = FOOTER_TEMPLATE
+
+    def _refresh_assets(self) -> None:
+        try:
+            stat = self.site.asset_manifest.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stamp = None
+        if stamp == self._assets_stamp:
+            return
+        self._assets_stamp = stamp
+        self._assets = load_manifest(self.site) if stamp else {}
+        self._head_template = HEAD_TEMPLATE
+        self._footer_template = FOOTER_TEMPLATE
+        for original, hashed in self._assets.items():
+            # The closing quote keeps main.js from matching main.json and the like.
+            old, new = f'{{prefix}}{original}"', f'{{prefix}}{hashed}"'
+            self._head_template = self._head_template.replace(old, new)
+            self._footer_template = self._footer_template.replace(old, new)
+
+    def render(self) -> str:
+        with PROFILER.span("html assembly"):
+            if not self.keep_card_cache:
+                self._card_cache.clear()
+            self._refresh_assets()
+            medical = self.directory.list_staff("medical")
+            support = self.directory.list_staff("support")
+            return self._render_listing(medical, support)[self.site.output_page]
+
+    def render_site(self) -> Dict[Path, str]:
+        """Render our-staff.html and every paginated, location, specialty and member page in a single pass."""
+        with PROFILER.span("html assembly"):
+            if not self.keep_card_cache:
+                self._card_cache.clear()
+            self._refresh_assets()
+            medical = self.directory.list_staff("medical")
+            support = self.directory.list_staff("support")
+            pages = self._render_listing(medical, support)
+            pages.update(self.render_segments(medical + support))
+            pages.update(self.render_profiles("medical", medical))
+            pages.update(self.render_profiles("support", support))
+            return pages
+
+    def forget_cards(self, member_ids: Optional[Iterable[str]] = None) -> None:
+        """Drop cached cards for member_ids (all cards when None)."""
+        if member_ids is None:
+            self._card_cache.clear()
+            return
+        forgotten = set(member_ids)
+        for key in [key for key in self._card_cache if key[1] in forgotten]:
+            del self._card_cache[key]
+
+    def render_segments(self, members: List[StaffMember]) -> Dict[Path, str]:
+        pages: Dict[Path, str] = {}
+        for field_name, kind in SEGMENT_FIELDS.items():
+            groups: Dict[str, Tuple[str, List[StaffMember]]] = {}
+            for member in members:
+                for value in getattr(member, field_name):
+                    groups.setdefault(slugify(value), (value, []))[1].append(member)
+            for slug, (label, group) in sorted(groups.items()):
+                path = self.site.segment_dir / field_name / f"{slug}.html"
+                pages[path] = self._render_segment_page(kind, label, path, group)
+        return pages
+
+    def render_profiles(self, category: str, members: List[StaffMember]) -> Dict[Path, str]:
+        return {
+            self.site.profile_page(member.id): self._render_profile_page(category, member)
+            for member in members
+        }
+
+    def _render_listing(
+        self, medical: List[StaffMember], support: List[StaffMember]
+    ) -> Dict[Path, str]:
+        warnings = self._collect_media_warnings(medical + support)
+        if self.feed_chunk_size:
+            first_screen = self._render_main_page(
+                medical[: self.feed_chunk_size],
+                support[: self.feed_chunk_size],
+                warnings,
+                lazy=True,
+            )
+            return {self.site.output_page: first_screen}
+        if not self.page_size:
+            return {self.site.output_page: self._render_main_page(medical, support, warnings)}
+        paged = {
+            "medical": paginate_members(medical, self.page_size),
+            "support": paginate_members(support, self.page_size),
+        }
+        navs = {
+            category: self._pagination_nav(category, 1, len(chunks), "")
+            for category, chunks in paged.items()
+        }
+        pages = {
+            self.site.output_page: self._render_main_page(
+                paged["medical"][0], paged["support"][0], warnings, navs
+            )
+        }
+        for category, chunks in paged.items():
+            for number, chunk in enumerate(chunks[1:], start=2):
+                path = self._listing_path(category, number)
+                pages[path] = self._render_category_page(category, number, len(chunks), chunk)
+        return pages
+
+    def _render_main_page(
+        self,
+        medical: List[StaffMember],
+        support: List[StaffMember],
+        warnings: List[str],
+        navs: Optional[Dict[str, str]] = None,
+        lazy: bool = False,
+    ) -> str:
+        head = self._head_section()
+        body = self._body_section(medical, support, navs or {}, lazy)
+        scripts = ["assets/js/features/staff-feed.js"] if lazy else []
+        footer = self._footer_section(scripts=scripts)
+        warning_comment = ""
+        if warnings:
+            joined = "\n".join(f"  - {warning}" for warning in warnings)
+            warning_comment = f"<!-- Media warnings:\n{joined}\n-->\n"
+        return warning_comment + head + body + footer
+
+    def _render_category_page(
+        self, category: str, number: int, total: int, members: List[StaffMember]
+    ) -> str:
+        badge, heading, grid_class = self.category_sections[category]
+        path = self._listing_path(category, number)
+        relative = path.relative_to(self.site.root)
+        prefix = "../" * (len(relative.parts) - 1)
+        rel_links = [("prev", self._listing_href(category, number - 1, prefix))]
+        if number < total:
+            rel_links.append(("next", self._listing_href(category, number + 1, prefix)))
+        head = self._head_section(
+            title=f"{heading} (Page {number} of {total}) - People First Urgent Care",
+            canonical=f"{self.site.site_url}/{relative.as_posix()}",
+            prefix=prefix,
+            rel_links=rel_links,
+        )
+        nav = self._pagination_nav(category, number, total, prefix)
+        body = self._listing_body_section(badge, heading, grid_class, members, prefix, nav)
+        return head + body + self._footer_section(prefix)
+
+    def _render_segment_page(
+        self, kind: str, label: str, path: Path, members: List[StaffMember]
+    ) -> str:
+        relative = path.relative_to(self.site.root)
+        prefix = "../" * (len(relative.parts) - 1)
+        if kind == "Location":
+            heading = f"Our {label} Team"
+            description = f"Meet the People First Urgent Care staff serving our {label} location."
+        else:
+            heading = f"{label} Providers"
+            description = f"Meet the People First Urgent Care staff who specialize in {label}."
+        head = self._head_section(
+            title=f"{heading} - People First Urgent Care",
+            description=description,
+            canonical=f"{self.site.site_url}/{relative.as_posix()}",
+            prefix=prefix,
+        )
+        body = self._listing_body_section(kind, heading, "staff-grid", members, prefix)
+        return head + body + self._footer_section(prefix)
+
+    def _render_profile_page(self, category: str, member: StaffMember) -> str:
+        path = self.site.profile_page(member.id)
+        relative = path.relative_to(self.site.root)
+        prefix = "../" * (len(relative.parts) - 1)
+        title = f"{member.name} - {member.title}" if member.title else member.name
+        description = member.description or f"{member.title or 'Staff member'} at People First Urgent Care."
+        head = self._head_section(
+            title=f"{title} - People First Urgent Care",
+            description=shorten(description, CARD_BIO_LIMIT),
+            canonical=f"{self.site.site_url}/{relative.as_posix()}",
+            prefix=prefix,
+        )
+        body = PROFILE_BODY_TEMPLATE.format(
+            badge=self.category_sections[category][1],
+            name=member.name,
+            title=member.title,
+            profile=textwrap.indent(self._render_profile(member, prefix), " " * 16),
+            prefix=prefix,
+            index_page=self.site.output_page.name,
+        )
+        return head + body + self._footer_section(prefix)
+
+    def _render_profile(self, member: StaffMember, prefix: str) -> str:
+        parts = self._member_fragments(member, prefix)
+        bio_html = "".join(
+            f'<p class="staff-bio">{" ".join(paragraph.split())}</p>'
+            for paragraph in re.split(r"\n\s*\n", member.description)
+            if paragraph.strip()
+        )
+        return textwrap.dedent(
+            f"""\
+                    <article class="staff-card staff-profile" data-staff-id="{member.id}">
+                        <div class="staff-image">
+                            <img src="{parts['image_path']}" alt="{parts['alt_text']}">
+                            {parts['contact_html']}
+                        </div>
+                        <div class="staff-info">
+                            {parts['featured_html']}
+                            {parts['credential_html']}
+                            {parts['info_html']}
+                            {bio_html}
+                            {parts['specialty_html']}
+                            {parts['tag_html']}
+                            {parts['document_html']}
+                        </div>
+                    </article>
+            """
+        ).rstrip("\n")
+
+    def _listing_path(self, category: str, number: int) -> Path:
+        return self.site.segment_dir / category / f"page-{number}.html"
+
+    def _listing_href(self, category: str, number: int, prefix: str) -> str:
+        if number == 1:
+            return f"{prefix}{self.site.output_page.name}"
+        return prefix + self.site.relative(self._listing_path(category, number))
+
+    def _pagination_nav(self, category: str, number: int, total: int, prefix: str) -> str:
+        if total < 2:
+            return ""
+        heading = self.category_sections[category][1]
+        links = []
+        if number > 1:
+            href = self._listing_href(category, number - 1, prefix)
+            links.append(f'<a href="{href}" rel="prev" class="btn btn-secondary">Previous</a>')
+        links.append(f'<span class="pagination-status">Page {number} of {total}</span>')
+        if number < total:
+            href = self._listing_href(category, number + 1, prefix)
+            links.append(f'<a href="{href}" rel="next" class="btn btn-secondary">Next</a>')
+        return f'<nav class="pagination" aria-label="{heading} pages">{"".join(links)}</nav>'
+
+    def _head_section(
+        self,
+        title: str = "Our Staff - People First Urgent Care",
+        description: str = DEFAULT_DESCRIPTION,
+        canonical: Optional[str] = None,
+        prefix: str = "",
+        rel_links: Optional[List[Tuple[str, str]]] = None,
+    ) -> str:
+        extra_links = "".join(
+            self._template_line(f'<link rel="{rel}" href="{href}">', 4)
+            for rel, href in rel_links or []
+        )
+        return self._head_template.format(
+            title=title,
+            description=description,
+            canonical=canonical or f"{self.site.site_url}/{self.site.relative(self.site.output_page)}",
+            extra_links=extra_links,
+            site_url=self.site.site_url,
+            prefix=prefix,
+        )
+
+    def _body_section(
+        self,
+        medical: List[StaffMember],
+        support: List[StaffMember],
+        navs: Optional[Dict[str, str]] = None,
+        lazy: bool = False,
+    ) -> str:
+        navs = navs or {}
+        return BODY_TEMPLATE.format(
+            medical_cards=self._render_staff_cards(medical),
+            support_cards=self._render_staff_cards(support),
+            medical_nav=self._template_line(navs.get("medical", ""), 16),
+            support_nav=self._template_line(navs.get("support", ""), 16),
+            medical_feed=self._feed_attributes("medical") if lazy else "",
+            support_feed=self._feed_attributes("support") if lazy else "",
+        )
+
+    def _listing_body_section(
+        self,
+        badge: str,
+        heading: str,
+        grid_class: str,
+        members: List[StaffMember],
+        prefix: str,
+        nav: str = "",
+    ) -> str:
+        return LISTING_BODY_TEMPLATE.format(
+            badge=badge,
+            heading=heading,
+            grid_class=grid_class,
+            cards=self._render_staff_cards(members, prefix),
+            nav_line=self._template_line(nav, 16),
+            prefix=prefix,
+            index_page=self.site.output_page.name,
+        )
+
+    def _feed_attributes(self, category: str) -> str:
+        manifest = self.site.relative(self.site.feed_manifest)
+        return f' data-staff-feed="{category}" data-feed-manifest="{manifest}"'
+
+    @staticmethod
+    def _template_line(html: str, source_indent: int) -> str:
+        """Return html as an extra template line; source_indent matches the surrounding f-string."""
+        if not html:
+            return ""
+        return "\n" + " " * source_indent + html
+
+    def _footer_section(self, prefix: str = "", scripts: Optional[List[str]] = None) -> str:
+        extra_scripts = "".join(
+            self._template_line(f'<script src="{prefix}{self._assets.get(src, src)}" defer></script>', 4)
+            for src in scripts or []
+        )
+        return self._footer_template.format(prefix=prefix, extra_scripts=extra_scripts)
+
+    def _render_staff_cards(self, members: List[StaffMember], prefix: str = "") -> str:
+        if not members:
+            empty_html = textwrap.dedent(
+                """\
+                        <div class="empty-state" role="status" aria-live="polite">
+                            <p>No staff profiles are available in this section yet. Please check back soon.</p>
+                        </div>
+                """
+            )
+            return " " * 12 + empty_html
+        with PROFILER.span("card rendering"):
+            return " " * 12 + "\n".join(self._cached_staff_card(member, prefix) for member in members)
+
+    def _cached_staff_card(self, member: StaffMember, prefix: str) -> str:
+        key = (prefix, member.id)
+        card = self._card_cache.get(key)
+        if card is None:
+            card = self._card_cache[key] = self._render_staff_card(member, prefix)
+        return card
+
+    def _member_fragments(self, member: StaffMember, prefix: str) -> Dict[str, str]:
+        """The markup a staff card and a member page share, keyed by the placeholder it fills."""
+        image_path = asset_url(member.image or PLACEHOLDER_IMAGE, prefix)
+        alt_text = f"Portrait of {member.name}".strip()
+        credential_html = ""
+        if member.credentials:
+            items = "".join(
+                f'<span class="credential"><i class="fa-solid fa-certificate"></i> {cred}</span>'
+                for cred in member.credentials
+            )
+            credential_html = f'<div class="staff-credentials">{items}</div>'
+
+        specialty_html = ""
+        if member.specialties:
+            tags = "".join(
+                f'<span class="specialty-tag">{spec}</span>' for spec in member.specialties
+            )
+            specialty_html = f'<div class="staff-specialties" aria-label="Specialties">{tags}</div>'
+
+        tag_html = ""
+        if member.tags:
+            tags = "".join(f'<span class="staff-tag">{tag}</span>' for tag in member.tags)
+            tag_html = f'<div class="staff-tags" aria-label="Highlights">{tags}</div>'
+
+        contact_links = []
+        if member.linkedin:
+            contact_links.append(
+                f'<a href="{member.linkedin}" class="social-link hover-scale" aria-label="LinkedIn profile for {member.name}"><i class="fa-brands fa-linkedin-in"></i></a>'
+            )
+        if member.email:
+            contact_links.append(
+                f'<a href="mailto:{member.email}" class="social-link hover-scale" aria-label="Email {member.name}"><i class="fa-solid fa-envelope"></i></a>'
+            )
+        if member.phone:
+            tel_link = re.sub(r"[^\d+]", "", member.phone)
+            contact_links.append(
+                f'<a href="tel:{tel_link}" class="social-link hover-scale" aria-label="Call {member.name}"><i class="fa-solid fa-phone"></i></a>'
+            )
+        contact_html = ""
+        if contact_links:
+            contact_html = (
+                '<div class="staff-social" role="group" aria-label="Contact links">'
+                + "".join(contact_links)
+                + "</div>"
+            )
+
+        document_html = ""
+        if member.documents:
+            items = "".join(
+                f"<li><a href='{asset_url(doc['path'], prefix)}' aria-label='{member.name} - {doc['label']}' download><i class='fa-solid fa-file-arrow-down'></i> {doc['label']}</a></li>"
+                for doc in member.documents
+            )
+            document_html = (
+                '<div class="staff-documents"><p class="staff-documents-title">'
+                '<i class="fa-solid fa-file-lines"></i> Featured Documents</p>'
+                f"<ul>{items}</ul></div>"
+            )
+
+        info_lines: List[str] = []
+        if member.experience_years is not None:
+            info_lines.append(
+                f'<span class="experience-badge">{member.experience_years}+ years experience</span>'
+            )
+        if member.education:
+            info_lines.append(
+                f'<p class="staff-education"><i class="fa-solid fa-graduation-cap"></i> {member.education}</p>'
+            )
+        if member.locations:
+            info_lines.append(
+                f'<p class="staff-locations"><i class="fa-solid fa-location-dot"></i> {format_list(member.locations)}</p>'
+            )
+        if member.languages:
+            info_lines.append(
+                f'<p class="staff-languages"><i class="fa-solid fa-language"></i> {format_list(member.languages)}</p>'
+            )
+        info_html = "".join(info_lines)
+
+        featured_html = (
+            '<span class="staff-specialty-badge">Featured Provider</span>'
+            if member.featured
+            else ""
+        )
+
+        return {
+            "image_path": image_path,
+            "alt_text": alt_text,
+            "credential_html": credential_html,
+            "specialty_html": specialty_html,
+            "tag_html": tag_html,
+            "contact_html": contact_html,
+            "document_html": document_html,
+            "info_html": info_html,
+            "featured_html": featured_html,
+        }
+
+    def _render_staff_card(self, member: StaffMember, prefix: str = "") -> str:
+        parts = self._member_fragments(member, prefix)
+        # Cards carry an excerpt of long bios and no documents; both are on the member's page.
+        description = member.description.strip()
+        if len(description) > CARD_BIO_LIMIT:
+            description = shorten(description, CARD_BIO_LIMIT)
+        description = textwrap.fill(description, width=90)
+        description_html = (
+            f'<p class="staff-bio">{description}</p>' if description else ""
+        )
+        profile_href = prefix + self.site.relative(self.site.profile_page(member.id))
+        profile_html = (
+            f'<a href="{profile_href}" class="staff-profile-link" '
+            f'aria-label="Full profile for {member.name}">View full profile</a>'
+        )
+
+        card_html = textwrap.dedent(
+            f"""\
+                        <article class="staff-card hover-lift shadow-soft" role="listitem" data-staff-id="{member.id}">
+                            <div class="staff-image image-zoom-container">
+                                <img src="{parts['image_path']}" alt="{parts['alt_text']}" loading="lazy" class="image-zoom">
+                                {parts['contact_html']}
+                            </div>
+                            <div class="staff-info">
+                                {parts['featured_html']}
+                                <h3 class="staff-name">{member.name}</h3>
+                                <p class="staff-title"><i class="fa-solid fa-user-md"></i> {member.title}</p>
+                                {parts['credential_html']}
+                                {parts['info_html']}
+                                {description_html}
+                                {parts['specialty_html']}
+                                {parts['tag_html']}
+                                {profile_html}
+                            </div>
+                        </article>
+            """
+        ).rstrip("\n")
+
+        return card_html
+
+    def _collect_media_warnings(self, members: List[StaffMember]) -> List[str]:
+        warnings: List[str] = []
+        # Plain os.path calls: building a Path per file dominated this loop on large directories.
+        root = str(self.site.root)
+        with PROFILER.span("media checks"):
+            for member in members:
+                if member.image:
+                    if not os.path.exists(os.path.join(root, member.image)):
+                        warnings.append(f"Missing image for {member.name}: {member.image}")
+                for doc in member.documents:
+                    if doc.get("path") and not os.path.exists(os.path.join(root, doc["path"])):
+                        warnings.append(f"Missing document for {member.name}: {doc['path']}")
+        return warnings
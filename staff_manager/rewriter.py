@@ -0,0 +1,419 @@
+"""Streaming, selector-driven HTML rewriting for the scripts/ page transforms.
+
+A page is tokenized once by html.parser; every start tag is matched against
+the handlers' CSS-style selectors and the matching callbacks can edit that
+element:
+
+    class DropDuplicateStylesheets(Handler):
+        rules = {"link[rel~=stylesheet]": "link"}
+
+        def __init__(self):
+            self.seen = set()
+
+        def link(self, element):
+            if element.get("href") in self.seen:
+                element.remove()
+            self.seen.add(element.get("href"))
+
+    new_html = rewrite_file("services.html", [DropDuplicateStylesheets()])
+
+Selectors support tag, .class, #id and [attr], [attr=v], [attr~=v],
+[attr^=v], [attr$=v], [attr*=v] tests, joined by descendant (space) or
+child (>) combinators. Elements offer before()/prepend()/append()/after(),
+replace() and remove(); edits can be made at any time up to the end of the
+document (a handler's finish() runs once the whole page has been read), so
+"only if the page has no X anywhere" needs no second pass. Everything not
+edited is copied through byte for byte, and the work is linear in the size
+of the page: no regex ever spans more than one tag.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+READ_CHUNK = 1 << 16
+VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+)
+
+COMPOUND = re.compile(r"(?P<tag>\*|[a-zA-Z][\w-]*)?(?P<tests>(?:[.#][\w-]+|\[[^\]]*\])*)$")
+TEST = re.compile(
+    r"""([.#])([\w-]+)|\[\s*([\w:-]+)\s*(?:([~^$*]?=)\s*(?:"([^"]*)"|'([^']*)'|([^\]\s]*)))?\s*\]"""
+)
+COMBINATOR = re.compile(r"\s*>\s*|\s+")
+
+
+class _Compound:
+    """One simple selector such as nav.main-navigation or link[rel~=stylesheet]."""
+
+    def __init__(self, text: str):
+        match = COMPOUND.match(text)
+        if not text or match is None:
+            raise ValueError(f"unsupported selector {text!r}")
+        tag = match.group("tag")
+        self.tag = None if tag in (None, "*") else tag.lower()
+        # (attribute, operator, value); operator None only tests presence.
+        self.tests: List[Tuple[str, Optional[str], str]] = []
+        for test in TEST.finditer(match.group("tests")):
+            kind, name, attribute, operator, *values = test.groups()
+            if kind == ".":
+                self.tests.append(("class", "~=", name))
+            elif kind == "#":
+                self.tests.append(("id", "=", name))
+            else:
+                value = next((part for part in values if part is not None), "")
+                self.tests.append((attribute.lower(), operator, value))
+
+    def matches(self, element: "Element") -> bool:
+        if self.tag is not None and element.tag != self.tag:
+            return False
+        for attribute, operator, value in self.tests:
+            actual = element.attrs.get(attribute)
+            if actual is None:
+                return False
+            if operator == "=" and actual != value:
+                return False
+            if operator == "~=" and value not in actual.split():
+                return False
+            if operator == "^=" and not actual.startswith(value):
+                return False
+            if operator == "$=" and not actual.endswith(value):
+                return False
+            if operator == "*=" and value not in actual:
+                return False
+        return True
+
+
+class Selector:
+    def __init__(self, text: str):
+        self.text = text
+        tokens = COMBINATOR.split(text.strip())
+        combinators = [match.group().strip() or " " for match in COMBINATOR.finditer(text.strip())]
+        # (compound, how it relates to the compound on its left: " " or ">")
+        self.parts = [(_Compound(tokens[0]), None)]
+        self.parts += [(_Compound(token), combinator) for token, combinator in zip(tokens[1:], combinators)]
+
+    def key(self) -> Optional[Tuple[str, str]]:
+        """What an element must have to match: ("tag", name), ("class", name), ("id", value) or None."""
+        compound = self.parts[-1][0]
+        if compound.tag:
+            return ("tag", compound.tag)
+        for attribute, operator, value in compound.tests:
+            if attribute == "class" and operator == "~=":
+                return ("class", value)
+            if attribute == "id" and operator == "=":
+                return ("id", value)
+        return None
+
+    def matches(self, element: "Element") -> bool:
+        return self._matches(len(self.parts) - 1, element)
+
+    def _matches(self, index: int, element: Optional["Element"]) -> bool:
+        compound, combinator = self.parts[index]
+        if element is None or not compound.matches(element):
+            return False
+        if index == 0:
+            return True
+        if combinator == ">":
+            return self._matches(index - 1, element.parent)
+        ancestor = element.parent
+        while ancestor is not None:
+            if self._matches(index - 1, ancestor):
+                return True
+            ancestor = ancestor.parent
+        return False
+
+
+class Element:
+    """An element as its start tag is read; edits are applied when the document is finished."""
+
+    __slots__ = ("tag", "attrs", "parent", "line", "index", "children", "closed", "_marks", "_edits", "_replacement", "_edited")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["Element"], line: int, edited: List["Element"]):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.line = line
+        # Position among the parent's element children (0 = first).
+        self.index = parent.children if parent else 0
+        if parent:
+            parent.children += 1
+        self.children = 0
+        self.closed = False
+        # Output marks for the before, prepend, append and after positions.
+        self._marks = [0, 0, 0, 0]
+        self._edits: Optional[List[List[str]]] = None
+        self._replacement: Optional[str] = None
+        self._edited = edited
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self.attrs.get(name, default)
+
+    def has_class(self, name: str) -> bool:
+        return name in self.attrs.get("class", "").split()
+
+    def within(self, selector: Union[str, "Selector"]) -> bool:
+        """Whether an ancestor matches selector."""
+        selector = Selector(selector) if isinstance(selector, str) else selector
+        ancestor = self.parent
+        while ancestor is not None:
+            if selector.matches(ancestor):
+                return True
+            ancestor = ancestor.parent
+        return False
+
+    def _edit(self, position: int, html: str) -> None:
+        if self._edits is None:
+            self._edits = [[], [], [], []]
+            if self._replacement is None:
+                self._edited.append(self)
+        self._edits[position].append(html)
+
+    def before(self, html: str) -> None:
+        self._edit(_BEFORE, html)
+
+    def prepend(self, html: str) -> None:
+        """Insert html right after the start tag."""
+        self._edit(_PREPEND, html)
+
+    def append(self, html: str) -> None:
+        """Insert html right before the end tag."""
+        self._edit(_APPEND, html)
+
+    def after(self, html: str) -> None:
+        self._edit(_AFTER, html)
+
+    def replace(self, html: str) -> None:
+        """Replace the element, start tag to end tag, with html."""
+        if self._replacement is None and self._edits is None:
+            self._edited.append(self)
+        self._replacement = html
+
+    def remove(self) -> None:
+        self.replace("")
+
+    @property
+    def replaced(self) -> bool:
+        return self._replacement is not None
+
+
+class Handler:
+    """Base for rewrite handlers.
+
+    rules maps selectors to the names of methods called with each matching
+    Element, in document order. finish() runs once the page has been read.
+    After a rewrite, edits is the number of elements the handler edited.
+    """
+
+    rules: Dict[str, str] = {}
+    edits = 0
+
+    def finish(self) -> None:
+        pass
+
+
+_BEFORE, _PREPEND, _APPEND, _AFTER = range(4)
+
+
+class HTMLRewriter(HTMLParser):
+    """feed() the page in chunks of any size, then close() for the rewritten text."""
+
+    def __init__(self, handlers: Iterable[Handler]):
+        super().__init__(convert_charrefs=True)
+        self.handlers = list(handlers)
+        # Rules are filed under the tag, class or id their last compound
+        # requires, so each element is only tested against rules it may match.
+        self._rules: List[Tuple[Selector, Callable[[Element], None], Handler]] = []
+        self._by_key: Dict[Tuple[str, str], List[int]] = {}
+        self._anywhere: List[int] = []
+        for handler in self.handlers:
+            handler.edits = 0
+            for text, method in handler.rules.items():
+                selector = Selector(text)
+                key = selector.key()
+                (self._by_key.setdefault(key, []) if key else self._anywhere).append(len(self._rules))
+                self._rules.append((selector, getattr(handler, method), handler))
+        # Raw source pieces, copied through unless an edit says otherwise.
+        self._out: List[str] = []
+        # Output index of every edit position recorded, in document order;
+        # elements keep the numbers of theirs.
+        self._marks: List[int] = []
+        self._edited: List[Element] = []
+        self._open: List[Element] = []
+        self._open_tags: Dict[str, int] = {}
+        # Source text not yet copied to the output, starting at offset
+        # _source_start; the token being read starts at _cursor and is only
+        # complete once the next token starts.
+        self._source = ""
+        self._source_start = 0
+        self._cursor = 0
+        self._line_starts = [0]
+        self._pending: List[Tuple[Element, int]] = []
+        self.changed = False
+
+    def feed(self, data: str) -> None:
+        fed = self._source_start + len(self._source)
+        position = data.find("\n")
+        while position >= 0:
+            self._line_starts.append(fed + position + 1)
+            position = data.find("\n", position + 1)
+        self._source = self._source[self._cursor - self._source_start:] + data
+        self._source_start = self._cursor
+        super().feed(data)
+
+    def close(self) -> str:
+        super().close()
+        self._token()
+        self._out.append(self._source[self._cursor - self._source_start:])
+        self._source = ""
+        self._mark_pending()
+        while self._open:
+            element = self._open.pop()
+            self._mark(element, _APPEND)
+            self._mark(element, _AFTER)
+        for handler in self.handlers:
+            edited = len(self._edited)
+            handler.finish()
+            handler.edits += len(self._edited) - edited
+        return self._flatten()
+
+    # -- tokens --
+
+    def _mark(self, element: Element, position: int) -> None:
+        element._marks[position] = len(self._marks)
+        self._marks.append(len(self._out))
+
+    def _mark_pending(self) -> None:
+        for element, position in self._pending:
+            self._mark(element, position)
+        self._pending = []
+
+    def _token(self) -> None:
+        """A token starts at the parser's position: the previous one is complete."""
+        line, column = self.getpos()
+        start = self._line_starts[line - 1] + column
+        self._out.append(self._source[self._cursor - self._source_start: start - self._source_start])
+        self._cursor = start
+        if self._pending:
+            self._mark_pending()
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self._start(tag, attrs, tag in VOID_ELEMENTS)
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        self._start(tag, attrs, True)
+
+    def _start(self, tag: str, attrs, self_closing: bool) -> None:
+        self._token()
+        parent = self._open[-1] if self._open else None
+        values = {name: value or "" for name, value in reversed(attrs)}
+        element = Element(tag, values, parent, self.getpos()[0], self._edited)
+        self._mark(element, _BEFORE)
+        self._pending.append((element, _PREPEND))
+        if self_closing:
+            element.closed = True
+            self._pending += [(element, _APPEND), (element, _AFTER)]
+        else:
+            self._open.append(element)
+            self._open_tags[tag] = self._open_tags.get(tag, 0) + 1
+
+        candidates = self._anywhere + self._by_key.get(("tag", tag), [])
+        for name in values.get("class", "").split():
+            candidates += self._by_key.get(("class", name), [])
+        if "id" in values:
+            candidates += self._by_key.get(("id", values["id"]), [])
+        if not candidates or self._inside_replacement(parent):
+            return
+        for rule in sorted(set(candidates)):
+            if element._replacement is not None:
+                break
+            selector, callback, handler = self._rules[rule]
+            if selector.matches(element):
+                edited = len(self._edited)
+                callback(element)
+                handler.edits += len(self._edited) - edited
+
+    def handle_endtag(self, tag: str) -> None:
+        self._token()
+        if not self._open_tags.get(tag):
+            # A stray end tag: copied through as it is.
+            return
+        while True:
+            element = self._open.pop()
+            self._open_tags[element.tag] -= 1
+            element.closed = True
+            self._mark(element, _APPEND)
+            if element.tag == tag:
+                self._pending.append((element, _AFTER))
+                return
+            # Closed implicitly (e.g. an unclosed <p>) just before this end tag.
+            self._mark(element, _AFTER)
+
+    def handle_data(self, data: str) -> None:
+        self._token()
+
+    handle_comment = handle_decl = handle_pi = unknown_decl = handle_data
+
+    @staticmethod
+    def _inside_replacement(element: Optional[Element]) -> bool:
+        while element is not None:
+            if element._replacement is not None:
+                return True
+            element = element.parent
+        return False
+
+    # -- output --
+
+    def _flatten(self) -> str:
+        # (mark, position, element) for every edit, in document order
+        edits = []
+        for element in self._edited:
+            for position in range(4):
+                if element._replacement is not None and position in (_BEFORE, _AFTER):
+                    edits.append((element._marks[position], position, element))
+                elif element._edits and element._edits[position]:
+                    edits.append((element._marks[position], position, element))
+        edits.sort(key=lambda edit: edit[0])
+        self.changed = bool(edits)
+
+        output: List[str] = []
+        copied = 0
+        skipping: Optional[Element] = None
+        for mark, position, element in edits:
+            index = self._marks[mark]
+            if skipping is not None:
+                if element is not skipping or position != _AFTER:
+                    continue
+                skipping = None
+            else:
+                output += self._out[copied:index]
+            copied = index
+            pieces = element._edits[position] if element._edits else []
+            output += pieces
+            if position == _BEFORE and element._replacement is not None:
+                output.append(element._replacement)
+                skipping = element
+        output += self._out[copied:]
+        return "".join(output)
+
+
+def rewrite(html: str, handlers: Iterable[Handler]) -> str:
+    rewriter = HTMLRewriter(handlers)
+    rewriter.feed(html)
+    return rewriter.close()
+
+
+def rewrite_file(path: Union[str, os.PathLike], handlers: Iterable[Handler]) -> Optional[str]:
+    """The rewritten page, read a chunk at a time; None if no handler changed anything."""
+    rewriter = HTMLRewriter(handlers)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(READ_CHUNK), b""):
+            rewriter.feed(decoder.decode(chunk))
+    rewriter.feed(decoder.decode(b"", final=True))
+    html = rewriter.close()
+    return html if rewriter.changed else None
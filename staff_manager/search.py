@@ -0,0 +1,213 @@
+"""assets/search/index.json for the site search (assets/js/features/site-search.js).
+
+One entry per public page and per staff member, sorted by URL:
+
+    {"url": "about.html", "title": "...", "description": "...", "keywords": "..."}
+
+The pages are those scripts/transform-pages.json selects (which leaves out
+the admin, login and test pages) plus our-staff.html, never the design/
+mockups, and x/index.html only when there is no x.html. They are streamed
+through html.parser for their title, meta description (or first paragraph)
+and h1-h3 headings; pages marked noindex and fragments without a <title>
+are left out. data/search-cache.json remembers each page's entry with its
+SHA-256, so a rebuild re-parses only pages whose bytes changed (an
+unchanged mtime and size skip even the hashing). Staff entries come
+straight from StaffDirectory and point at each member's own page
+(our-staff/<id>.html) rather than being scraped from it.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from . import serialization
+from .assets import manifest_pages
+from .compress import precompress
+from .config import Site
+from .fileio import atomic_write
+from .models import StaffDirectory, StaffMember
+from .profiling import PROFILER
+from .utils import ensure_directory, shorten
+
+READ_CHUNK = 1 << 16
+DESCRIPTION_LIMIT = 200
+KEYWORDS_LIMIT = 300
+CACHE_VERSION = 1
+
+
+class PageExtractor(HTMLParser):
+    """Collects the searchable text of one page as it is fed."""
+
+    CAPTURED = {"title", "h1", "h2", "h3", "p"}
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.description = ""
+        self.paragraph = ""
+        self.headings: List[str] = []
+        self.noindex = False
+        self._capture: Optional[str] = None
+        self._buffer: List[str] = []
+        self._hidden = 0
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in ("script", "style", "template"):
+            self._hidden += 1
+        elif tag == "meta":
+            values = dict(attrs)
+            name = (values.get("name") or "").lower()
+            content = values.get("content") or ""
+            if name == "description" and not self.description:
+                self.description = " ".join(content.split())
+            elif name == "robots" and "noindex" in content.lower():
+                self.noindex = True
+        elif tag in self.CAPTURED and self._capture is None:
+            if (tag == "title" and self.title) or (tag == "p" and self.paragraph):
+                return
+            self._capture = tag
+            self._buffer = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in ("script", "style", "template"):
+            self._hidden = max(self._hidden - 1, 0)
+        elif tag == self._capture:
+            text = " ".join("".join(self._buffer).split())
+            self._capture = None
+            if not text:
+                return
+            if tag == "title":
+                self.title = text
+            elif tag == "p":
+                self.paragraph = text
+            else:
+                self.headings.append(text)
+
+    def handle_data(self, data: str) -> None:
+        if self._capture is not None and not self._hidden:
+            self._buffer.append(data)
+
+    def entry(self, url: str) -> Optional[Dict[str, str]]:
+        if self.noindex or not self.title:
+            return None
+        return {
+            "url": url,
+            "title": self.title,
+            "description": shorten(self.description or self.paragraph, DESCRIPTION_LIMIT),
+            "keywords": shorten(" ".join(dict.fromkeys(self.headings)), KEYWORDS_LIMIT),
+        }
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(READ_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_page(path: Path, url: str) -> Optional[Dict[str, str]]:
+    """Search entry for one page, parsed a chunk at a time (None if it should not be indexed)."""
+    parser = PageExtractor()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(READ_CHUNK), b""):
+            parser.feed(decoder.decode(chunk))
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.entry(url)
+
+
+def staff_entry(member: StaffMember, url: str) -> Dict[str, str]:
+    title = f"{member.name} - {member.title}" if member.title else member.name
+    description = member.description or f"{member.title or 'Staff member'} at People First Urgent Care."
+    keywords = member.credentials + member.specialties + member.locations + member.languages + member.tags
+    return {
+        "url": url,
+        "title": title,
+        "description": shorten(description, DESCRIPTION_LIMIT),
+        "keywords": shorten(" ".join(keywords), KEYWORDS_LIMIT),
+    }
+
+
+def search_pages(site: Site) -> List[Path]:
+    """The public pages to index: the page manifest plus the generated staff page, without mockups or duplicates."""
+    pages = set(manifest_pages(site))
+    if site.output_page.is_file():
+        pages.add(site.output_page)
+    return sorted(
+        path for path in pages
+        if not site.relative(path).startswith("design/")
+        and not (path.name == "index.html" and path.parent != site.root and path.parent.with_suffix(".html") in pages)
+    )
+
+
+def _load_cache(path: Path) -> Dict[str, Dict[str, object]]:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            cache = json.load(handle)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return cache.get("pages", {}) if cache.get("version") == CACHE_VERSION else {}
+
+
+def build_search_index(
+    directory: StaffDirectory, site: Optional[Site] = None, changed: Optional[Iterable[Path]] = None
+) -> int:
+    """Rewrite the search index if anything changed; returns the number of pages re-parsed.
+
+    changed limits the page scan to those files (e.g. what a daemon rebuild
+    just wrote); every other page keeps its cached entry. Without a cache,
+    or without changed, every page in search_pages() is checked.
+    """
+    site = site or Site(directory.root)
+    cached = _load_cache(site.search_cache)
+    if changed is not None and cached:
+        candidates = [path for path in changed if site.relative(path) in cached or path == site.output_page]
+        pages: Dict[str, Dict[str, object]] = dict(cached)
+    else:
+        candidates = search_pages(site)
+        pages = {}
+    parsed = 0
+    with PROFILER.span("search index"):
+        staff = [
+            staff_entry(member, site.relative(site.profile_page(member.id)))
+            for category in directory.categories
+            for member in directory.list_staff(category)
+        ]
+        # Member pages are indexed from their records (above), not parsed.
+        staff_urls = {entry["url"] for entry in staff}
+        for path in candidates:
+            url = site.relative(path)
+            if url in staff_urls:
+                continue
+            stat = path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            previous = cached.get(url)
+            if previous and previous["stamp"] == stamp:
+                pages[url] = previous
+                continue
+            digest = _hash_file(path)
+            if previous and previous["sha256"] == digest:
+                pages[url] = {**previous, "stamp": stamp}
+                continue
+            pages[url] = {"stamp": stamp, "sha256": digest, "entry": extract_page(path, url)}
+            parsed += 1
+
+        entries = [page["entry"] for page in pages.values() if page["entry"]] + staff
+        entries.sort(key=lambda entry: (entry["url"], entry["title"]))
+
+        payload = serialization.dumps(entries, compact=True)
+        if not site.search_index.exists() or site.search_index.read_bytes() != payload:
+            ensure_directory(site.search_index.parent)
+            atomic_write(site.search_index, payload)
+        if pages != cached:
+            ensure_directory(site.search_cache.parent)
+            atomic_write(site.search_cache, json.dumps({"version": CACHE_VERSION, "pages": pages}))
+    precompress([site.search_index], site)
+    return parsed
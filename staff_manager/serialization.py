@@ -0,0 +1,173 @@
+"""JSON encoding for the directory and generated feeds: orjson when installed, stdlib otherwise.
+
+Both backends produce the same bytes for the strings, integers and booleans
+the directory holds: pretty output matches json.dump(indent=2,
+ensure_ascii=False) and compact output matches separators=(",", ":"), so
+switching backend never rewrites unchanged files or renames feed chunks.
+
+iter_array() walks one top-level array without holding the rest of the
+file in memory (ijson when installed).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import json
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+BACKEND = "orjson" if orjson else "json"
+STREAM_BACKEND = "ijson" if ijson else "json"
+
+
+def dumps(obj: object, compact: bool = False) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=0 if compact else orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Decoding allocates one container per record and none of them can be garbage yet;
+    # letting the cyclic GC rescan them over and over made a 100k-member load 2-10x slower.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def loads(data: Union[bytes, str]) -> object:
+    with _gc_paused():
+        if orjson:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+def read(path: Path) -> object:
+    return loads(path.read_bytes())
+
+
+def is_compact(data: bytes) -> bool:
+    """Whether a file written by dumps() used compact mode (pretty files break after the opening bracket)."""
+    return len(data) > 1 and data[1:2] not in (b"\n", b"\r")
+
+
+class _Reader:
+    """Text buffer over a file handle for the stdlib streaming fallback."""
+
+    def __init__(self, handle, chunk_size: int):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        chunk = self.handle.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of file)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"expected one of {chars!r}, found {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> object:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Usually the value runs past the buffer; read more and retry.
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self.buffer) and not isinstance(value, (dict, list, str)) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self) -> Iterator[object]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def seek_key(self, key: str) -> bool:
+        """Move to the value of the top-level key, skipping the ones before it."""
+        self.expect("{")
+        if self.peek() == "}":
+            return False
+        while True:
+            name = self.value()
+            self.expect(":")
+            if name == key:
+                return True
+            if self.peek() == "[":
+                # Skip other arrays item by item so memory stays bounded by one record.
+                for _item in self.items():
+                    pass
+            else:
+                self.value()
+            if self.expect(",}") == "}":
+                return False
+
+
+def iter_array(path: Path, key: str, chunk_size: int = 1 << 16) -> Iterator[object]:
+    """Yield the items of the top-level array `key` one at a time (nothing if the key is missing)."""
+    if ijson:
+        with path.open("rb") as handle:
+            yield from ijson.items(handle, f"{key}.item", use_float=True)
+        return
+    with path.open("r", encoding="utf-8") as handle:
+        reader = _Reader(handle, chunk_size)
+        if reader.seek_key(key):
+            yield from reader.items()
+
+
+def read_key(path: Path, key: str) -> Optional[object]:
+    """Return one top-level value (such as "meta") without decoding the large arrays after it."""
+    if ijson:
+        with path.open("rb") as handle:
+            for value in ijson.items(handle, key, use_float=True):
+                return value
+        return None
+    with path.open("r", encoding="utf-8") as handle:
+        reader = _Reader(handle, 1 << 16)
+        return reader.value() if reader.seek_key(key) else None
@@ -0,0 +1,165 @@
+"""sitemap.xml: the hand-listed pages plus every page the build writes, each with a <lastmod>.
+
+A page's lastmod is the time its content hash last changed, remembered in
+data/sitemap-state.json, so crawlers only re-fetch pages that really
+changed. A page with no state yet (every page on the first build) starts
+from its last git commit date, or its mtime if it is untracked, has
+uncommitted changes or there is no git, rather than the build time.
+Callers may pass their own lastmod (e.g. a member's last_modified) for
+pages built from one record; one that does not parse falls back to the
+content-hash time. our-staff.html and the pages under our-staff/ belong
+to the build and are listed exactly as generated; every other <loc>
+already in sitemap.xml is kept, in order.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import hashlib
+import json
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote
+from xml.sax.saxutils import escape, unescape
+
+from .config import Site
+from .fileio import atomic_write
+from .utils import ensure_directory
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+LOC = re.compile(r"<loc>\s*([^<]+?)\s*</loc>")
+
+
+def page_url(site: Site, path: Path) -> str:
+    relative = site.relative(path)
+    if relative == "index.html" or relative.endswith("/index.html"):
+        relative = relative[: -len("index.html")]
+    return f"{site.site_url}/{quote(relative)}"
+
+
+def page_path(site: Site, url: str) -> Optional[Path]:
+    """The file behind a sitemap URL on this site (None for other hosts)."""
+    if not url.startswith(site.site_url):
+        return None
+    relative = unquote(url[len(site.site_url):].lstrip("/"))
+    if not relative or relative.endswith("/"):
+        relative += "index.html"
+    return site.root / relative
+
+
+def _owned(site: Site, path: Optional[Path]) -> bool:
+    return path is not None and (path == site.output_page or site.segment_dir in path.parents)
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(["git", "-C", str(root), "-c", "core.quotePath=false", *args], capture_output=True, text=True, check=True).stdout
+
+
+def commit_times(root: Path) -> Dict[str, str]:
+    """Last commit date of every unmodified file git tracks under root (relative path -> ISO time); {} outside git."""
+    try:
+        log = _git(root, "log", "--format=%x00%cI", "--name-only", "--relative", "--", ".")
+        modified = set(_git(root, "ls-files", "-z", "--modified").split("\0"))
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    times: Dict[str, str] = {}
+    for entry in log.split("\0")[1:]:
+        stamp, _, names = entry.partition("\n")
+        for name in names.splitlines():
+            if name and name not in modified:
+                times.setdefault(name, stamp)
+    return times
+
+
+def _first_seen(site: Site, path: Optional[Path], commits: Dict[str, str], now: str) -> str:
+    """Starting lastmod for a page the state file does not know yet."""
+    if path is None or not path.is_file():
+        return now
+    committed = commits.get(site.relative(path))
+    if committed:
+        return w3c_datetime(committed)
+    return _dt.datetime.fromtimestamp(path.stat().st_mtime).astimezone().isoformat(timespec="seconds")
+
+
+def w3c_datetime(value: str) -> str:
+    """An ISO timestamp with the timezone sitemaps require (naive times are local)."""
+    return _dt.datetime.fromisoformat(value).astimezone().isoformat(timespec="seconds")
+
+
+def write_sitemap(
+    pages: Dict[Path, str],
+    site: Optional[Site] = None,
+    lastmod: Optional[Dict[Path, str]] = None,
+) -> bool:
+    """Regenerate sitemap.xml for the generated pages; returns whether it changed."""
+    site = site or Site()
+    lastmod = lastmod or {}
+    try:
+        with site.sitemap_state.open("r", encoding="utf-8") as handle:
+            state: Dict[str, Dict[str, str]] = json.load(handle)
+    except FileNotFoundError:
+        state = {}
+    now = _dt.datetime.now().astimezone().isoformat(timespec="seconds")
+    seen: Dict[str, Dict[str, str]] = {}
+    commits: Optional[Dict[str, str]] = None
+
+    def changed_at(url: str, content: bytes) -> str:
+        nonlocal commits
+        digest = hashlib.sha256(content).hexdigest()
+        previous = state.get(url)
+        if previous and previous["sha256"] == digest:
+            seen[url] = previous
+        elif previous:
+            seen[url] = {"sha256": digest, "lastmod": now}
+        else:
+            if commits is None:
+                commits = commit_times(site.root)
+            seen[url] = {"sha256": digest, "lastmod": _first_seen(site, page_path(site, url), commits, now)}
+        return seen[url]["lastmod"]
+
+    generated: List[Tuple[str, Optional[str]]] = []
+    for path in sorted(pages, key=lambda path: (path != site.output_page, path)):
+        if path.suffix != ".html":
+            continue
+        url = page_url(site, path)
+        stamp = changed_at(url, pages[path].encode("utf-8"))
+        if path in lastmod:
+            try:
+                stamp = w3c_datetime(lastmod[path])
+            except (TypeError, ValueError):
+                # A malformed last_modified falls back to the content-hash lastmod.
+                print(f"Ignoring invalid lastmod {lastmod[path]!r} for {site.relative(path)}")
+        generated.append((url, stamp))
+
+    existing: List[str] = []
+    if site.sitemap.exists():
+        existing = [unescape(url) for url in LOC.findall(site.sitemap.read_text(encoding="utf-8"))]
+    entries: List[Tuple[str, Optional[str]]] = []
+    for url in existing:
+        path = page_path(site, url)
+        if _owned(site, path):
+            # The generated block goes where the first build-owned page used to be.
+            entries.extend(generated)
+            generated = []
+        elif path is not None and path.is_file():
+            entries.append((url, changed_at(url, path.read_bytes())))
+        else:
+            entries.append((url, None))
+    entries.extend(generated)
+
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<urlset xmlns="{SITEMAP_NS}">']
+    for url, modified in entries:
+        stamp = f"<lastmod>{modified}</lastmod>" if modified else ""
+        lines.append(f"  <url><loc>{escape(url)}</loc>{stamp}</url>")
+    lines.append("</urlset>")
+    text = "\n".join(lines) + "\n"
+
+    if seen != state:
+        ensure_directory(site.sitemap_state.parent)
+        atomic_write(site.sitemap_state, json.dumps(seen, indent=2, sort_keys=True) + "\n")
+    if site.sitemap.exists() and site.sitemap.read_text(encoding="utf-8") == text:
+        return False
+    atomic_write(site.sitemap, text)
+    return True
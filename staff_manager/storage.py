@@ -0,0 +1,45 @@
+"""Reading and writing data/staff_directory.json for StaffDirectory."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from . import serialization
+from .fileio import atomic_write
+
+
+class JsonDirectoryFile:
+    """One JSON document: {"meta": {...}, "medical": [...], "support": [...]}.
+
+    StaffDirectory goes through these methods rather than parsing the file
+    itself. read_meta(), iter_records() and find() only stream the part of
+    the file they need; a later format with an offset index (member id ->
+    byte range) can implement them as seeks, and its find() can fetch one
+    member without touching the rest.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def read(self) -> Dict[str, object]:
+        return serialization.read(self.path)
+
+    def read_meta(self) -> Dict[str, object]:
+        return serialization.read_key(self.path, "meta") or {}
+
+    def iter_records(self, category: str) -> Iterator[Dict[str, object]]:
+        return serialization.iter_array(self.path, category)
+
+    def find(self, category: str, member_id: str) -> Optional[Dict[str, object]]:
+        for record in self.iter_records(category):
+            if record.get("id") == member_id:
+                return record
+        return None
+
+    def write(self, data: Dict[str, object], compact: bool = False) -> None:
+        # The directory is the source of truth, so also fsync the rename itself.
+        atomic_write(self.path, serialization.dumps(data, compact=compact), sync_dir=True)
@@ -0,0 +1,70 @@
+"""Small text, path and validation helpers shared by the staff manager modules."""
+
+from __future__ import annotations
+
+import datetime as _dt
+import functools
+import re
+from pathlib import Path
+from typing import List
+
+
+@functools.lru_cache(maxsize=4096)
+def slugify(value: str) -> str:
+    value = value.strip().lower()
+    value = re.sub(r"[^a-z0-9\s-]", "", value)
+    value = re.sub(r"[\s_-]+", "-", value)
+    return value.strip("-") or "staff-member"
+
+
+def iso_now() -> str:
+    return _dt.datetime.now().replace(microsecond=0).isoformat()
+
+
+def ensure_directory(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def print_rule(char: str = "-") -> None:
+    print(char * 60)
+
+
+def format_list(values: List[str]) -> str:
+    return ", ".join(values)
+
+
+def shorten(text: str, limit: int) -> str:
+    """Collapse whitespace and cut text at a word boundary before limit characters, adding an ellipsis."""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0].rstrip(",.;:") + "…"
+
+
+def clean_list(text_value: str) -> List[str]:
+    return [part.strip() for part in text_value.split(",") if part.strip()]
+
+
+def normalize_phone(value: str) -> str:
+    digits = re.sub(r"[^\d]", "", value)
+    if len(digits) == 10:
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    return value.strip()
+
+
+def validate_email(email: str) -> bool:
+    if not email:
+        return True
+    return bool(re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", email))
+
+
+def validate_url(url: str) -> bool:
+    if not url:
+        return True
+    return bool(re.match(r"^https?://", url))
+
+
+def asset_url(path: str, prefix: str = "") -> str:
+    if not prefix or re.match(r"^(?:[a-z]+:|/)", path):
+        return path
+    return prefix + path
@@ -0,0 +1,237 @@
+"""--watch: rebuild on changes to the directory JSON, includes/ and media folders."""
+
+from __future__ import annotations
+
+import datetime as _dt
+import json
+import os
+import queue
+import select
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .build import generate_site
+from .config import Site
+from .models import StaffDirectory
+from .utils import iso_now, print_rule
+
+
+# (directory, file names to react to or None for any file) pairs watched by --watch.
+WatchTarget = Tuple[Path, Optional[frozenset]]
+
+
+def watch_targets(directory: StaffDirectory, site: Site) -> List[WatchTarget]:
+    return [
+        (directory.data_path.parent, frozenset({directory.data_path.name})),
+        (site.includes_dir, None),
+        (directory.image_dir, None),
+        (directory.document_dir, None),
+    ]
+
+
+class InotifyWatcher:
+    """Blocks on Linux inotify events for the watched directories (non-recursive)."""
+
+    # IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    MASK = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, targets: List[WatchTarget]):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.filters: Dict[int, Optional[frozenset]] = {}
+        for path, names in targets:
+            if not path.is_dir():
+                continue
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"cannot watch {path}")
+            self.filters[wd] = names
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        changed = False
+        offset = 0
+        while offset < len(buffer):
+            wd, _mask, _cookie, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self.EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            names = self.filters.get(wd)
+            if names is None or name in names:
+                changed = True
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback that compares (mtime, size) snapshots of the watched files."""
+
+    def __init__(self, targets: List[WatchTarget], interval: float = 1.0):
+        self.targets = targets
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        state: Dict[str, Tuple[int, int]] = {}
+        for path, names in self.targets:
+            if not path.is_dir():
+                continue
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if names is not None and entry.name not in names:
+                        continue
+                    if entry.is_file():
+                        info = entry.stat()
+                        state[entry.path] = (info.st_mtime_ns, info.st_size)
+        return state
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining <= 0:
+                return False
+            time.sleep(remaining)
+            current = self._scan()
+            if current != self.snapshot:
+                self.snapshot = current
+                return True
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(targets: List[WatchTarget]):
+    try:
+        return InotifyWatcher(targets)
+    except OSError as exc:
+        print(f"inotify unavailable ({exc}); falling back to polling.")
+        return PollingWatcher(targets)
+
+
+class StaffEventServer:
+    """Local Server-Sent Events endpoint that mirrors api/events.php's staff-updated events."""
+
+    def __init__(self, port: int, host: str = "127.0.0.1"):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        self.clients: List[queue.Queue] = []
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                events = server.subscribe()
+                try:
+                    self.wfile.write(b'event: ping\ndata: "connected"\n\n')
+                    self.wfile.flush()
+                    while True:
+                        try:
+                            message = events.get(timeout=15)
+                        except queue.Empty:
+                            message = ": keep-alive\n\n"
+                        self.wfile.write(message.encode("utf-8"))
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    server.unsubscribe(events)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+        host, port = self.httpd.server_address[:2]
+        print(f"Serving staff-updated events at http://{host}:{port}/events")
+
+    def subscribe(self) -> queue.Queue:
+        events: queue.Queue = queue.Queue()
+        with self.lock:
+            self.clients.append(events)
+        return events
+
+    def unsubscribe(self, events: queue.Queue) -> None:
+        with self.lock:
+            if events in self.clients:
+                self.clients.remove(events)
+
+    def publish(self, event: str, data: Dict[str, object]) -> None:
+        message = f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        with self.lock:
+            for events in self.clients:
+                events.put(message)
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def watch_and_regenerate(
+    directory: StaffDirectory,
+    debounce: float = 0.5,
+    sse_port: Optional[int] = None,
+    site: Optional[Site] = None,
+    **generate_options: object,
+) -> None:
+    """Regenerate whenever the directory JSON, includes/ or media folders change."""
+    site = site or Site(directory.root)
+    events = StaffEventServer(sse_port) if sse_port else None
+    if events:
+        events.start()
+    watcher = make_watcher(watch_targets(directory, site))
+    generate_site(directory, site=site, **generate_options)
+    print("Watching for changes (Ctrl+C to stop)...")
+    try:
+        while True:
+            if not watcher.wait(None):
+                continue
+            # Let a burst of writes (editor saves, bulk copies) settle before rebuilding.
+            while watcher.wait(debounce):
+                pass
+            print_rule()
+            print(f"[{_dt.datetime.now().strftime('%H:%M:%S')}] Change detected; regenerating.")
+            try:
+                directory.load()
+                generate_site(directory, site=site, **generate_options)
+            except (OSError, ValueError) as exc:
+                print(f"Regeneration failed: {exc}")
+                continue
+            if events:
+                count = sum(directory.count(category) for category in directory.categories)
+                events.publish("staff-updated", {"count": count, "ts": iso_now()})
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
+        if events:
+            events.close()
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+People First Urgent Care - Staff Directory Sync
+
+Run from the project root with:
+    python3 staff_sync.py --api https://example.com/p1st/api/staff.php
+    python3 staff_sync.py --file assets/data/staff-data.json --dry-run
+
+Keeps data/staff_directory.json (managed by staff_manager.StaffDirectory)
+and the PHP staff store (api/staff.php and its staff-data.json export) in step.
+Records are matched by id; when both sides differ, the newer of
+last_modified/updatedAt wins. Only changed records are pushed, in batches
+posted with "mode": "upsert" so api/staff.php leaves the other rows alone.
+
+data/sync-state.json remembers, per target, the ids both sides had after
+the last sync. A record missing on one side is new if that side never
+had it (copied across) and deleted if it did (deleted on the other side
+too), so removals propagate instead of being resurrected.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as _dt
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from staff_manager.config import DEFAULT_DATA_PATH, PLACEHOLDER_IMAGE, PROJECT_ROOT
+from staff_manager.fileio import atomic_open, atomic_write
+from staff_manager.models import StaffDirectory, StaffMember
+from staff_manager.utils import clean_list, ensure_directory, format_list, iso_now
+
+DEFAULT_EXPORT_PATH = PROJECT_ROOT / "assets" / "data" / "staff-data.json"
+DEFAULT_BATCH_SIZE = 50
+STATE_VERSION = 1
+
+# API fields compared when deciding whether two records actually differ.
+API_CONTENT_FIELDS = (
+    "name",
+    "title",
+    "type",
+    "specialty",
+    "credentials",
+    "bio",
+    "image",
+    "yearsExperience",
+    "email",
+    "phone",
+    "linkedinUrl",
+    "education",
+    "locations",
+    "languages",
+)
+
+
+class SyncError(RuntimeError):
+    pass
+
+
+def parse_timestamp(value: object) -> Optional[_dt.datetime]:
+    """Parse ISO 8601 from either store; naive local timestamps are taken as local time."""
+    if not value:
+        return None
+    text = str(value).strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    elif len(text) > 5 and text[-5] in "+-" and text[-4:].isdigit():
+        text = f"{text[:-2]}:{text[-2:]}"  # PHP DATE_ISO8601 offsets lack the colon
+    try:
+        parsed = _dt.datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+    return parsed.astimezone(_dt.timezone.utc)
+
+
+def to_api_record(member: StaffMember, category: str) -> Dict[str, object]:
+    return {
+        "id": member.id,
+        "name": member.name,
+        "title": member.title,
+        "type": category,
+        "specialty": format_list(member.specialties),
+        "credentials": format_list(member.credentials),
+        "bio": member.description,
+        "image": member.image,
+        "yearsExperience": member.experience_years,
+        "email": member.email,
+        "phone": member.phone,
+        "linkedinUrl": member.linkedin,
+        "education": member.education,
+        "locations": format_list(member.locations),
+        "languages": format_list(member.languages),
+        "updatedAt": member.last_modified,
+    }
+
+
+def from_api_record(
+    record: Dict[str, object], base: Optional[StaffMember] = None
+) -> Tuple[str, StaffMember]:
+    """Map an API record onto a StaffMember, keeping local-only fields from base."""
+    category = record.get("type") if record.get("type") in StaffDirectory.categories else "medical"
+    years = record.get("yearsExperience")
+    data = base.to_dict() if base else {}
+    data.update(
+        {
+            "id": str(record["id"]),
+            "name": record.get("name") or "",
+            "title": record.get("title") or "",
+            "credentials": clean_list(record.get("credentials") or ""),
+            "specialties": clean_list(record.get("specialty") or ""),
+            "description": record.get("bio") or "",
+            "experience_years": int(years) if str(years or "").isdigit() else None,
+            "locations": clean_list(record.get("locations") or ""),
+            "languages": clean_list(record.get("languages") or ""),
+            "education": record.get("education") or "",
+            "email": record.get("email") or "",
+            "phone": record.get("phone") or "",
+            "linkedin": record.get("linkedinUrl") or "",
+            "image": _local_image(record.get("image")),
+            "last_modified": _local_iso(record.get("updatedAt")) or iso_now(),
+        }
+    )
+    return category, StaffMember.from_dict(data)
+
+
+def _local_iso(value: object) -> Optional[str]:
+    parsed = parse_timestamp(value)
+    if parsed is None:
+        return None
+    return parsed.astimezone().replace(tzinfo=None, microsecond=0).isoformat()
+
+
+def _local_image(value: object) -> str:
+    # api/staff.php stores the placeholder when no image is set; locally that is "".
+    return "" if not value or value == PLACEHOLDER_IMAGE else str(value)
+
+
+def _content(record: Dict[str, object]) -> Tuple[str, ...]:
+    values = {key: "" if record.get(key) is None else str(record.get(key)) for key in API_CONTENT_FIELDS}
+    values["image"] = _local_image(values["image"])
+    return tuple(values[key] for key in API_CONTENT_FIELDS)
+
+
+@dataclass
+class SyncPlan:
+    push: List[Dict[str, object]] = field(default_factory=list)
+    pull: List[Tuple[str, StaffMember]] = field(default_factory=list)
+    # Ids deleted locally since the last sync, and (category, id) of those deleted remotely.
+    delete_remote: List[str] = field(default_factory=list)
+    delete_local: List[Tuple[str, str]] = field(default_factory=list)
+    unchanged: int = 0
+    local_ids: Set[str] = field(default_factory=set)
+    remote_ids: Set[str] = field(default_factory=set)
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.push)} to push, {len(self.pull)} to pull, "
+            f"{len(self.delete_remote)} to delete remotely, {len(self.delete_local)} to delete locally, "
+            f"{self.unchanged} unchanged"
+        )
+
+    def synced_ids(self, push: bool = True, pull: bool = True) -> Set[str]:
+        """The ids both sides hold once the plan is applied in the given directions (the next sync's base).
+
+        Deletions a skipped direction left pending stay in the base so a later sync still applies them.
+        """
+        local = set(self.local_ids)
+        remote = set(self.remote_ids)
+        pending: Set[str] = set()
+        if pull:
+            local |= {member.id for _category, member in self.pull}
+            local -= {slug for _category, slug in self.delete_local}
+        else:
+            pending |= {slug for _category, slug in self.delete_local}
+        if push:
+            remote |= {str(record["id"]) for record in self.push}
+            remote -= set(self.delete_remote)
+        else:
+            pending |= set(self.delete_remote)
+        return (local & remote) | pending
+
+
+def compute_plan(
+    directory: StaffDirectory,
+    remote_records: List[Dict[str, object]],
+    base: Optional[Set[str]] = None,
+) -> SyncPlan:
+    """Diff both sides by id and last_modified; base is the set of ids both held after the last sync."""
+    base = base or set()
+    local: Dict[str, Tuple[str, StaffMember]] = {}
+    for category in directory.categories:
+        for member in directory.list_staff(category):
+            local[member.id] = (category, member)
+    remote = {str(record["id"]): record for record in remote_records if record.get("id")}
+
+    plan = SyncPlan(local_ids=set(local), remote_ids=set(remote))
+    for slug, (category, member) in local.items():
+        outgoing = to_api_record(member, category)
+        record = remote.get(slug)
+        if record is None:
+            if slug in base:
+                plan.delete_local.append((category, slug))
+            else:
+                plan.push.append(outgoing)
+        elif _content(outgoing) == _content(record):
+            plan.unchanged += 1
+        else:
+            local_time = parse_timestamp(member.last_modified)
+            remote_time = parse_timestamp(record.get("updatedAt"))
+            if remote_time and (local_time is None or remote_time > local_time):
+                plan.pull.append(from_api_record(record, base=member))
+            else:
+                plan.push.append(outgoing)
+    for slug, record in remote.items():
+        if slug not in local:
+            if slug in base:
+                plan.delete_remote.append(slug)
+            else:
+                plan.pull.append(from_api_record(record))
+    return plan
+
+
+def apply_pull(directory: StaffDirectory, pulled: List[Tuple[str, StaffMember]]) -> None:
+    if not pulled:
+        return
+    directory.upsert_many(pulled)
+    print(f"Pulled {len(pulled)} record(s) into {directory.data_path}")
+
+
+def apply_removals(directory: StaffDirectory, removed: List[Tuple[str, str]]) -> None:
+    if not removed:
+        return
+    for category, slug in removed:
+        directory.remove(category, slug)
+    print(f"Removed {len(removed)} record(s) deleted remotely from {directory.data_path}")
+
+
+class SyncState:
+    """data/sync-state.json: per target, the ids both sides held after the last sync."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def _read(self) -> Dict[str, object]:
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                state = json.load(handle)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return state.get("targets", {}) if state.get("version") == STATE_VERSION else {}
+
+    def base(self, target: str) -> Set[str]:
+        return set(self._read().get(target, []))
+
+    def record(self, target: str, ids: Set[str]) -> None:
+        targets = self._read()
+        if targets.get(target) == sorted(ids):
+            return
+        targets[target] = sorted(ids)
+        ensure_directory(self.path.parent)
+        atomic_write(self.path, json.dumps({"version": STATE_VERSION, "targets": targets}, indent=2) + "\n")
+
+
+class StaffAPIClient:
+    """Talks to api/staff.php (GET returns every record, POST upserts or deletes a batch)."""
+
+    def __init__(self, url: str, token: Optional[str] = None, timeout: float = 10.0):
+        self.url = url
+        self.target = url
+        self.token = token
+        self.timeout = timeout
+
+    def fetch(self) -> List[Dict[str, object]]:
+        return list(self._request("GET").get("staff", []))
+
+    def push(self, records: List[Dict[str, object]], batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        for start in range(0, len(records), batch_size):
+            batch = records[start:start + batch_size]
+            response = self._request("POST", {"mode": "upsert", "staff": batch})
+            if not response.get("ok"):
+                raise SyncError(f"API rejected batch: {response.get('error', 'unknown error')}")
+            print(f"Pushed {len(batch)} record(s) to {self.url}")
+
+    def delete(self, ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            response = self._request("POST", {"mode": "upsert", "staff": [], "delete": batch})
+            if not response.get("ok"):
+                raise SyncError(f"API rejected delete: {response.get('error', 'unknown error')}")
+            print(f"Deleted {len(batch)} record(s) from {self.url}")
+
+    def _request(self, method: str, payload: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, method=method)
+        request.add_header("Accept", "application/json")
+        if body is not None:
+            request.add_header("Content-Type", "application/json")
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as exc:
+            raise SyncError(f"{method} {self.url} failed with HTTP {exc.code}") from exc
+        except (urllib.error.URLError, ValueError) as exc:
+            raise SyncError(f"{method} {self.url} failed: {exc}") from exc
+
+
+class StaffExportFile:
+    """The staff-data.json export used by the browser admin tools (same schema as the API)."""
+
+    def __init__(self, path: Path = DEFAULT_EXPORT_PATH):
+        self.path = path
+        self.target = str(Path(path).resolve())
+
+    def fetch(self) -> List[Dict[str, object]]:
+        if not self.path.exists():
+            return []
+        with self.path.open("r", encoding="utf-8") as handle:
+            return list(json.load(handle).get("staff", []))
+
+    def push(self, records: List[Dict[str, object]], batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        merged = {str(record["id"]): record for record in self.fetch()}
+        for record in records:
+            merged[str(record["id"])] = {**merged.get(str(record["id"]), {}), **record}
+        self._write(list(merged.values()))
+        print(f"Wrote {len(records)} record(s) to {self.path}")
+
+    def delete(self, ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        doomed = set(ids)
+        self._write([record for record in self.fetch() if str(record.get("id")) not in doomed])
+        print(f"Deleted {len(ids)} record(s) from {self.path}")
+
+    def _write(self, staff: List[Dict[str, object]]) -> None:
+        document = {
+            "metadata": {"version": "1.0", "lastUpdated": iso_now(), "totalStaff": len(staff)},
+            "staff": staff,
+        }
+        ensure_directory(self.path.parent)
+        with atomic_open(self.path) as handle:
+            json.dump(document, handle, indent=2, ensure_ascii=False)
+
+
+def sync(
+    directory: StaffDirectory,
+    remote: Union[StaffAPIClient, StaffExportFile],
+    push: bool = True,
+    pull: bool = True,
+    dry_run: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    state: Optional[SyncState] = None,
+) -> SyncPlan:
+    state = state or SyncState(directory.data_path.parent / "sync-state.json")
+    plan = compute_plan(directory, remote.fetch(), state.base(remote.target))
+    print(f"Sync plan: {plan.summary()}")
+    if dry_run:
+        for record in plan.push if push else []:
+            print(f"  push {record['id']}")
+        for slug in plan.delete_remote if push else []:
+            print(f"  delete remote {slug}")
+        for _category, member in plan.pull if pull else []:
+            print(f"  pull {member.id}")
+        for _category, slug in plan.delete_local if pull else []:
+            print(f"  delete local {slug}")
+        return plan
+    if push and plan.push:
+        remote.push(plan.push, batch_size=batch_size)
+    if push and plan.delete_remote:
+        remote.delete(plan.delete_remote, batch_size=batch_size)
+    if pull:
+        apply_pull(directory, plan.pull)
+        apply_removals(directory, plan.delete_local)
+    state.record(remote.target, plan.synced_ids(push=push, pull=pull))
+    return plan
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Sync data/staff_directory.json with the PHP staff API or its JSON export."
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--api", metavar="URL", help="URL of api/staff.php.")
+    target.add_argument(
+        "--file",
+        type=Path,
+        default=DEFAULT_EXPORT_PATH,
+        help="API-format JSON file to sync with (default: assets/data/staff-data.json).",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("STAFF_API_TOKEN"),
+        help="Bearer token for POST requests (default: $STAFF_API_TOKEN).",
+    )
+    direction = parser.add_mutually_exclusive_group()
+    direction.add_argument("--push-only", action="store_true", help="Only send local changes.")
+    direction.add_argument("--pull-only", action="store_true", help="Only apply remote changes.")
+    parser.add_argument("--dry-run", action="store_true", help="Show the plan without changing anything.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Records per POST.")
+    parser.add_argument("--data", type=Path, default=DEFAULT_DATA_PATH, help="Local staff_directory.json.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    directory = StaffDirectory(args.data)
+    directory.audit.source = "sync"
+    remote = StaffAPIClient(args.api, token=args.token) if args.api else StaffExportFile(args.file)
+    try:
+        sync(
+            directory,
+            remote,
+            push=not args.pull_only,
+            pull=not args.push_only,
+            dry_run=args.dry_run,
+            batch_size=args.batch_size,
+        )
+    except SyncError as exc:
+        print(f"Sync failed: {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())